@@ -10,21 +10,30 @@ from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, Supp
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    ATTR_DAYS,
     ATTR_DURATION_HOURS,
     ATTR_END_HOUR,
     ATTR_START_HOUR,
+    DEFAULT_BACKFILL_DAYS,
     DEFAULT_SERVICE_END_HOUR,
     DEFAULT_SERVICE_START_HOUR,
     DOMAIN,
+    MAX_BACKFILL_DAYS,
     MAX_SERVICE_DURATION_HOURS,
     MIN_SERVICE_DURATION_HOURS,
+    PUBLICATION_EXPECTED_HOUR,
+    SERVICE_BACKFILL_HISTORY,
     SERVICE_FIND_CHEAPEST_WINDOW,
 )
 from .coordinator import RCEPSEDataUpdateCoordinator
+from .price_cache import PriceCache
 from .price_calculator import PriceCalculator
+from .price_series import wall_clock_to_datetime
+from .shared_base import BUSINESS_DATE_KEYS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,6 +70,14 @@ SERVICE_FIND_CHEAPEST_WINDOW_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_BACKFILL_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DAYS, default=DEFAULT_BACKFILL_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_BACKFILL_DAYS)
+        ),
+    }
+)
+
 
 def _format_local_datetime(value: datetime) -> str:
     if value.tzinfo is None:
@@ -88,12 +105,11 @@ async def _async_handle_find_cheapest_window(
         raise ServiceValidationError("No loaded RCE Prices config entry")
 
     coordinator = next(iter(coordinators.values()))
-    raw_data = coordinator.data.get("raw_data") if coordinator.data else None
-    if not raw_data:
+    series = coordinator.data.get("series") if coordinator.data else None
+    if not series:
         raise ServiceValidationError("No RCE Prices data available")
 
-    today = dt_util.now().strftime("%Y-%m-%d")
-    today_data = [record for record in raw_data if record.get("business_date") == today]
+    today_data = series.for_date(BUSINESS_DATE_KEYS.today)
     if not today_data:
         raise ServiceValidationError("No RCE Prices data for today")
 
@@ -108,18 +124,12 @@ async def _async_handle_find_cheapest_window(
         raise ServiceValidationError("No matching price window found")
 
     hourly_prices: dict[datetime, list[float]] = {}
-    all_prices: list[float] = []
-
-    for record in window:
-        try:
-            period_end = datetime.strptime(record["dtime"], "%Y-%m-%d %H:%M:%S")
-            period_start = period_end - timedelta(minutes=15)
-            hour_start = period_start.replace(minute=0, second=0, microsecond=0)
+    all_prices: list[float] = window.prices.tolist()
 
-            hourly_prices.setdefault(hour_start, []).append(float(record["rce_pln"]))
-            all_prices.append(float(record["rce_pln"]))
-        except (ValueError, KeyError):
-            continue
+    for index, price in enumerate(all_prices):
+        period_start = wall_clock_to_datetime(window.start_ts[index])
+        hour_start = period_start.replace(minute=0, second=0, microsecond=0)
+        hourly_prices.setdefault(hour_start, []).append(price)
 
     if not hourly_prices or not all_prices:
         raise ServiceValidationError("No valid prices in selected window")
@@ -149,6 +159,16 @@ async def _async_handle_find_cheapest_window(
     }
 
 
+async def _async_handle_backfill_history(hass: HomeAssistant, call: ServiceCall) -> None:
+    coordinators = hass.data.get(DOMAIN, {})
+    if not coordinators:
+        raise ServiceValidationError("No loaded RCE Prices config entry")
+
+    coordinator = next(iter(coordinators.values()))
+    if not coordinator.async_start_backfill(call.data[ATTR_DAYS]):
+        raise ServiceValidationError("A history backfill is already running")
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     _LOGGER.debug("Setting up RCE Prices integration")
     hass.data.setdefault(DOMAIN, {})
@@ -166,6 +186,18 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             supports_response=SupportsResponse.ONLY,
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_BACKFILL_HISTORY):
+
+        async def async_handle_backfill_history(call: ServiceCall) -> None:
+            await _async_handle_backfill_history(hass, call)
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_BACKFILL_HISTORY,
+            async_handle_backfill_history,
+            schema=SERVICE_BACKFILL_HISTORY_SCHEMA,
+        )
+
     _LOGGER.debug("RCE Prices integration setup completed")
     return True
 
@@ -177,12 +209,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = RCEPSEDataUpdateCoordinator(hass, entry)
     _LOGGER.debug("Created data coordinator for RCE Prices")
     
-    await coordinator.async_config_entry_first_refresh()
-    _LOGGER.debug("Completed first data refresh for RCE Prices")
+    if await coordinator.async_load_cached_data():
+        _LOGGER.debug("Serving cached RCE Prices data, refreshing in the background")
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        _LOGGER.debug("Completed first data refresh for RCE Prices")
     
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
     entry.async_on_unload(entry.add_update_listener(async_update_options))
+    entry.async_on_unload(
+        async_track_time_change(
+            hass,
+            coordinator.async_handle_day_boundary,
+            hour=[0, PUBLICATION_EXPECTED_HOUR],
+            minute=0,
+            second=0,
+        )
+    )
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     _LOGGER.debug("RCE Prices config entry setup completed successfully")
@@ -206,4 +253,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     else:
         _LOGGER.warning("Failed to unload RCE Prices config entry: %s", entry.entry_id)
     
-    return unload_ok 
\ No newline at end of file
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    _LOGGER.debug("Removing cached RCE Prices data for config entry: %s", entry.entry_id)
+    await PriceCache(hass).async_remove()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date, timedelta
+import logging
+from typing import Any, Protocol
+
+import aiohttp
+import async_timeout
+from homeassistant.util.json import json_loads
+
+from .const import API_FIRST, API_SELECT, API_TIMEOUT, BACKFILL_CONCURRENCY, PSE_API_URL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PageSink(Protocol):
+    """Where backfilled pages go. ``write_page`` is blocking and runs in an executor."""
+
+    def write_page(self, records: list[dict[str, Any]]) -> int:
+        ...
+
+
+class BackfillError(Exception):
+    """A backfill page could not be downloaded."""
+
+
+@dataclass
+class BackfillResult:
+    dates: int = 0
+    pages: int = 0
+    records: int = 0
+    skipped: int = 0
+    failed: int = 0
+    # Oldest and newest business dates completed in this run.
+    oldest: str | None = None
+    newest: str | None = None
+
+
+class HistoryBackfill:
+    """Walk back over past business dates and hand each API page to a sink.
+
+    Every business date is requested on its own, ``$first`` records at a
+    time, following ``nextLink`` or paging with ``$skip`` until a short page
+    comes back. A fixed pool of ``concurrency`` workers takes dates one at a
+    time, each page has ``API_TIMEOUT`` seconds to arrive, and only one page
+    per worker is held in memory. Dates listed in ``completed`` are
+    skipped, and ``on_date_complete`` is awaited after each finished date so
+    callers can persist progress and resume an interrupted run.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        sink: PageSink,
+        *,
+        url: str = PSE_API_URL,
+        page_size: int = API_FIRST,
+        headers: Mapping[str, str] | None = None,
+        concurrency: int = BACKFILL_CONCURRENCY,
+        completed: Iterable[str] = (),
+        on_date_complete: Callable[[str], Awaitable[None]] | None = None,
+    ) -> None:
+        self._session = session
+        self._sink = sink
+        self._url = url
+        self._page_size = page_size
+        self._headers = headers or {"Accept": "application/json"}
+        self._concurrency = concurrency
+        self.completed: set[str] = set(completed)
+        self._on_date_complete = on_date_complete
+        self.result = BackfillResult()
+
+    @staticmethod
+    def business_dates(end: date, days: int) -> list[str]:
+        """Return ``days`` business dates walking back from ``end`` (inclusive)."""
+        return [(end - timedelta(days=offset)).isoformat() for offset in range(days)]
+
+    async def async_run(self, business_dates: Iterable[str]) -> BackfillResult:
+        pending = []
+        for business_date in business_dates:
+            if business_date in self.completed:
+                self.result.skipped += 1
+            else:
+                pending.append(business_date)
+
+        _LOGGER.debug("Backfilling %d business dates (%d already done)", len(pending), self.result.skipped)
+        # Workers share one iterator, so only ``concurrency`` coroutines exist
+        # however many dates are requested.
+        dates = iter(pending)
+
+        async def worker() -> None:
+            for business_date in dates:
+                await self._async_backfill_date(business_date)
+
+        await asyncio.gather(*(worker() for _ in range(min(self._concurrency, len(pending)))))
+        return self.result
+
+    async def _async_backfill_date(self, business_date: str) -> None:
+        try:
+            records = await self._async_fetch_date(business_date)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, OSError, BackfillError) as exception:
+            self.result.failed += 1
+            _LOGGER.warning("Failed to backfill PSE prices for %s: %s", business_date, exception)
+            return
+
+        self.completed.add(business_date)
+        self.result.dates += 1
+        if self.result.oldest is None or business_date < self.result.oldest:
+            self.result.oldest = business_date
+        if self.result.newest is None or business_date > self.result.newest:
+            self.result.newest = business_date
+        self.result.records += records
+        if self._on_date_complete is not None:
+            await self._on_date_complete(business_date)
+
+    async def _async_fetch_date(self, business_date: str) -> int:
+        loop = asyncio.get_running_loop()
+        url = self._url
+        params: dict[str, Any] | None = {
+            "$select": API_SELECT,
+            "$filter": f"business_date eq '{business_date}'",
+            "$first": self._page_size,
+        }
+        skip = 0
+        records = 0
+
+        while True:
+            async with async_timeout.timeout(API_TIMEOUT):
+                async with self._session.get(url, params=params, headers=self._headers) as response:
+                    if response.status != 200:
+                        raise BackfillError(f"API returned status {response.status}")
+                    data = json_loads(await response.read())
+
+            rows = data.get("value") if isinstance(data, dict) else None
+            if rows is None:
+                raise BackfillError("Invalid API response format")
+
+            self.result.pages += 1
+            if rows:
+                records += await loop.run_in_executor(None, self._sink.write_page, rows)
+
+            next_link = data.get("nextLink") or data.get("@odata.nextLink")
+            if next_link:
+                url, params = next_link, None
+            elif len(rows) >= self._page_size and params is not None:
+                skip += len(rows)
+                params = {**params, "$skip": skip}
+            else:
+                return records
@@ -29,5 +29,8 @@ async def async_setup_entry(
     ]
     
     _LOGGER.debug("Adding %d RCE Prices binary sensors to Home Assistant", len(binary_sensors))
+    coordinator.register_window_queries(
+        entity.window_query for entity in binary_sensors if entity.window_query is not None
+    )
     async_add_entities(binary_sensors)
     _LOGGER.debug("RCE Prices binary sensors setup completed successfully") 
\ No newline at end of file
@@ -4,32 +4,66 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.core import callback
 from homeassistant.util import dt as dt_util
 
-from ..const import DOMAIN, MANUFACTURER
-from ..price_calculator import PriceCalculator
-from ..shared_base import RCEBaseCommonEntity
+from ..shared_base import BUSINESS_DATE_KEYS, RCEBaseCommonEntity
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
 
 
 class RCEBaseBinarySensor(RCEBaseCommonEntity, BinarySensorEntity):
-    def __init__(self, coordinator, unique_id):
+    """Binary sensor that is on inside a precomputed ``[start, end)`` window.
+
+    The window is resolved once per data version and business date; state
+    changes are driven by point-in-time callbacks at its start and end, so
+    reading ``is_on`` is a plain comparison.
+    """
+
+    def __init__(self, coordinator: RCEPSEDataUpdateCoordinator, unique_id: str) -> None:
         super().__init__(coordinator, unique_id)
+        self._window_bounds: tuple[datetime, datetime] | None = None
+        self._window_bounds_key: tuple | None = None
+
+    def _compute_window_bounds(self) -> tuple[datetime, datetime] | None:
+        """Return the naive wall-clock ``(start, end)`` of today's window.
+
+        Subclasses override this; without a window the sensor stays off.
+        """
+        return None
 
-    def is_current_time_in_window(self, start_time_str: str, end_time_str: str, target_date: str = None) -> bool:
-        if not start_time_str or not end_time_str:
+    def get_window_bounds(self) -> tuple[datetime, datetime] | None:
+        data = self.coordinator.data
+        key = (data.get("data_version") if data else None, BUSINESS_DATE_KEYS.today)
+        if key != self._window_bounds_key:
+            bounds = self._compute_window_bounds()
+            if bounds is not None:
+                bounds = (
+                    bounds[0].replace(tzinfo=dt_util.DEFAULT_TIME_ZONE),
+                    bounds[1].replace(tzinfo=dt_util.DEFAULT_TIME_ZONE),
+                )
+            self._window_bounds = bounds
+            self._window_bounds_key = key
+        return self._window_bounds
+
+    @property
+    def is_on(self) -> bool:
+        bounds = self.get_window_bounds()
+        if bounds is None:
             return False
-        try:
-            if target_date is None:
-                target_date = dt_util.now().strftime("%Y-%m-%d")
-            start_datetime_str = f"{target_date} {start_time_str}:00"
-            end_datetime_str = f"{target_date} {end_time_str}:00"
-            start_datetime = datetime.strptime(start_datetime_str, "%Y-%m-%d %H:%M:%S")
-            end_datetime = datetime.strptime(end_datetime_str, "%Y-%m-%d %H:%M:%S")
-            current_time = dt_util.now().replace(tzinfo=None)
-            return start_datetime <= current_time <= end_datetime
-        except (ValueError, KeyError):
-            return False 
\ No newline at end of file
+        return bounds[0] <= dt_util.now() < bounds[1]
+
+    def _next_update_time(self, now: datetime) -> datetime:
+        bounds = self.get_window_bounds()
+        if bounds is not None:
+            for transition in bounds:
+                if transition > now:
+                    return transition
+        return dt_util.start_of_local_day(dt_util.as_local(now) + timedelta(days=1))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._window_bounds_key = None
+        self._schedule_next_update()
+        super()._handle_coordinator_update()
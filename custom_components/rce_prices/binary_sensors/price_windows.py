@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from .base import RCEBaseBinarySensor
-from ..const import CONF_MIN_PRICE_WINDOW_QUARTERS, DEFAULT_MIN_PRICE_WINDOW_QUARTERS
+from ..const import CONF_MIN_PRICE_WINDOW_QUARTERS, DATA_KEY_TODAY_STATS, DATA_KEY_TODAY_WINDOWS, DEFAULT_MIN_PRICE_WINDOW_QUARTERS
+from ..price_calculator import WindowQuery
+from ..shared_base import BUSINESS_DATE_KEYS
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
@@ -12,28 +14,26 @@ if TYPE_CHECKING:
 
 class RCETodayMaxPriceWindowBinarySensor(RCEBaseBinarySensor):
 
+    data_keys = frozenset({DATA_KEY_TODAY_STATS})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator) -> None:
         super().__init__(coordinator, "today_max_price_window_active")
         self._attr_icon = "mdi:clock-alert"
 
-    @property
-    def is_on(self) -> bool:
-        today_data = self.get_today_data()
-        if not today_data:
-            return False
-        
-        max_price_records = self.calculator.find_extreme_price_records(today_data, is_max=True)
-        if not max_price_records:
-            return False
-        
-        start_time = max_price_records[0]["period"].split(" - ")[0]
-        end_time = max_price_records[-1]["period"].split(" - ")[1]
-        
-        return self.is_current_time_in_window(start_time, end_time)
+    def _compute_window_bounds(self) -> tuple[datetime, datetime] | None:
+        statistics = self.get_today_statistics()
+        if not statistics:
+            return None
+
+        return self.calculator.get_window_boundaries(
+            statistics.records[statistics.max_first:statistics.max_last + 1]
+        )
 
 
 class RCETodayMinPriceWindowBinarySensor(RCEBaseBinarySensor):
 
+    data_keys = frozenset({DATA_KEY_TODAY_WINDOWS})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator) -> None:
         super().__init__(coordinator, "today_min_price_window_active")
         self._attr_icon = "mdi:clock-check"
@@ -51,27 +51,24 @@ class RCETodayMinPriceWindowBinarySensor(RCEBaseBinarySensor):
         return parsed_duration if parsed_duration > 0 else DEFAULT_MIN_PRICE_WINDOW_QUARTERS
 
     @property
-    def is_on(self) -> bool:
+    def window_query(self) -> WindowQuery:
+        return WindowQuery.min_price_window(self._get_min_price_window_duration_quarters())
+
+    def _compute_window_bounds(self) -> tuple[datetime, datetime] | None:
         today_data = self.get_today_data()
         if not today_data:
-            return False
-
-        duration_quarters = self._get_min_price_window_duration_quarters()
-        min_price_window = self.calculator.find_cheapest_window(today_data, duration_quarters)
+            return None
+
+        query = self.window_query
+        windows = self.get_shared_windows(BUSINESS_DATE_KEYS.today, query)
+        if windows is not None:
+            min_price_window = windows[0] if windows else None
+        else:
+            duration_quarters = query.duration_quarters
+            min_price_window = self.calculate(
+                BUSINESS_DATE_KEYS.today, self.calculator.find_cheapest_window, today_data, duration_quarters
+            )
         if not min_price_window:
-            return False
+            return None
 
-        try:
-            first_dtime = datetime.strptime(min_price_window[0]["dtime"], "%Y-%m-%d %H:%M:%S")
-            window_start = first_dtime - timedelta(minutes=15)
-
-            last_dtime = datetime.strptime(min_price_window[-1]["dtime"], "%Y-%m-%d %H:%M:%S")
-            window_end = last_dtime
-        except (ValueError, KeyError, IndexError):
-            return False
-
-        return self.is_current_time_in_window(
-            window_start.strftime("%H:%M"),
-            window_end.strftime("%H:%M"),
-            window_start.strftime("%Y-%m-%d"),
-        )
\ No newline at end of file
+        return self.calculator.get_window_boundaries(min_price_window)
@@ -8,8 +8,37 @@ SENSOR_PREFIX: Final[str] = "RCE Prices"
 MANUFACTURER: Final[str] = "plebann"
 PSE_API_URL: Final[str] = "https://api.raporty.pse.pl/api/rce-pln"
 API_UPDATE_INTERVAL: Final[timedelta] = timedelta(minutes=30)
+PUBLICATION_EXPECTED_HOUR: Final[int] = 14
+FETCH_MISSING_TODAY_INTERVAL: Final[timedelta] = timedelta(minutes=5)
+# (offset from the expected publication time, poll interval from then on)
+FETCH_PUBLICATION_LADDER: Final[tuple[tuple[timedelta, timedelta], ...]] = (
+    (timedelta(minutes=-30), timedelta(minutes=10)),
+    (timedelta(0), timedelta(minutes=2)),
+    (timedelta(minutes=30), timedelta(minutes=5)),
+    (timedelta(hours=2), timedelta(minutes=15)),
+    (timedelta(hours=4), API_UPDATE_INTERVAL),
+)
+FETCH_SCHEDULE_TOLERANCE: Final[timedelta] = timedelta(seconds=5)
+FETCH_MIN_SPACING: Final[timedelta] = timedelta(seconds=10)
+
+RETRY_BASE_DELAY: Final[timedelta] = timedelta(seconds=30)
+RETRY_MAX_DELAY: Final[timedelta] = timedelta(minutes=15)
+BREAKER_FAILURE_THRESHOLD: Final[int] = 5
+BREAKER_OPEN_DURATION: Final[timedelta] = timedelta(minutes=30)
 API_SELECT: Final[str] = "dtime,period,rce_pln,business_date,publication_ts"
 API_FIRST: Final[int] = 200
+API_PROBE_SELECT: Final[str] = "business_date,publication_ts"
+API_PROBE_FIRST: Final[int] = 4
+API_TIMEOUT: Final[int] = 30
+CALCULATION_CACHE_SIZE: Final[int] = 256
+PRICE_CACHE_STORAGE_KEY: Final[str] = "rce_prices.price_cache"
+PRICE_CACHE_STORAGE_VERSION: Final[int] = 1
+BACKFILL_STORAGE_KEY: Final[str] = "rce_prices.backfill"
+BACKFILL_STORAGE_VERSION: Final[int] = 1
+BACKFILL_CONCURRENCY: Final[int] = 3
+BACKFILL_SAVE_DELAY: Final[int] = 10
+PRICE_ARCHIVE_DIRECTORY: Final[str] = "rce_prices_archive"
+STATISTICS_IMPORT_BATCH_HOURS: Final[int] = 1000
 
 TAX_RATE: Final[float] = 0.23
 
@@ -26,8 +55,13 @@ MORNING_BEST_WINDOW_END_HOUR: Final[int] = 10
 EVENING_BEST_WINDOW_START_HOUR: Final[int] = 16
 EVENING_BEST_WINDOW_END_HOUR: Final[int] = 22
 BEST_WINDOW_DURATION_HOURS: Final[int] = 1
+BEST_WINDOW_RANKS: Final[int] = 2
+
+PRICE_ATTRIBUTE_KEYS: Final[tuple[str, ...]] = ("dtime", "period", "rce_pln", "business_date")
 
 SERVICE_FIND_CHEAPEST_WINDOW: Final[str] = "find_cheapest_window"
+SERVICE_BACKFILL_HISTORY: Final[str] = "backfill_history"
+ATTR_DAYS: Final[str] = "days"
 ATTR_DURATION_HOURS: Final[str] = "duration_hours"
 ATTR_START_HOUR: Final[str] = "start_hour"
 ATTR_END_HOUR: Final[str] = "end_hour"
@@ -35,4 +69,23 @@ ATTR_END_HOUR: Final[str] = "end_hour"
 DEFAULT_SERVICE_START_HOUR: Final[int] = 8
 DEFAULT_SERVICE_END_HOUR: Final[int] = 16
 MIN_SERVICE_DURATION_HOURS: Final[int] = 1
-MAX_SERVICE_DURATION_HOURS: Final[int] = 8
\ No newline at end of file
+MAX_SERVICE_DURATION_HOURS: Final[int] = 8
+DEFAULT_BACKFILL_DAYS: Final[int] = 30
+MAX_BACKFILL_DAYS: Final[int] = 3650
+
+DATA_KEY_TODAY_PRICES: Final[str] = "today.prices"
+DATA_KEY_TODAY_STATS: Final[str] = "today.stats"
+DATA_KEY_TODAY_WINDOWS: Final[str] = "today.windows"
+DATA_KEY_TOMORROW_PRICES: Final[str] = "tomorrow.prices"
+DATA_KEY_TOMORROW_STATS: Final[str] = "tomorrow.stats"
+DATA_KEY_TOMORROW_WINDOWS: Final[str] = "tomorrow.windows"
+DATA_KEY_CURRENT_QUARTER: Final[str] = "current_quarter"
+TOMORROW_DATA_KEYS: Final[frozenset[str]] = frozenset(
+    {DATA_KEY_TOMORROW_PRICES, DATA_KEY_TOMORROW_STATS, DATA_KEY_TOMORROW_WINDOWS}
+)
+ALL_DATA_KEYS: Final[frozenset[str]] = frozenset(
+    {DATA_KEY_TODAY_PRICES, DATA_KEY_TODAY_STATS, DATA_KEY_TODAY_WINDOWS, DATA_KEY_CURRENT_QUARTER}
+) | TOMORROW_DATA_KEYS
+# Per-day fetch/publication times and the stale flag; not part of
+# ALL_DATA_KEYS because only the entities that report freshness read it.
+DATA_KEY_FRESHNESS: Final[str] = "freshness"
@@ -1,21 +1,155 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import time
 from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any
+from collections.abc import Collection, Iterable
+from datetime import date, datetime, timedelta
+from typing import Any, NamedTuple
 
 import aiohttp
 import async_timeout
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
-from .const import API_FIRST, API_SELECT, API_UPDATE_INTERVAL, DOMAIN, PSE_API_URL, CONF_USE_HOURLY_PRICES, DEFAULT_USE_HOURLY_PRICES
+from .backfill import BackfillResult, HistoryBackfill
+from .calculation_cache import CalculationCache
+from .connection_stats import ConnectionStats
+from .const import ALL_DATA_KEYS, DATA_KEY_CURRENT_QUARTER, DATA_KEY_FRESHNESS, DATA_KEY_TODAY_PRICES, DATA_KEY_TODAY_STATS, DATA_KEY_TODAY_WINDOWS, DATA_KEY_TOMORROW_PRICES, DATA_KEY_TOMORROW_STATS, DATA_KEY_TOMORROW_WINDOWS, TOMORROW_DATA_KEYS, API_FIRST, API_PROBE_FIRST, API_PROBE_SELECT, API_SELECT, API_TIMEOUT, API_UPDATE_INTERVAL, BACKFILL_SAVE_DELAY, BACKFILL_STORAGE_KEY, BACKFILL_STORAGE_VERSION, CALCULATION_CACHE_SIZE, FETCH_MIN_SPACING, FETCH_SCHEDULE_TOLERANCE, DOMAIN, PSE_API_URL, CONF_USE_HOURLY_PRICES, DEFAULT_USE_HOURLY_PRICES, PRICE_ARCHIVE_DIRECTORY
+from .day_statistics import DayStatistics
+from .fetch_scheduler import FetchScheduler
+from .price_archive import PriceArchive
+from .price_cache import PriceCache
+from .price_calculator import WindowQuery
+from .price_series import QUARTER_SECONDS, PriceSeries
+from .retry_policy import RetryPolicy
+from .shared_base import BUSINESS_DATE_KEYS
+from .statistics_importer import PriceStatisticsImporter
+from .window_results import WindowResults
 
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    import brotli  # noqa: F401
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+else:
+    _ACCEPT_ENCODING = "gzip, br"
+
+API_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+}
+
+QUARTER = timedelta(seconds=QUARTER_SECONDS)
+QUARTERS_PER_DAY = 96
+
+
+def _record_key(record: dict[str, Any]) -> tuple[str, str, str]:
+    return record.get("business_date") or "", record.get("dtime") or "", record.get("period") or ""
+
+
+def _expected_quarters(business_date: str) -> int:
+    """Return how many quarters the local day ``business_date`` has (92, 96 or 100)."""
+    day = dt_util.parse_date(business_date)
+    if day is None:
+        return QUARTERS_PER_DAY
+    start = dt_util.start_of_local_day(day)
+    end = dt_util.start_of_local_day(day + timedelta(days=1))
+    return round((dt_util.as_utc(end) - dt_util.as_utc(start)) / QUARTER)
+
+
+def _data_freshness(data: dict[str, Any]) -> tuple[str, str]:
+    """Return the latest business date and its publication time held in ``data``."""
+    series = data.get("series")
+    if not series:
+        return "", ""
+    latest_date = series.business_dates[-1]
+    publication_ts = max(
+        (record.get("publication_ts") or "" for record in series.for_date(latest_date)),
+        default="",
+    )
+    return latest_date, publication_ts
+
+
+class DayFreshness(NamedTuple):
+    """When a business date's held prices were downloaded and published by PSE."""
+
+    fetched_at: str
+    published_at: str | None
+
+    def as_dict(self) -> dict[str, str | None]:
+        return self._asdict()
+
+
+def _day_freshness(
+    series: PriceSeries, fetched_at: str, previous: dict[str, Any] | None
+) -> dict[str, DayFreshness]:
+    """Return per-date freshness, keeping the fetch time of dates PSE has not republished."""
+    held = previous.get("freshness", {}) if previous else {}
+    freshness = {}
+    for business_date in series.business_dates:
+        published_at = max(
+            (record.get("publication_ts") or "" for record in series.for_date(business_date)),
+            default="",
+        ) or None
+        held_day = held.get(business_date)
+        if held_day is not None and held_day.published_at == published_at:
+            freshness[business_date] = held_day
+        else:
+            freshness[business_date] = DayFreshness(fetched_at, published_at)
+    return freshness
+
+
+def _series_fingerprint(series: PriceSeries | None) -> bytes:
+    """Digest of a normalized series: business dates, period ends, prices and publication times."""
+    digest = hashlib.blake2b(digest_size=16)
+    if series:
+        digest.update("\0".join(series.business_dates).encode())
+        digest.update(series.end_ts)
+        digest.update(series.prices)
+        digest.update("\0".join(record.get("publication_ts") or "" for record in series).encode())
+    return digest.digest()
+
+
+def _data_fingerprint(data: dict[str, Any]) -> bytes:
+    return _series_fingerprint(data.get("series"))
+
+
+def _changed_data_keys(previous: dict[str, Any] | None, data: dict[str, Any]) -> frozenset[str] | None:
+    """Return the derived data keys that differ between two published updates.
+
+    ``None`` means everything may have changed. Statistics are compared by
+    value, so a revision that leaves them intact only wakes price and window
+    consumers.
+    """
+    if not previous or not previous.get("series") or not data.get("series"):
+        return None
+
+    changed: set[str] = set()
+    for business_date, keys in (
+        (BUSINESS_DATE_KEYS.today, (DATA_KEY_TODAY_PRICES, DATA_KEY_TODAY_WINDOWS, DATA_KEY_TODAY_STATS)),
+        (BUSINESS_DATE_KEYS.tomorrow, (DATA_KEY_TOMORROW_PRICES, DATA_KEY_TOMORROW_WINDOWS, DATA_KEY_TOMORROW_STATS)),
+    ):
+        if _series_fingerprint(previous["series"].for_date(business_date)) == _series_fingerprint(
+            data["series"].for_date(business_date)
+        ):
+            continue
+        prices_key, windows_key, stats_key = keys
+        changed.update((prices_key, windows_key))
+        if previous.get("statistics", {}).get(business_date) != data.get("statistics", {}).get(business_date):
+            changed.add(stats_key)
+
+    if DATA_KEY_TODAY_PRICES in changed:
+        changed.add(DATA_KEY_CURRENT_QUARTER)
+    return frozenset(changed)
+
 
 class RCEPSEDataUpdateCoordinator(DataUpdateCoordinator):
 
@@ -25,10 +159,26 @@ class RCEPSEDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=API_UPDATE_INTERVAL,
+            always_update=False,
         )
         self.session = None
+        self.connection_stats = ConnectionStats()
         self._last_api_fetch = None
         self.config_entry = config_entry
+        self.window_queries: set[WindowQuery] = set()
+        self.data_version = 0
+        self.calculation_cache = CalculationCache(CALCULATION_CACHE_SIZE)
+        self.price_cache = PriceCache(hass)
+        self.fetch_scheduler = FetchScheduler()
+        self.retry_policy = RetryPolicy()
+        self._api_records: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._data_fingerprint: bytes | None = None
+        self._changed_keys: frozenset[str] | None = None
+        self._fetch_in_flight: asyncio.Future[dict[str, Any]] | None = None
+        self._last_request_started: float | None = None
+        self._backfill_task: asyncio.Task[BackfillResult] | None = None
+        self.price_archive = PriceArchive(hass.config.path(STORAGE_DIR, PRICE_ARCHIVE_DIRECTORY))
+        self.statistics_importer = PriceStatisticsImporter(hass, self.price_archive)
 
     def _get_config_value(self, key: str, default: any) -> any:
         if not self.config_entry:
@@ -41,63 +191,350 @@ class RCEPSEDataUpdateCoordinator(DataUpdateCoordinator):
         
         return default
 
+    def register_window_queries(self, queries: Iterable[WindowQuery]) -> None:
+        self.window_queries.update(queries)
+        _LOGGER.debug("Registered %d window queries", len(self.window_queries))
+
+    async def async_load_cached_data(self) -> bool:
+        """Serve the persisted prices until the first API fetch completes.
+
+        Returns False when there is no cache or it does not cover today, in
+        which case the caller has to wait for a regular refresh.
+        """
+        cached = await self.price_cache.async_load()
+        if not cached:
+            _LOGGER.debug("No cached PSE prices found")
+            return False
+
+        records, fetched_at = cached
+        data = self._build_data(records, fetched_at or dt_util.now())
+        today = dt_util.now().strftime("%Y-%m-%d")
+        if today not in data["series"].business_dates:
+            _LOGGER.debug("Cached PSE prices do not cover %s, ignoring them", today)
+            return False
+
+        self._api_records = {_record_key(record): record for record in records}
+        self._data_fingerprint = _data_fingerprint(data)
+        self.data = self._publish(data)
+        _LOGGER.debug("Loaded %d cached PSE records fetched at %s", len(data["series"]), fetched_at)
+        return True
+
+    def _publish(self, data: dict[str, Any]) -> dict[str, Any]:
+        changed = _changed_data_keys(self.data, data)
+        if changed is not None and self.data.get("stale_since"):
+            changed |= {DATA_KEY_FRESHNESS}
+        self._changed_keys = changed
+        self.data_version += 1
+        data["data_version"] = self.data_version
+        data["calculation_cache"] = self.calculation_cache
+        return data
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose data keys changed in this update.
+
+        Entities pass the data keys they read as their listener context.
+        Listeners without a key set, and every listener on updates that are
+        not a data publish (e.g. a failed refresh), are always notified.
+        """
+        changed = self._changed_keys
+        self._changed_keys = None
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or not isinstance(context, frozenset) or not changed.isdisjoint(context):
+                update_callback()
+
+    def _serve_stale(self, now: datetime) -> dict[str, Any]:
+        """Keep serving the held data after a failed revalidation, flagged as stale.
+
+        The copy keeps the data version, so entities reuse their cached
+        calculations and only the ones reporting freshness are woken.
+        """
+        if self.data.get("stale_since"):
+            return self.data
+        self._changed_keys = frozenset({DATA_KEY_FRESHNESS})
+        return {**self.data, "stale_since": now.isoformat()}
+
+    def _serve_revalidated(self) -> dict[str, Any]:
+        """Keep serving the held data after the API confirmed it is current."""
+        if not self.data.get("stale_since"):
+            return self.data
+        self._changed_keys = frozenset({DATA_KEY_FRESHNESS})
+        return {**self.data, "stale_since": None}
+
+    @callback
+    def async_handle_day_boundary(self, now: datetime) -> None:
+        """Wake entities whose inputs move with the clock rather than with new data.
+
+        At local midnight the today and tomorrow business dates roll over,
+        and at the publication hour tomorrow's prices become visible.
+        """
+        if not self.data:
+            return
+        self._changed_keys = (
+            ALL_DATA_KEYS if dt_util.as_local(now).hour == 0 else TOMORROW_DATA_KEYS
+        )
+        self.async_update_listeners()
+
     async def _async_update_data(self) -> dict[str, Any]:
         now = dt_util.now()
-        
+
+        try:
+            data = await self._async_fetch_prices(now)
+        except UpdateFailed:
+            self._schedule_next_fetch(now, ())
+            raise
+
+        series = data.get("series")
+        self._schedule_next_fetch(now, series.business_dates if series else ())
+        return data
+
+    def _schedule_next_fetch(self, now: datetime, business_dates: Collection[str]) -> None:
+        interval = self.fetch_scheduler.next_interval(now, business_dates)
+        retry = self.retry_policy.retry_interval(now)
+        if retry is not None:
+            # While the API is failing, retry on the backoff schedule (or
+            # wait out an open breaker) instead of the publication ladder.
+            interval = retry
+        self.update_interval = interval
+        _LOGGER.debug("Next PSE API fetch in %s", self.update_interval)
+
+    async def _async_fetch_prices(self, now: datetime) -> dict[str, Any]:
+        """Single-flight entry to the PSE API: concurrent callers share one fetch.
+
+        The first caller runs the fetch and every caller arriving while it is
+        in flight awaits the same future instead of opening its own request.
+        """
+        if self._fetch_in_flight is not None:
+            self.fetch_scheduler.record_coalesced_fetch()
+            _LOGGER.debug("Joining the PSE API fetch already in flight")
+            return await asyncio.shield(self._fetch_in_flight)
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._fetch_in_flight = future
+        try:
+            data = await self._async_fetch_prices_once(now)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exception:
+            future.set_exception(exception)
+            # Mark the exception retrieved when nobody joined this fetch.
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            self._fetch_in_flight = None
+
+    async def _async_fetch_prices_once(self, now: datetime) -> dict[str, Any]:
         if (self._last_api_fetch and 
             self.data and 
-            now - self._last_api_fetch < API_UPDATE_INTERVAL):
+            now - self._last_api_fetch < self.update_interval - FETCH_SCHEDULE_TOLERANCE):
             time_since_fetch = now - self._last_api_fetch
             _LOGGER.debug("Using cached data - last API fetch was %s ago (max interval: %s)", 
-                         time_since_fetch, API_UPDATE_INTERVAL)
+                         time_since_fetch, self.update_interval)
             return self.data
         
         _LOGGER.debug("Fetching fresh data from PSE API - last fetch: %s", self._last_api_fetch)
         
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        if not self.retry_policy.allow_request(now):
+            _LOGGER.debug("PSE API circuit breaker open until %s", self.retry_policy.next_retry)
+            if self.data:
+                return self._serve_stale(now)
+            raise UpdateFailed(f"PSE API circuit breaker open until {self.retry_policy.next_retry}")
+
+        self._ensure_session()
+
+        if self._last_request_started is not None:
+            wait = FETCH_MIN_SPACING.total_seconds() - (time.monotonic() - self._last_request_started)
+            if wait > 0:
+                if self.data:
+                    _LOGGER.debug("Last PSE API call started %.1fs ago, keeping held data", 
+                                  FETCH_MIN_SPACING.total_seconds() - wait)
+                    return self.data
+                await asyncio.sleep(wait)
+        self._last_request_started = time.monotonic()
             
+        self.fetch_scheduler.record_request()
         try:
-            async with async_timeout.timeout(30):
+            async with async_timeout.timeout(API_TIMEOUT):
                 data = await self._fetch_data()
                 self._last_api_fetch = now
-                _LOGGER.debug("Successfully fetched fresh data from PSE API, records count: %d", 
-                            len(data.get("raw_data", [])))
-                return data
+                self.retry_policy.record_success()
+                if data is None:
+                    return self._serve_revalidated()
         except asyncio.TimeoutError as exception:
             self._last_api_fetch = now
-            _LOGGER.error("Timeout communicating with PSE API: %s", exception)
+            retry_in = self.retry_policy.record_failure(now)
+            _LOGGER.error("Timeout communicating with PSE API: %s (retrying in %s)", exception, retry_in)
             if self.data:
-                _LOGGER.warning("Using existing data due to API timeout")
-                return self.data
+                _LOGGER.warning("Serving stale data due to API timeout")
+                return self._serve_stale(now)
             raise UpdateFailed(f"Timeout communicating with API: {exception}") from exception
         except Exception as exception:
             self._last_api_fetch = now
-            _LOGGER.error("Error communicating with PSE API: %s", exception)
+            retry_in = self.retry_policy.record_failure(now)
+            _LOGGER.error("Error communicating with PSE API: %s (retrying in %s)", exception, retry_in)
             if self.data:
-                _LOGGER.warning("Using existing data due to API error")
-                return self.data
+                _LOGGER.warning("Serving stale data due to API error")
+                return self._serve_stale(now)
             raise UpdateFailed(f"Error communicating with API: {exception}") from exception
 
-    async def _fetch_data(self) -> dict[str, Any]:
-        today = dt_util.now().strftime("%Y-%m-%d")
-        _LOGGER.debug("Fetching PSE data for business_date >= %s", today)
+        api_records = data.pop("api_records", None)
+
+        held_freshness = _data_freshness(self.data) if self.data else None
+        fetched_freshness = _data_freshness(data)
+        if held_freshness is not None and held_freshness > fetched_freshness:
+            _LOGGER.debug("Held data is newer than the PSE API response, keeping it")
+            return self._serve_revalidated()
+
+        if held_freshness is not None and fetched_freshness[0] != held_freshness[0]:
+            latest_date, publication_ts = fetched_freshness
+            self.fetch_scheduler.record_fresh_data(
+                now, latest_date, dt_util.parse_datetime(publication_ts) if publication_ts else None
+            )
+
+        _LOGGER.debug("Successfully fetched fresh data from PSE API, records count: %d", 
+                    len(data.get("series", ())))
+
+        # Returning the held data object lets the coordinator skip notifying
+        # listeners, so an unchanged poll costs one digest.
+        fingerprint = _data_fingerprint(data)
+        if self.data and fingerprint == self._data_fingerprint:
+            self.fetch_scheduler.record_unchanged_fetch()
+            _LOGGER.debug("PSE data unchanged since the last update, not notifying entities")
+            return self._serve_revalidated()
+        self._data_fingerprint = fingerprint
+
+        if api_records is not None:
+            self._api_records = {_record_key(record): record for record in api_records}
+            await self.price_cache.async_save(api_records, now)
+            self.hass.async_create_background_task(
+                self.statistics_importer.async_import(api_records), f"{DOMAIN} statistics import"
+            )
+
+        return self._publish(data)
+
+    def _held_quarters(self, today: str) -> dict[str, int]:
+        counts: dict[str, int] = defaultdict(int)
+        for business_date, _, _ in self._api_records:
+            if business_date >= today:
+                counts[business_date] += 1
+        return counts
+
+    def _first_date_to_fetch(self, now: datetime) -> str:
+        """Return the earliest business date that still has to be downloaded.
+
+        That is the first of today and tomorrow not held in full. When both
+        are complete the latest one is asked for again to pick up revisions.
+        """
+        today = now.strftime("%Y-%m-%d")
+        tomorrow = (now + timedelta(days=1)).strftime("%Y-%m-%d")
+        held = self._held_quarters(today)
+        for business_date in (today, tomorrow):
+            if held.get(business_date, 0) < _expected_quarters(business_date):
+                return business_date
+        return tomorrow
+
+    def _merge_records(self, fetched: list[dict], today: str) -> list[dict]:
+        """Overlay ``fetched`` on the held records by ``dtime``, dropping past dates."""
+        held_publications: dict[str, str] = {}
+        merged: dict[tuple[str, str, str], dict[str, Any]] = {}
+        for key, record in self._api_records.items():
+            if key[0] >= today:
+                merged[key] = record
+                held_publications[key[0]] = record.get("publication_ts") or ""
+
+        for record in fetched:
+            key = _record_key(record)
+            held_publication = held_publications.get(key[0])
+            publication_ts = record.get("publication_ts") or ""
+            if held_publication and held_publication != publication_ts:
+                _LOGGER.info("PSE revised prices for %s (published %s, held %s)",
+                             key[0], publication_ts, held_publication)
+                held_publications[key[0]] = publication_ts
+            merged[key] = record
+
+        return list(merged.values())
+
+    def _held_publication(self, business_date: str) -> str:
+        return max(
+            (
+                record.get("publication_ts") or ""
+                for key, record in self._api_records.items()
+                if key[0] == business_date
+            ),
+            default="",
+        )
+
+    def _should_probe(self, first_date: str, today: str) -> bool:
+        """Probe first unless ``first_date`` is partially held and must be downloaded anyway."""
+        if not self._api_records:
+            return False
+        held_count = self._held_quarters(today).get(first_date, 0)
+        return held_count == 0 or held_count >= _expected_quarters(first_date)
+
+    async def _probe_for_new_data(self, first_date: str) -> bool:
+        """Ask for a few publication rows to see if a full download would bring anything new."""
+        params = {
+            "$select": API_PROBE_SELECT,
+            "$filter": f"business_date ge '{first_date}'",
+            "$first": API_PROBE_FIRST,
+        }
+        _LOGGER.debug("PSE API probe request params: %s", params)
+        self.fetch_scheduler.record_probe()
+
+        async with self.session.get(
+            PSE_API_URL, params=params, headers=API_HEADERS
+        ) as response:
+            if response.status != 200:
+                _LOGGER.error("PSE API probe returned error status: %d", response.status)
+                raise UpdateFailed(f"API returned status {response.status}")
+            data = json_loads(await response.read())
+
+        rows = data.get("value") if isinstance(data, dict) else None
+        if rows is None:
+            _LOGGER.error("PSE API probe response missing 'value' field")
+            raise UpdateFailed("Invalid API response format")
+        if not rows:
+            return False
+
+        held_publication = self._held_publication(first_date)
+        if not held_publication:
+            return True
+        return max(row.get("publication_ts") or "" for row in rows) > held_publication
+
+    async def _fetch_data(self) -> dict[str, Any] | None:
+        """Download the missing business dates, or return None when the probe finds nothing new."""
+        now = dt_util.now()
+        today = now.strftime("%Y-%m-%d")
+        first_date = self._first_date_to_fetch(now)
+
+        if self._should_probe(first_date, today):
+            try:
+                has_new_data = await self._probe_for_new_data(first_date)
+            except aiohttp.ClientError as exception:
+                _LOGGER.error("HTTP client error probing PSE data: %s", exception)
+                raise UpdateFailed(f"Error fetching data: {exception}") from exception
+            if not has_new_data:
+                _LOGGER.debug("PSE API probe found nothing new from %s", first_date)
+                self.fetch_scheduler.record_skipped_download()
+                return None
+
+        _LOGGER.debug("Fetching PSE data for business_date >= %s", first_date)
         
         params = {
             "$select": API_SELECT,
-            "$filter": f"business_date ge '{today}'",
+            "$filter": f"business_date ge '{first_date}'",
             "$first": API_FIRST,
         }
         
-        headers = {
-            "Accept": "application/json",
-        }
-
         _LOGGER.debug("PSE API request URL: %s, params: %s", PSE_API_URL, params)
 
         try:
             async with self.session.get(
-                PSE_API_URL, params=params, headers=headers
+                PSE_API_URL, params=params, headers=API_HEADERS
             ) as response:
                 _LOGGER.debug("PSE API response status: %d", response.status)
                 
@@ -105,119 +542,117 @@ class RCEPSEDataUpdateCoordinator(DataUpdateCoordinator):
                     _LOGGER.error("PSE API returned error status: %d", response.status)
                     raise UpdateFailed(f"API returned status {response.status}")
                 
-                data = await response.json()
+                body = await response.read()
+                data = json_loads(body)
                 
-                if "value" not in data:
+                if not isinstance(data, dict) or "value" not in data:
                     _LOGGER.error("PSE API response missing 'value' field")
                     raise UpdateFailed("Invalid API response format")
                 
                 record_count = len(data["value"])
                 _LOGGER.debug("PSE API returned %d records", record_count)
                 
-                if record_count == 0:
+                if record_count == 0 and first_date == today:
                     _LOGGER.warning("PSE API returned no data records")
                 
-                raw_data = data["value"]
-                
-                use_hourly_prices = self._get_config_value(CONF_USE_HOURLY_PRICES, DEFAULT_USE_HOURLY_PRICES)
-                
-                if use_hourly_prices:
-                    _LOGGER.debug("Hourly prices option enabled, calculating hourly averages")
-                    processed_data = self._calculate_hourly_averages(raw_data)
+                raw_data = self._merge_records(data["value"], today)
+                reused_count = len(raw_data) - record_count
+                if reused_count > 0 and record_count:
+                    _LOGGER.debug("Reused %d held records, saving about %d bytes",
+                                  reused_count, reused_count * len(body) // record_count)
                 else:
-                    _LOGGER.debug("Hourly prices option disabled, using original 15-minute data")
-                    processed_data = self._add_neg_to_zero_key(raw_data)
+                    _LOGGER.debug("Reused %d held records", max(reused_count, 0))
                 
-                return {
-                    "raw_data": processed_data,
-                    "last_update": dt_util.now().isoformat(),
-                }
+                result = self._build_data(raw_data, dt_util.now())
+                result["api_records"] = raw_data
+                return result
                 
         except aiohttp.ClientError as exception:
             _LOGGER.error("HTTP client error fetching PSE data: %s", exception)
             raise UpdateFailed(f"Error fetching data: {exception}") from exception
 
-    def _calculate_hourly_averages(self, raw_data: list[dict]) -> list[dict]:
-        if not raw_data:
-            return raw_data
+    def _build_data(self, raw_data: list[dict], fetched_at: datetime) -> dict[str, Any]:
+        use_hourly_prices = self._get_config_value(CONF_USE_HOURLY_PRICES, DEFAULT_USE_HOURLY_PRICES)
+        _LOGGER.debug("Building price series with hourly prices %s",
+                     "enabled" if use_hourly_prices else "disabled")
         
-        hourly_groups = defaultdict(list)
+        series = PriceSeries.from_api_values(raw_data, hourly_prices=use_hourly_prices)
+        _LOGGER.debug("Built price series with %d records for business dates: %s",
+                     len(series), ", ".join(series.business_dates))
         
-        for record in raw_data:
-            try:
-                dtime = datetime.strptime(record["dtime"], "%Y-%m-%d %H:%M:%S")
-                period_start = dtime - timedelta(minutes=15)
-                date_hour_key = f"{period_start.strftime('%Y-%m-%d')}_{period_start.hour:02d}"
-                hourly_groups[date_hour_key].append(record)
-            except (ValueError, KeyError) as e:
-                _LOGGER.warning("Failed to parse record dtime: %s, error: %s", record.get("dtime"), e)
-                continue
-        
-        processed_data = []
-        
-        for date_hour_key, records in hourly_groups.items():
-            if not records:
-                continue
-                
-            prices = []
-            for record in records:
-                try:
-                    price = float(record["rce_pln"])
-                    prices.append(price)
-                except (ValueError, KeyError) as e:
-                    _LOGGER.warning("Failed to parse price from record: %s, error: %s", record.get("rce_pln"), e)
-                    continue
-            
-            if not prices:
-                continue
-                
-            average_price = sum(prices) / len(prices)
-            
-            prices_neg_to_zero = [max(0, price) for price in prices]
-            average_price_neg_to_zero = sum(prices_neg_to_zero) / len(prices_neg_to_zero)
-            
-            _LOGGER.debug("Calculated hourly average for %s: %.2f PLN (from %d records)", 
-                         date_hour_key, average_price, len(prices))
-            _LOGGER.debug("Calculated hourly average (neg to zero) for %s: %.2f PLN", 
-                         date_hour_key, average_price_neg_to_zero)
-            
-            for record in records:
-                try:
-                    new_record = record.copy()
-                    new_record["rce_pln"] = f"{average_price:.2f}"
-                    new_record["rce_pln_neg_to_zero"] = f"{average_price_neg_to_zero:.2f}"
-                    processed_data.append(new_record)
-                except (ValueError, KeyError) as e:
-                    _LOGGER.warning("Failed to process record: %s, error: %s", record, e)
-                    continue
-        
-        _LOGGER.debug("Processed %d records with hourly averages (original: %d)", 
-                     len(processed_data), len(raw_data))
-        
-        return processed_data
+        return {
+            "series": series,
+            "statistics": DayStatistics.for_series(series),
+            "windows": WindowResults(series, self.window_queries),
+            "freshness": _day_freshness(series, fetched_at.isoformat(), self.data),
+            "last_update": fetched_at.isoformat(),
+            "stale_since": None,
+        }
 
-    def _add_neg_to_zero_key(self, raw_data: list[dict]) -> list[dict]:
-        if not raw_data:
-            return raw_data
-        
-        processed_data = []
-        
-        for record in raw_data:
-            try:
-                new_record = record.copy()
-                price = float(record["rce_pln"])
-                neg_to_zero_price = max(0, price)
-                new_record["rce_pln_neg_to_zero"] = f"{neg_to_zero_price:.2f}"
-                processed_data.append(new_record)
-            except (ValueError, KeyError) as e:
-                _LOGGER.warning("Failed to process record for neg_to_zero: %s, error: %s", record, e)
-                processed_data.append(record)
-        
-        _LOGGER.debug("Added rce_pln_neg_to_zero key to %d records", len(processed_data))
-        
-        return processed_data
+    def _ensure_session(self) -> None:
+        if self.session is None:
+            self.session = async_create_clientsession(
+                self.hass, trace_configs=[self.connection_stats.trace_config()]
+            )
+
+    @property
+    def last_api_fetch(self) -> datetime | None:
+        """When the PSE API was last asked, whether or not the data changed."""
+        return self._last_api_fetch
+
+    @property
+    def backfill_running(self) -> bool:
+        return self._backfill_task is not None and not self._backfill_task.done()
+
+    def async_start_backfill(self, days: int) -> bool:
+        """Start a history backfill in the background unless one is already running."""
+        if self.backfill_running:
+            return False
+        self._backfill_task = self.hass.async_create_background_task(
+            self.async_backfill_history(days), f"{DOMAIN} history backfill"
+        )
+        return True
+
+    async def async_backfill_history(self, days: int) -> BackfillResult:
+        """Archive ``days`` past business dates, resuming where earlier runs stopped."""
+        self._ensure_session()
+        store: Store[dict[str, Any]] = Store(self.hass, BACKFILL_STORAGE_VERSION, BACKFILL_STORAGE_KEY)
+        stored = await store.async_load() or {}
+
+        def progress() -> dict[str, Any]:
+            return {"completed": sorted(backfill.completed)}
+
+        async def on_date_complete(business_date: str) -> None:
+            store.async_delay_save(progress, BACKFILL_SAVE_DELAY)
+
+        backfill = HistoryBackfill(
+            self.session,
+            self.price_archive,
+            headers=API_HEADERS,
+            completed=stored.get("completed", ()),
+            on_date_complete=on_date_complete,
+        )
+        yesterday = dt_util.now().date() - timedelta(days=1)
+        business_dates = HistoryBackfill.business_dates(yesterday, days)
+        result = await backfill.async_run(business_dates)
+        await store.async_save(progress())
+
+        if result.oldest is not None and result.newest is not None:
+            # Re-import only the dates this run filled in, not all of history.
+            await self.statistics_importer.async_import(
+                since=dt_util.start_of_local_day(date.fromisoformat(result.oldest)),
+                until=dt_util.start_of_local_day(date.fromisoformat(result.newest) + timedelta(days=1)),
+            )
+
+        _LOGGER.info("PSE history backfill finished: %d dates, %d pages, %d records, %d skipped, %d failed",
+                     result.dates, result.pages, result.records, result.skipped, result.failed)
+        return result
 
     async def async_close(self) -> None:
-        _LOGGER.debug("Closing PSE API session")
+        if self.backfill_running:
+            self._backfill_task.cancel()
+        self.price_archive.close()
+        _LOGGER.debug("Detaching PSE API session from the shared connection pool")
         if self.session:
-            await self.session.close() 
\ No newline at end of file
+            self.session.detach()
+            self.session = None 
\ No newline at end of file
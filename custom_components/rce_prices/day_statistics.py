@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import math
+from typing import Any
+
+from .price_series import PriceSeries
+
+PERCENTILES: tuple[int, ...] = (10, 25, 50, 75, 90)
+
+
+def _median(sorted_prices: list[float]) -> float:
+    middle = len(sorted_prices) // 2
+    if len(sorted_prices) % 2:
+        return sorted_prices[middle]
+    return (sorted_prices[middle - 1] + sorted_prices[middle]) / 2
+
+
+def _percentile(sorted_prices: list[float], percent: int) -> float:
+    position = (len(sorted_prices) - 1) * percent / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_prices[lower]
+    fraction = position - lower
+    return sorted_prices[lower] + (sorted_prices[upper] - sorted_prices[lower]) * fraction
+
+
+@dataclass(frozen=True)
+class DayStatistics:
+    """Aggregates for one business date, computed once per data version.
+
+    ``min_first``/``min_last`` and ``max_first``/``max_last`` index the first
+    and last quarter holding the extreme price, i.e. the argmin/argmax range
+    the hours and window sensors report.
+    """
+
+    count: int
+    mean: float
+    median: float
+    min: float
+    max: float
+    stddev: float
+    min_first: int
+    min_last: int
+    max_first: int
+    max_last: int
+    percentiles: dict[int, float] = field(default_factory=dict)
+    records: Sequence[dict[str, Any]] = field(default=(), repr=False, compare=False)
+
+    @property
+    def range(self) -> float:
+        return self.max - self.min
+
+    @property
+    def min_records(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        return self.records[self.min_first], self.records[self.min_last]
+
+    @property
+    def max_records(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        return self.records[self.max_first], self.records[self.max_last]
+
+    @classmethod
+    def from_data(cls, data: PriceSeries | list[dict] | None) -> DayStatistics | None:
+        if not data:
+            return None
+
+        if isinstance(data, PriceSeries):
+            prices = data.prices.tolist()
+        else:
+            prices = [float(record["rce_pln"]) for record in data]
+
+        if not prices:
+            return None
+
+        count = len(prices)
+        mean = sum(prices) / count
+        sorted_prices = sorted(prices)
+        min_price = sorted_prices[0]
+        max_price = sorted_prices[-1]
+
+        min_indices = [index for index, price in enumerate(prices) if price == min_price]
+        max_indices = [index for index, price in enumerate(prices) if price == max_price]
+
+        return cls(
+            count=count,
+            mean=mean,
+            median=_median(sorted_prices),
+            min=min_price,
+            max=max_price,
+            stddev=math.sqrt(sum((price - mean) ** 2 for price in prices) / count),
+            min_first=min_indices[0],
+            min_last=min_indices[-1],
+            max_first=max_indices[0],
+            max_last=max_indices[-1],
+            percentiles={percent: _percentile(sorted_prices, percent) for percent in PERCENTILES},
+            records=data,
+        )
+
+    @classmethod
+    def for_series(cls, series: PriceSeries) -> dict[str, DayStatistics]:
+        statistics: dict[str, DayStatistics] = {}
+        for business_date in series.business_dates:
+            day_statistics = cls.from_data(series.for_date(business_date))
+            if day_statistics is not None:
+                statistics[business_date] = day_statistics
+        return statistics
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+    series = data.get("series")
+
+    return {
+        "data_version": coordinator.data_version,
+        "last_update": data.get("last_update"),
+        "last_api_fetch": coordinator.last_api_fetch.isoformat() if coordinator.last_api_fetch else None,
+        "records": len(series) if series else 0,
+        "business_dates": list(series.business_dates) if series else [],
+        "freshness": {
+            business_date: freshness.as_dict()
+            for business_date, freshness in data.get("freshness", {}).items()
+        },
+        "stale_since": data.get("stale_since"),
+        "window_queries": len(coordinator.window_queries),
+        "calculation_cache": coordinator.calculation_cache.as_dict(),
+        "update_interval": coordinator.update_interval.total_seconds(),
+        "fetch_scheduler": coordinator.fetch_scheduler.as_dict(),
+        "retry_policy": coordinator.retry_policy.as_dict(),
+        "connections": coordinator.connection_stats.as_dict(),
+    }
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import FETCH_MISSING_TODAY_INTERVAL, FETCH_PUBLICATION_LADDER, PUBLICATION_EXPECTED_HOUR
+
+
+class FetchScheduler:
+    """Pick the next PSE API poll from where we are in the publication cycle.
+
+    PSE publishes tomorrow's prices once a day, around
+    ``PUBLICATION_EXPECTED_HOUR`` local time. While tomorrow is already held
+    the scheduler idles until the next day's ladder starts. While it is
+    missing, polls follow ``FETCH_PUBLICATION_LADDER``: each step's interval
+    applies from its offset relative to the expected publication time, and
+    the last step holds until tomorrow's business date shows up.
+    """
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.probes = 0
+        self.skipped_downloads = 0
+        self.unchanged_fetches = 0
+        self.coalesced_fetches = 0
+        self.last_fresh_date: str | None = None
+        self.last_time_to_fresh_data: timedelta | None = None
+
+    @staticmethod
+    def _expected_publication(now: datetime) -> datetime:
+        return dt_util.as_local(now).replace(
+            hour=PUBLICATION_EXPECTED_HOUR, minute=0, second=0, microsecond=0
+        )
+
+    def next_interval(self, now: datetime, business_dates: Collection[str]) -> timedelta:
+        # Aware datetimes sharing a tzinfo subtract as wall clock, so
+        # differences are taken in UTC to stay right across DST changes.
+        utc_now = dt_util.as_utc(now)
+        local_now = dt_util.as_local(now)
+        today = local_now.strftime("%Y-%m-%d")
+        tomorrow = (local_now + timedelta(days=1)).strftime("%Y-%m-%d")
+
+        if today not in business_dates:
+            return FETCH_MISSING_TODAY_INTERVAL
+
+        expected = self._expected_publication(local_now)
+        ladder_start = expected + FETCH_PUBLICATION_LADDER[0][0]
+
+        if tomorrow in business_dates:
+            next_expected = self._expected_publication(
+                dt_util.start_of_local_day(local_now + timedelta(days=1))
+            )
+            return dt_util.as_utc(next_expected + FETCH_PUBLICATION_LADDER[0][0]) - utc_now
+
+        if local_now < ladder_start:
+            return dt_util.as_utc(ladder_start) - utc_now
+
+        offset = utc_now - dt_util.as_utc(expected)
+        interval = FETCH_PUBLICATION_LADDER[0][1]
+        for step_offset, step_interval in FETCH_PUBLICATION_LADDER:
+            if offset < step_offset:
+                break
+            interval = step_interval
+        return interval
+
+    def record_request(self) -> None:
+        self.requests += 1
+
+    def record_probe(self) -> None:
+        self.probes += 1
+
+    def record_skipped_download(self) -> None:
+        self.skipped_downloads += 1
+
+    def record_unchanged_fetch(self) -> None:
+        self.unchanged_fetches += 1
+
+    def record_coalesced_fetch(self) -> None:
+        self.coalesced_fetches += 1
+
+    def record_fresh_data(self, now: datetime, business_date: str, published_at: datetime | None) -> None:
+        """Note how long after publication a new business date was first seen."""
+        if business_date == self.last_fresh_date:
+            return
+        self.last_fresh_date = business_date
+        self.last_time_to_fresh_data = (
+            dt_util.as_utc(now) - dt_util.as_utc(published_at) if published_at else None
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        time_to_fresh = self.last_time_to_fresh_data
+        return {
+            "requests": self.requests,
+            "probes": self.probes,
+            "skipped_downloads": self.skipped_downloads,
+            "unchanged_fetches": self.unchanged_fetches,
+            "coalesced_fetches": self.coalesced_fetches,
+            "last_fresh_date": self.last_fresh_date,
+            "last_time_to_fresh_data": time_to_fresh.total_seconds() if time_to_fresh is not None else None,
+        }
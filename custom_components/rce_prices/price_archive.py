@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import logging
+import mmap
+import os
+import struct
+import threading
+from typing import Any, NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+from .price_series import QUARTER_SECONDS
+
+_LOGGER = logging.getLogger(__name__)
+
+ARCHIVE_MAGIC = b"RCEA"
+ARCHIVE_VERSION = 1
+ARCHIVE_SUFFIX = ".rcea"
+PSE_TIME_ZONE = "Europe/Warsaw"
+
+# magic, version, record size, first quarter index of the year
+_HEADER = struct.Struct("<4sHHq")
+# quarter index, price in grosze
+_RECORD = struct.Struct("<ii")
+HEADER_SIZE = _HEADER.size
+RECORD_SIZE = _RECORD.size
+
+
+class ArchiveChunk(NamedTuple):
+    """Zero-copy ``int32`` columns over one year file.
+
+    ``quarters`` holds UTC epoch-quarter indexes (``epoch seconds // 900``
+    of the quarter start) and ``prices`` the matching price in grosze per
+    MWh. Slots that were never written carry quarter index ``0``.
+    """
+
+    quarters: memoryview
+    prices: memoryview
+
+
+def quarter_index(value: datetime) -> int:
+    return int(dt_util.as_utc(value).timestamp()) // QUARTER_SECONDS
+
+
+def _year_start_quarter(year: int) -> int:
+    return int(datetime(year, 1, 1, tzinfo=timezone.utc).timestamp()) // QUARTER_SECONDS
+
+
+def _year_of_quarter(quarter: int) -> int:
+    return datetime.fromtimestamp(quarter * QUARTER_SECONDS, timezone.utc).year
+
+
+class PriceArchive:
+    """Local history of RCE prices under ``.storage``, one file per year.
+
+    Each year file is a 16 byte header followed by one fixed-width slot per
+    UTC quarter of the year: the quarter index and the price in grosze, both
+    ``int32``. A year of 15-minute prices is about 280 KiB and a quarter's
+    slot is found by arithmetic, so pages can be written in any order and
+    rewriting a day simply overwrites its slots.
+
+    Reads go through ``mmap``: ``read`` returns ``memoryview`` slices over
+    the mapped files, so a 30 or 365 day query copies nothing until the
+    caller touches the values. Mapped files stay open until ``close``.
+    Reads and writes block and must run in an executor; pages may be
+    written from several threads at once.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._maps: dict[int, tuple[mmap.mmap, memoryview]] = {}
+        # Backfill workers and the statistics import write from several
+        # executor threads; a new year file must be created only once.
+        self._create_lock = threading.Lock()
+
+    def _path(self, year: int) -> str:
+        return os.path.join(self.directory, f"{year}{ARCHIVE_SUFFIX}")
+
+    def years(self) -> list[int]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(
+            int(name[:-len(ARCHIVE_SUFFIX)])
+            for name in names
+            if name.endswith(ARCHIVE_SUFFIX) and name[:-len(ARCHIVE_SUFFIX)].isdigit()
+        )
+
+    def _create_year(self, year: int) -> None:
+        slots = _year_start_quarter(year + 1) - _year_start_quarter(year)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(year), "xb") as archive_file:
+            archive_file.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, RECORD_SIZE, _year_start_quarter(year)))
+            archive_file.truncate(HEADER_SIZE + slots * RECORD_SIZE)
+
+    @staticmethod
+    def _quarters_of_page(records: list[dict[str, Any]]) -> list[tuple[int, int]]:
+        time_zone = dt_util.get_time_zone(PSE_TIME_ZONE)
+        seen: set[int] = set()
+        slots = []
+
+        for record in records:
+            try:
+                end = datetime.fromisoformat(record["dtime"])
+                price = round(float(record["rce_pln"]) * 100)
+            except (ValueError, KeyError, TypeError):
+                continue
+
+            # The autumn DST change repeats an hour of wall-clock ``dtime``;
+            # the second pass over it is the later (fold=1) instant.
+            quarter = quarter_index(end.replace(tzinfo=time_zone)) - 1
+            if quarter in seen:
+                quarter = quarter_index(end.replace(tzinfo=time_zone, fold=1)) - 1
+            seen.add(quarter)
+            slots.append((quarter, price))
+
+        return slots
+
+    def write_page(self, records: list[dict[str, Any]]) -> int:
+        slots_by_year: dict[int, list[tuple[int, int]]] = {}
+        for quarter, price in self._quarters_of_page(records):
+            slots_by_year.setdefault(_year_of_quarter(quarter), []).append((quarter, price))
+
+        written = 0
+        for year, slots in slots_by_year.items():
+            if not os.path.exists(self._path(year)):
+                with self._create_lock:
+                    if not os.path.exists(self._path(year)):
+                        self._create_year(year)
+
+            first_quarter = _year_start_quarter(year)
+            with open(self._path(year), "r+b") as archive_file:
+                for quarter, price in slots:
+                    archive_file.seek(HEADER_SIZE + (quarter - first_quarter) * RECORD_SIZE)
+                    archive_file.write(_RECORD.pack(quarter, price))
+            written += len(slots)
+
+        _LOGGER.debug("Archived %d PSE records", written)
+        return written
+
+    def _year_view(self, year: int) -> memoryview | None:
+        if year in self._maps:
+            return self._maps[year][1]
+
+        try:
+            with open(self._path(year), "rb") as archive_file:
+                mapped = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        magic, version, record_size, first_quarter = _HEADER.unpack_from(mapped)
+        if (magic, version, record_size, first_quarter) != (
+            ARCHIVE_MAGIC, ARCHIVE_VERSION, RECORD_SIZE, _year_start_quarter(year)
+        ):
+            _LOGGER.warning("Ignoring PSE price archive %s with an unknown header", self._path(year))
+            mapped.close()
+            return None
+
+        view = memoryview(mapped)[HEADER_SIZE:].cast("i")
+        self._maps[year] = (mapped, view)
+        return view
+
+    def read(self, start: datetime, end: datetime) -> list[ArchiveChunk]:
+        """Return the archived quarters starting in ``[start, end)``, one chunk per year."""
+        first, last = quarter_index(start), quarter_index(end)
+        chunks = []
+
+        while first < last:
+            year = _year_of_quarter(first)
+            year_end = min(last, _year_start_quarter(year + 1))
+            view = self._year_view(year)
+            if view is not None:
+                lo = (first - _year_start_quarter(year)) * 2
+                hi = (year_end - _year_start_quarter(year)) * 2
+                chunks.append(ArchiveChunk(view[lo:hi:2], view[lo + 1:hi:2]))
+            first = year_end
+
+        return chunks
+
+    def close(self) -> None:
+        for mapped, view in self._maps.values():
+            try:
+                view.release()
+                mapped.close()
+            except BufferError:
+                # Chunks handed out by ``read``, or buffers exported from
+                # them, are still alive; the mapping is unmapped once the
+                # last of them is released.
+                pass
+        self._maps.clear()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import API_SELECT, PRICE_CACHE_STORAGE_KEY, PRICE_CACHE_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_FIELDS: tuple[str, ...] = tuple(API_SELECT.split(","))
+
+
+class PriceCache:
+    """Last PSE API records persisted in ``.storage`` across restarts.
+
+    Records are kept as they came from the API, before any hourly averaging,
+    so a cache written with one option set is still valid after the options
+    change. Each record is stored as a row of values in ``CACHE_FIELDS``
+    order instead of a dict, which keeps the file small.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, PRICE_CACHE_STORAGE_VERSION, PRICE_CACHE_STORAGE_KEY
+        )
+
+    async def async_load(self) -> tuple[list[dict[str, Any]], datetime | None] | None:
+        try:
+            stored = await self._store.async_load()
+        except Exception as exception:
+            _LOGGER.warning("Failed to load cached PSE prices: %s", exception)
+            return None
+
+        if not stored or stored.get("fields") != list(CACHE_FIELDS):
+            return None
+
+        records = [dict(zip(CACHE_FIELDS, row)) for row in stored.get("rows", ())]
+        fetched_at = stored.get("fetched_at")
+        return records, dt_util.parse_datetime(fetched_at) if fetched_at else None
+
+    async def async_save(self, records: list[dict[str, Any]], fetched_at: datetime) -> None:
+        # A failed write only loses the warm start after a restart; it must
+        # not turn a successful fetch into a failed update.
+        try:
+            await self._store.async_save(
+                {
+                    "fetched_at": fetched_at.isoformat(),
+                    "fields": list(CACHE_FIELDS),
+                    "rows": [[record.get(field) for field in CACHE_FIELDS] for record in records],
+                }
+            )
+        except Exception as exception:
+            _LOGGER.warning("Failed to save PSE prices to the cache: %s", exception)
+            return
+        _LOGGER.debug("Saved %d PSE records to the price cache", len(records))
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
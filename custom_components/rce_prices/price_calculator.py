@@ -1,14 +1,56 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
+import heapq
+from itertools import accumulate
 import statistics
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from .const import MIN_PRICE_WINDOW_END_HOUR, MIN_PRICE_WINDOW_START_HOUR
+from .price_series import PriceSeries, wall_clock_to_datetime
+
+SECONDS_PER_DAY = 86400
+# Prices carry two decimals, so rounding window sums to this precision drops
+# float accumulation noise without merging genuinely different windows.
+_SUM_DECIMALS = 6
+
+
+@dataclass(frozen=True)
+class WindowQuery:
+    """A window search answered by :meth:`PriceCalculator.batch_windows`.
+
+    By default every quarter of a window must start within
+    ``[window_start_hour, window_end_hour)``. With ``guard_boundaries`` the
+    window start and end time of day are checked instead, which is how the
+    configurable min price window is bounded.
+    """
+
+    window_start_hour: int
+    window_end_hour: int
+    duration_quarters: int
+    is_max: bool = False
+    top_n: int = 1
+    full_hour_start: bool = False
+    distinct_start_hour: bool = False
+    guard_boundaries: bool = False
+
+    @classmethod
+    def min_price_window(cls, duration_quarters: int) -> WindowQuery:
+        return cls(
+            MIN_PRICE_WINDOW_START_HOUR,
+            MIN_PRICE_WINDOW_END_HOUR,
+            duration_quarters,
+            guard_boundaries=True,
+        )
+
 
 class PriceCalculator:
     
     @staticmethod
-    def get_prices_from_data(data: list[dict]) -> list[float]:
+    def get_prices_from_data(data: PriceSeries | list[dict]) -> list[float]:
+        if isinstance(data, PriceSeries):
+            return data.prices.tolist()
         return [float(record["rce_pln"]) for record in data]
     
     @staticmethod
@@ -41,6 +83,11 @@ class PriceCalculator:
                 continue
         return hourly_prices
     
+    @staticmethod
+    def price_columns(data: PriceSeries | list[dict], keys: tuple[str, ...]) -> dict[str, list]:
+        """Return ``keys`` of every record as parallel lists, one list per key."""
+        return {key: [record.get(key) for record in data] for key in keys}
+
     @staticmethod
     def calculate_percentage_difference(current: float, reference: float) -> float:
         if reference == 0:
@@ -48,221 +95,165 @@ class PriceCalculator:
         return ((current - reference) / reference) * 100
     
     @staticmethod
-    def find_extreme_price_records(data: list[dict], is_max: bool = True) -> list[dict]:
-        if not data:
+    def find_extreme_price_records(data: PriceSeries | list[dict], is_max: bool = True) -> list[dict]:
+        series = PriceSeries.coerce(data)
+        if not series:
             return []
-        
-        prices = PriceCalculator.get_prices_from_data(data)
+
+        prices = series.prices
         extreme_price = max(prices) if is_max else min(prices)
-        
-        extreme_records = [
-            record for record in data 
-            if float(record["rce_pln"]) == extreme_price
+
+        return [
+            series.records[index]
+            for index in range(len(prices))
+            if prices[index] == extreme_price
         ]
-        
-        return sorted(extreme_records, key=lambda x: x["dtime"])
 
     @staticmethod
-    def find_cheapest_window(data: list[dict], duration_quarters: int) -> list[dict]:
-        if not data or duration_quarters <= 0:
-            return []
-
-        sorted_data = sorted(data, key=lambda x: x["dtime"])
-
-        if len(sorted_data) < duration_quarters:
-            return []
-
-        best_window: list[dict] = []
-        best_avg_price: float | None = None
-
-        for i in range(len(sorted_data) - duration_quarters + 1):
-            window = sorted_data[i:i + duration_quarters]
-
-            is_continuous = True
-            for j in range(len(window) - 1):
-                try:
-                    curr_time = datetime.strptime(window[j]["dtime"], "%Y-%m-%d %H:%M:%S")
-                    next_time = datetime.strptime(window[j + 1]["dtime"], "%Y-%m-%d %H:%M:%S")
-
-                    if next_time != curr_time + timedelta(minutes=15):
-                        is_continuous = False
-                        break
-                except (ValueError, KeyError):
-                    is_continuous = False
-                    break
-
-            if not is_continuous:
-                continue
-
-            try:
-                window_start = datetime.strptime(window[0]["dtime"], "%Y-%m-%d %H:%M:%S") - timedelta(minutes=15)
-                window_end = datetime.strptime(window[-1]["dtime"], "%Y-%m-%d %H:%M:%S")
-            except (ValueError, KeyError):
-                continue
+    def get_window_boundaries(window: PriceSeries | list[dict]) -> tuple[datetime, datetime] | None:
+        series = PriceSeries.coerce(window)
+        if not series:
+            return None
 
-            if (window_start.hour, window_start.minute) < (MIN_PRICE_WINDOW_START_HOUR, 0):
-                continue
+        return (
+            wall_clock_to_datetime(series.start_ts[0]),
+            wall_clock_to_datetime(series.end_ts[-1]),
+        )
 
-            if (window_end.hour, window_end.minute) > (MIN_PRICE_WINDOW_END_HOUR, 0):
-                continue
+    @staticmethod
+    def _run_stops(series: PriceSeries, window_start_hour: int | None = None,
+                   window_end_hour: int | None = None) -> list[int]:
+        """Return, for every index, the exclusive end of its contiguous run.
+
+        When hours are given, the run also stops at the first quarter starting
+        outside ``[window_start_hour, window_end_hour)`` and indices outside the
+        range map to themselves.
+        """
+        start_ts = series.start_ts
+        end_ts = series.end_ts
+        length = len(series)
+        stops = [0] * length
+
+        for index in range(length - 1, -1, -1):
+            if window_start_hour is not None and not (
+                window_start_hour <= (start_ts[index] % SECONDS_PER_DAY) // 3600 < window_end_hour
+            ):
+                stops[index] = index
+            elif index + 1 < length and start_ts[index + 1] == end_ts[index] and stops[index + 1] > index + 1:
+                stops[index] = stops[index + 1]
+            else:
+                stops[index] = index + 1
+        return stops
 
-            try:
-                window_prices = [float(record["rce_pln"]) for record in window]
-                avg_price = sum(window_prices) / len(window_prices)
-            except (ValueError, KeyError):
-                continue
+    @staticmethod
+    def batch_windows(
+        data: PriceSeries | list[dict], queries: Iterable[WindowQuery]
+    ) -> dict[WindowQuery, list[PriceSeries]]:
+        """Answer several window queries with one sweep over prefix sums.
+
+        Candidates are ranked by their rounded price sum and then by start, so
+        exact ties always resolve to the earliest window.
+        """
+        queries = list(dict.fromkeys(queries))
+        results: dict[WindowQuery, list[PriceSeries]] = {query: [] for query in queries}
+        series = PriceSeries.coerce(data)
+        active = [query for query in queries if query.duration_quarters > 0 and query.top_n > 0]
+        if not series or not active:
+            return results
+
+        start_ts = series.start_ts
+        end_ts = series.end_ts
+        prefix = list(accumulate(series.prices, initial=0.0))
+        length = len(series)
+
+        run_stops: dict[tuple[int, int] | None, list[int]] = {}
+        for query in active:
+            hours = None if query.guard_boundaries else (query.window_start_hour, query.window_end_hour)
+            if hours not in run_stops:
+                run_stops[hours] = PriceCalculator._run_stops(series, *(hours or ()))
+
+        states: list[tuple[WindowQuery, list[int], float, dict[int, tuple[float, int]] | list]] = []
+        for query in active:
+            hours = None if query.guard_boundaries else (query.window_start_hour, query.window_end_hour)
+            states.append((
+                query,
+                run_stops[hours],
+                -1.0 if query.is_max else 1.0,
+                {} if query.distinct_start_hour else [],
+            ))
+
+        for start in range(length):
+            window_start = start_ts[start]
+            for query, stops, sign, best in states:
+                stop = start + query.duration_quarters
+                if stops[start] < stop:
+                    continue
+                if query.guard_boundaries and (
+                    window_start % SECONDS_PER_DAY < query.window_start_hour * 3600
+                    or end_ts[stop - 1] % SECONDS_PER_DAY > query.window_end_hour * 3600
+                ):
+                    continue
+                if query.full_hour_start and window_start % 3600 != 0:
+                    continue
 
-            if best_avg_price is None or avg_price < best_avg_price:
-                best_window = window
-                best_avg_price = avg_price
+                score = sign * round(prefix[stop] - prefix[start], _SUM_DECIMALS)
+                if query.distinct_start_hour:
+                    start_hour = (window_start % SECONDS_PER_DAY) // 3600
+                    current = best.get(start_hour)
+                    if current is None or (score, start) < current:
+                        best[start_hour] = (score, start)
+                elif len(best) < query.top_n:
+                    heapq.heappush(best, (-score, -start))
+                elif (score, start) < (-best[0][0], -best[0][1]):
+                    heapq.heapreplace(best, (-score, -start))
+
+        for query, _, _, best in states:
+            if query.distinct_start_hour:
+                ranked = heapq.nsmallest(query.top_n, best.values())
+            else:
+                ranked = sorted((-score, -start) for score, start in best)
+            results[query] = [
+                series[start:start + query.duration_quarters] for _, start in ranked
+            ]
+
+        return results
 
-        return best_window
+    @staticmethod
+    def find_cheapest_window(data: PriceSeries | list[dict], duration_quarters: int) -> PriceSeries:
+        query = WindowQuery.min_price_window(duration_quarters)
+        windows = PriceCalculator.batch_windows(data, (query,))[query]
+        return windows[0] if windows else PriceSeries.empty()
 
     @staticmethod
-    def find_optimal_window(data: list[dict], window_start_hour: int, window_end_hour: int, 
-                          duration_hours: int, is_max: bool = False) -> list[dict]:
-        if not data or duration_hours <= 0:
-            return []
-        
-        duration_periods = int(duration_hours) * 4
-        
-        filtered_data = []
-        for record in data:
-            try:
-                end_time = datetime.strptime(record["dtime"], "%Y-%m-%d %H:%M:%S")
-                
-                start_time = end_time - timedelta(minutes=15)
-                
-                if start_time.hour >= window_start_hour and start_time.hour < window_end_hour:
-                    filtered_data.append(record)
-                    
-            except (ValueError, KeyError):
-                continue
-        
-        if len(filtered_data) < duration_periods:
-            return []
-        
-        filtered_data.sort(key=lambda x: x["dtime"])
-        
-        best_window = []
-        best_avg_price = None
-        
-        for i in range(len(filtered_data) - duration_periods + 1):
-            window = filtered_data[i:i + duration_periods]
-            
-            is_continuous = True
-            for j in range(len(window) - 1):
-                try:
-                    curr_time = datetime.strptime(window[j]["dtime"], "%Y-%m-%d %H:%M:%S")
-                    next_time = datetime.strptime(window[j + 1]["dtime"], "%Y-%m-%d %H:%M:%S")
-                    
-                    if next_time != curr_time + timedelta(minutes=15):
-                        is_continuous = False
-                        break
-                except (ValueError, KeyError):
-                    is_continuous = False
-                    break
-            
-            if not is_continuous:
-                continue
-            
-            try:
-                window_prices = [float(record["rce_pln"]) for record in window]
-                avg_price = sum(window_prices) / len(window_prices)
-                
-                if best_avg_price is None:
-                    best_window = window
-                    best_avg_price = avg_price
-                elif (is_max and avg_price > best_avg_price) or (not is_max and avg_price < best_avg_price):
-                    best_window = window
-                    best_avg_price = avg_price
-            except (ValueError, KeyError):
-                continue
-        
-        return best_window 
+    def find_optimal_window(data: PriceSeries | list[dict], window_start_hour: int, window_end_hour: int,
+                          duration_hours: int, is_max: bool = False) -> PriceSeries:
+        if duration_hours <= 0:
+            return PriceSeries.empty()
+
+        query = WindowQuery(window_start_hour, window_end_hour, int(duration_hours) * 4, is_max=is_max)
+        windows = PriceCalculator.batch_windows(data, (query,))[query]
+        return windows[0] if windows else PriceSeries.empty()
 
     @staticmethod
     def find_top_windows(
-        data: list[dict],
+        data: PriceSeries | list[dict],
         window_start_hour: int,
         window_end_hour: int,
         duration_hours: int,
         top_n: int = 2,
         is_max: bool = True,
         distinct_start_hour: bool = True,
-    ) -> list[list[dict]]:
-        if not data or duration_hours <= 0 or top_n <= 0:
+    ) -> list[PriceSeries]:
+        if duration_hours <= 0:
             return []
 
-        duration_periods = int(duration_hours) * 4
-        filtered_data = []
-
-        for record in data:
-            try:
-                end_time = datetime.strptime(record["dtime"], "%Y-%m-%d %H:%M:%S")
-                start_time = end_time - timedelta(minutes=15)
-
-                if start_time.hour >= window_start_hour and start_time.hour < window_end_hour:
-                    filtered_data.append(record)
-            except (ValueError, KeyError):
-                continue
-
-        if len(filtered_data) < duration_periods:
-            return []
-
-        filtered_data.sort(key=lambda x: x["dtime"])
-
-        candidates: list[tuple[float, datetime, list[dict]]] = []
-
-        for i in range(len(filtered_data) - duration_periods + 1):
-            window = filtered_data[i:i + duration_periods]
-
-            is_continuous = True
-            for j in range(len(window) - 1):
-                try:
-                    curr_time = datetime.strptime(window[j]["dtime"], "%Y-%m-%d %H:%M:%S")
-                    next_time = datetime.strptime(window[j + 1]["dtime"], "%Y-%m-%d %H:%M:%S")
-
-                    if next_time != curr_time + timedelta(minutes=15):
-                        is_continuous = False
-                        break
-                except (ValueError, KeyError):
-                    is_continuous = False
-                    break
-
-            if not is_continuous:
-                continue
-
-            try:
-                window_start = datetime.strptime(window[0]["dtime"], "%Y-%m-%d %H:%M:%S") - timedelta(minutes=15)
-                if window_start.minute != 0:
-                    continue
-
-                window_prices = [float(record["rce_pln"]) for record in window]
-                avg_price = sum(window_prices) / len(window_prices)
-            except (ValueError, KeyError):
-                continue
-
-            candidates.append((avg_price, window_start, window))
-
-        if not candidates:
-            return []
-
-        candidates.sort(key=lambda item: item[0], reverse=is_max)
-
-        results = []
-        used_hours = set()
-
-        for _, window_start, window in candidates:
-            start_hour = window_start.hour
-
-            if distinct_start_hour and start_hour in used_hours:
-                continue
-
-            results.append(window)
-            used_hours.add(start_hour)
-
-            if len(results) >= top_n:
-                break
-
-        return results
\ No newline at end of file
+        query = WindowQuery(
+            window_start_hour,
+            window_end_hour,
+            int(duration_hours) * 4,
+            is_max=is_max,
+            top_n=top_n,
+            full_hour_start=True,
+            distinct_start_hour=distinct_start_hour,
+        )
+        return PriceCalculator.batch_windows(data, (query,))[query]
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from itertools import islice
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+QUARTER_SECONDS = 900
+
+_WALL_CLOCK_EPOCH = datetime(1970, 1, 1)
+
+
+def parse_wall_clock(value: str) -> int:
+    """Convert a PSE ``dtime`` string into wall-clock epoch seconds.
+
+    PSE publishes naive local (Europe/Warsaw) timestamps. They are kept as
+    seconds since 1970-01-01 00:00 of the same wall clock, which preserves the
+    naive-local comparisons used throughout the integration without any
+    timezone lookups.
+    """
+    return int((datetime.fromisoformat(value) - _WALL_CLOCK_EPOCH).total_seconds())
+
+
+def datetime_to_wall_clock(value: datetime) -> int:
+    return int((value.replace(tzinfo=None) - _WALL_CLOCK_EPOCH).total_seconds())
+
+
+def wall_clock_to_datetime(value: int) -> datetime:
+    return _WALL_CLOCK_EPOCH + timedelta(seconds=value)
+
+
+class PriceSeries(Sequence):
+    """Immutable, columnar view of PSE price records.
+
+    Parsed once per coordinator update. Iterating or indexing yields the
+    original record dicts so existing consumers keep working, while hot paths
+    read the typed ``start_ts``/``end_ts``/``prices`` columns directly.
+
+    Slices and per-business-date partitions are zero-copy views: columns are
+    ``memoryview`` slices of the parent arrays and records are addressed
+    through the parent tuple.
+    """
+
+    __slots__ = (
+        "start_ts",
+        "end_ts",
+        "prices",
+        "prices_neg_to_zero",
+        "business_dates",
+        "date_offsets",
+        "_records",
+        "_lo",
+        "_hi",
+        "_date_index",
+        "_date_views",
+    )
+
+    def __init__(
+        self,
+        start_ts: array | memoryview,
+        end_ts: array | memoryview,
+        prices: array | memoryview,
+        prices_neg_to_zero: array | memoryview,
+        records: tuple[dict[str, Any], ...],
+        business_dates: tuple[str, ...],
+        date_offsets: array,
+        lo: int = 0,
+        hi: int | None = None,
+    ) -> None:
+        self.start_ts = memoryview(start_ts)
+        self.end_ts = memoryview(end_ts)
+        self.prices = memoryview(prices)
+        self.prices_neg_to_zero = memoryview(prices_neg_to_zero)
+        self.business_dates = business_dates
+        self.date_offsets = date_offsets
+        self._records = records
+        self._lo = lo
+        self._hi = len(records) if hi is None else hi
+        self._date_index: dict[str, tuple[int, int]] = {
+            business_date: (date_offsets[index], date_offsets[index + 1])
+            for index, business_date in enumerate(business_dates)
+        }
+        self._date_views: dict[str, PriceSeries] = {}
+
+    @classmethod
+    def empty(cls) -> PriceSeries:
+        return _EMPTY
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> PriceSeries:
+        parsed: list[tuple[str, int, float, float, dict[str, Any]]] = []
+
+        for record in records:
+            try:
+                end = parse_wall_clock(record["dtime"])
+                price = float(record["rce_pln"])
+                neg_to_zero = record.get("rce_pln_neg_to_zero")
+                price_neg_to_zero = float(neg_to_zero) if neg_to_zero is not None else max(0.0, price)
+            except (ValueError, KeyError, TypeError) as e:
+                _LOGGER.debug("Skipping unparsable PSE record %s: %s", record, e)
+                continue
+            parsed.append((record.get("business_date") or "", end, price, price_neg_to_zero, record))
+
+        return cls._from_parsed(parsed)
+
+    @classmethod
+    def from_api_values(cls, values: Iterable[dict[str, Any]], hourly_prices: bool = False) -> PriceSeries:
+        """Build a series straight from the decoded PSE ``value`` rows.
+
+        Every row is parsed once into the typed columns. With 15-minute prices
+        the rows themselves become the series records and only gain
+        ``rce_pln_neg_to_zero`` in place. Hourly prices replace ``rce_pln`` with
+        the hour's average, so each row is copied once to leave the API rows
+        untouched.
+        """
+        if hourly_prices:
+            return cls._from_parsed(_hourly_average_rows(values))
+
+        parsed: list[tuple[str, int, float, float, dict[str, Any]]] = []
+        for record in values:
+            try:
+                end = parse_wall_clock(record["dtime"])
+                price = float(record["rce_pln"])
+            except (ValueError, KeyError, TypeError) as e:
+                _LOGGER.debug("Skipping unparsable PSE record %s: %s", record, e)
+                continue
+            neg_to_zero = f"{max(0.0, price):.2f}"
+            record["rce_pln_neg_to_zero"] = neg_to_zero
+            parsed.append((record.get("business_date") or "", end, price, float(neg_to_zero), record))
+
+        return cls._from_parsed(parsed)
+
+    @classmethod
+    def _from_parsed(cls, parsed: list[tuple[str, int, float, float, dict[str, Any]]]) -> PriceSeries:
+        parsed.sort(key=lambda item: (item[0], item[1]))
+
+        business_dates: list[str] = []
+        date_offsets = array("l")
+        for index, item in enumerate(parsed):
+            if not business_dates or business_dates[-1] != item[0]:
+                business_dates.append(item[0])
+                date_offsets.append(index)
+        date_offsets.append(len(parsed))
+
+        return cls(
+            array("q", (item[1] - QUARTER_SECONDS for item in parsed)),
+            array("q", (item[1] for item in parsed)),
+            array("d", (item[2] for item in parsed)),
+            array("d", (item[3] for item in parsed)),
+            tuple(item[4] for item in parsed),
+            tuple(business_dates),
+            date_offsets,
+        )
+
+    @classmethod
+    def coerce(cls, data: PriceSeries | Iterable[dict[str, Any]] | None) -> PriceSeries:
+        if isinstance(data, PriceSeries):
+            return data
+        if not data:
+            return cls.empty()
+        return cls.from_records(data)
+
+    @property
+    def records(self) -> tuple[dict[str, Any], ...]:
+        if self._lo == 0 and self._hi == len(self._records):
+            return self._records
+        return self._records[self._lo:self._hi]
+
+    def _slice(self, start: int, stop: int) -> PriceSeries:
+        start = max(0, start)
+        stop = min(len(self), stop)
+        if stop <= start:
+            return _EMPTY
+        if start == 0 and stop == len(self):
+            return self
+
+        business_dates: list[str] = []
+        date_offsets = array("l")
+        for index, business_date in enumerate(self.business_dates):
+            lo = max(self.date_offsets[index], start)
+            hi = min(self.date_offsets[index + 1], stop)
+            if lo < hi:
+                business_dates.append(business_date)
+                date_offsets.append(lo - start)
+        date_offsets.append(stop - start)
+
+        return PriceSeries(
+            self.start_ts[start:stop],
+            self.end_ts[start:stop],
+            self.prices[start:stop],
+            self.prices_neg_to_zero[start:stop],
+            self._records,
+            tuple(business_dates),
+            date_offsets,
+            self._lo + start,
+            self._lo + stop,
+        )
+
+    def for_date(self, business_date: str) -> PriceSeries:
+        view = self._date_views.get(business_date)
+        if view is not None:
+            return view
+
+        bounds = self._date_index.get(business_date)
+        if bounds is None:
+            return _EMPTY
+
+        view = self._slice(*bounds)
+        self._date_views[business_date] = view
+        return view
+
+    def index_at(self, timestamp: int) -> int | None:
+        """Return the index of the quarter covering wall-clock ``timestamp``.
+
+        Quarters are half-open ``[start, end)``: on a boundary the quarter that
+        starts there matches, so at most one quarter ever does.
+        """
+        index = bisect_right(self.end_ts, timestamp)
+        if index < len(self) and self.start_ts[index] <= timestamp:
+            return index
+        return None
+
+    def index_at_or_before(self, timestamp: int) -> int | None:
+        """Return the quarter covering ``timestamp`` or else the last one ended by then."""
+        index = bisect_right(self.end_ts, timestamp)
+        if index < len(self) and self.start_ts[index] <= timestamp:
+            return index
+        return index - 1 if index > 0 else None
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return islice(self._records, self._lo, self._hi)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("PriceSeries slices must be contiguous")
+            return self._slice(start, stop)
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("PriceSeries index out of range")
+        return self._records[self._lo + index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PriceSeries):
+            return self.records == other.records
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"PriceSeries(records={len(self)}, business_dates={self.business_dates!r})"
+
+
+def _hourly_average_rows(
+    values: Iterable[dict[str, Any]],
+) -> list[tuple[str, int, float, float, dict[str, Any]]]:
+    """Give every quarter the average price of its hour.
+
+    Quarters with an unparsable price still take the average of the valid
+    quarters in their hour; hours without any valid price are dropped.
+    """
+    hours: dict[int, list[tuple[int, float | None, dict[str, Any]]]] = {}
+    for record in values:
+        try:
+            end = parse_wall_clock(record["dtime"])
+        except (ValueError, KeyError, TypeError) as e:
+            _LOGGER.warning("Failed to parse record dtime: %s, error: %s", record.get("dtime"), e)
+            continue
+        try:
+            price: float | None = float(record["rce_pln"])
+        except (ValueError, KeyError, TypeError) as e:
+            _LOGGER.warning("Failed to parse price from record: %s, error: %s", record.get("rce_pln"), e)
+            price = None
+        hours.setdefault((end - QUARTER_SECONDS) // 3600, []).append((end, price, record))
+
+    parsed: list[tuple[str, int, float, float, dict[str, Any]]] = []
+    for quarters in hours.values():
+        prices = [price for _, price, _ in quarters if price is not None]
+        if not prices:
+            continue
+        average = f"{sum(prices) / len(prices):.2f}"
+        average_neg_to_zero = f"{sum(max(0.0, price) for price in prices) / len(prices):.2f}"
+        for end, _, record in quarters:
+            parsed.append(
+                (
+                    record.get("business_date") or "",
+                    end,
+                    float(average),
+                    float(average_neg_to_zero),
+                    {**record, "rce_pln": average, "rce_pln_neg_to_zero": average_neg_to_zero},
+                )
+            )
+    return parsed
+
+
+_EMPTY = PriceSeries(array("q"), array("q"), array("d"), array("d"), (), (), array("l", [0]))
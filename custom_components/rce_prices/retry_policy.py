@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import random
+from typing import Any
+
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_OPEN_DURATION,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class RetryPolicy:
+    """Retry timing and circuit breaker for failing PSE API calls.
+
+    After a failure the next attempt is due after an exponentially growing
+    delay, starting at ``RETRY_BASE_DELAY`` and capped at ``RETRY_MAX_DELAY``,
+    with jitter over the upper half of the delay so several installations do
+    not retry in lockstep. ``BREAKER_FAILURE_THRESHOLD`` consecutive failures
+    open the breaker: no requests are made for ``BREAKER_OPEN_DURATION``,
+    after which a single trial request either closes it again or reopens it.
+    """
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self._rng = rng or random.Random()
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.next_retry: datetime | None = None
+        self.opened_at: datetime | None = None
+
+    def allow_request(self, now: datetime) -> bool:
+        if self.state != BREAKER_OPEN:
+            return True
+        if self.next_retry is not None and now < self.next_retry:
+            return False
+        self.state = BREAKER_HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self.next_retry = None
+        self.opened_at = None
+
+    def record_failure(self, now: datetime) -> timedelta:
+        """Note a failed request and return how long to wait before the next one."""
+        self.consecutive_failures += 1
+        self.total_failures += 1
+
+        if self.state == BREAKER_HALF_OPEN or self.consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+            self.state = BREAKER_OPEN
+            self.opened_at = now
+            delay = BREAKER_OPEN_DURATION
+        else:
+            backoff = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (self.consecutive_failures - 1))
+            delay = backoff * self._rng.uniform(0.5, 1.0)
+
+        self.next_retry = now + delay
+        return delay
+
+    def retry_interval(self, now: datetime) -> timedelta | None:
+        """Return the time left until the next retry is due, if one is pending."""
+        if self.next_retry is None:
+            return None
+        return max(self.next_retry - now, timedelta(0))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "next_retry": self.next_retry.isoformat() if self.next_retry else None,
+            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
+        }
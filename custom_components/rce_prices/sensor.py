@@ -141,5 +141,8 @@ async def async_setup_entry(
     ]
     
     _LOGGER.debug("Adding %d RCE Prices sensors to Home Assistant", len(sensors))
+    coordinator.register_window_queries(
+        entity.window_query for entity in sensors if entity.window_query is not None
+    )
     async_add_entities(sensors)
     _LOGGER.debug("RCE Prices sensors setup completed successfully") 
\ No newline at end of file
@@ -6,8 +6,10 @@ from typing import TYPE_CHECKING
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.util import dt as dt_util
 
+from ..const import CONF_USE_HOURLY_PRICES, DEFAULT_USE_HOURLY_PRICES
 from ..shared_base import RCEBaseCommonEntity
 from ..price_calculator import PriceCalculator
+from ..price_series import datetime_to_wall_clock
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
@@ -18,6 +20,12 @@ class RCEBaseSensor(RCEBaseCommonEntity, SensorEntity):
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator, unique_id: str) -> None:
         super().__init__(coordinator, unique_id)
 
+    def get_price_period(self) -> timedelta:
+        use_hourly_prices = self.coordinator._get_config_value(
+            CONF_USE_HOURLY_PRICES, DEFAULT_USE_HOURLY_PRICES
+        )
+        return timedelta(hours=1) if use_hourly_prices else timedelta(minutes=15)
+
     def get_tomorrow_price_at_time(self, target_time: datetime) -> dict | None:
         tomorrow_data = self.get_tomorrow_data()
         if not tomorrow_data:
@@ -39,67 +47,28 @@ class RCEBaseSensor(RCEBaseCommonEntity, SensorEntity):
         return None
 
     def get_current_price_data(self) -> dict | None:
-        if not self.coordinator.data or not self.coordinator.data.get("raw_data"):
+        series = self.get_series()
+        if not series:
             return None
         
-        now = dt_util.now()
-        
-        for record in self.coordinator.data["raw_data"]:
-            try:
-                period_end = datetime.strptime(record["dtime"], "%Y-%m-%d %H:%M:%S")
-                period_start = period_end - timedelta(minutes=15)
-                
-                if period_start <= now.replace(tzinfo=None) <= period_end:
-                    return record
-                    
-            except (ValueError, KeyError):
-                continue
-        
-        return None
+        index = series.index_at(datetime_to_wall_clock(dt_util.now()))
+        return series[index] if index is not None else None
 
     def get_price_at_future_hour(self, hours_ahead: int) -> float | None:
-        if not self.coordinator.data or not self.coordinator.data.get("raw_data"):
+        series = self.get_series()
+        if not series:
             return None
         
-        target_time = dt_util.now() + timedelta(hours=hours_ahead)
-        
-        for record in self.coordinator.data["raw_data"]:
-            try:
-                period_end = datetime.strptime(record["dtime"], "%Y-%m-%d %H:%M:%S")
-                period_start = period_end - timedelta(minutes=15)
-                
-                if period_start <= target_time.replace(tzinfo=None) <= period_end:
-                    return float(record["rce_pln"])
-                    
-            except (ValueError, KeyError):
-                continue
-        
-        return None
+        index = series.index_at(datetime_to_wall_clock(dt_util.now() + timedelta(hours=hours_ahead)))
+        return series.prices[index] if index is not None else None
 
     def get_price_at_past_hour(self, hours_back: int) -> float | None:
-        if not self.coordinator.data or not self.coordinator.data.get("raw_data"):
+        series = self.get_series()
+        if not series:
             return None
         
-        target_time = dt_util.now() - timedelta(hours=hours_back)
-        closest_record = None
-        closest_diff = None
-        
-        for record in self.coordinator.data["raw_data"]:
-            try:
-                period_end = datetime.strptime(record["dtime"], "%Y-%m-%d %H:%M:%S")
-                period_start = period_end - timedelta(minutes=15)
-                
-                if period_start <= target_time.replace(tzinfo=None) <= period_end:
-                    return float(record["rce_pln"])
-                elif period_end <= target_time.replace(tzinfo=None):
-                    diff = abs((target_time.replace(tzinfo=None) - period_end).total_seconds())
-                    if closest_diff is None or diff < closest_diff:
-                        closest_diff = diff
-                        closest_record = record
-            except (ValueError, KeyError):
-                continue
-        
-        return float(closest_record["rce_pln"]) if closest_record else None
+        index = series.index_at_or_before(datetime_to_wall_clock(dt_util.now() - timedelta(hours=hours_back)))
+        return series.prices[index] if index is not None else None
 
     def get_data_summary(self, data: list[dict]) -> dict[str, any]:
         if not data:
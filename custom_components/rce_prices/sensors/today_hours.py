@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.util import dt as dt_util
 
 from .base import RCEBaseSensor
-from ..const import CONF_MIN_PRICE_WINDOW_QUARTERS, DEFAULT_MIN_PRICE_WINDOW_QUARTERS
+from ..const import CONF_MIN_PRICE_WINDOW_QUARTERS, DATA_KEY_TODAY_STATS, DATA_KEY_TODAY_WINDOWS, DEFAULT_MIN_PRICE_WINDOW_QUARTERS
+from ..price_calculator import WindowQuery
+from ..price_series import PriceSeries
+from ..shared_base import BUSINESS_DATE_KEYS
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
@@ -15,6 +18,8 @@ if TYPE_CHECKING:
 
 class RCETodayHoursSensor(RCEBaseSensor):
 
+    data_keys = frozenset({DATA_KEY_TODAY_STATS, DATA_KEY_TODAY_WINDOWS})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator, unique_id: str) -> None:
         super().__init__(coordinator, unique_id)
         self._attr_icon = "mdi:clock"
@@ -31,28 +36,53 @@ class RCETodayHoursSensor(RCEBaseSensor):
 
         return parsed_duration if parsed_duration > 0 else DEFAULT_MIN_PRICE_WINDOW_QUARTERS
 
-    def _get_min_price_window(self) -> list[dict]:
+    @property
+    def window_query(self) -> WindowQuery:
+        return WindowQuery.min_price_window(self._get_min_price_window_duration_quarters())
+
+    def _get_min_price_window(self) -> PriceSeries:
         today_data = self.get_today_data()
         if not today_data:
-            return []
+            return PriceSeries.empty()
 
-        duration_quarters = self._get_min_price_window_duration_quarters()
-        return self.calculator.find_cheapest_window(today_data, duration_quarters)
+        query = self.window_query
+        windows = self.get_shared_windows(BUSINESS_DATE_KEYS.today, query)
+        if windows is not None:
+            return windows[0] if windows else PriceSeries.empty()
 
-    def _get_window_boundaries(self, window: list[dict]) -> tuple[datetime, datetime] | None:
+        duration_quarters = query.duration_quarters
+        return self.calculate(
+            BUSINESS_DATE_KEYS.today, self.calculator.find_cheapest_window, today_data, duration_quarters
+        )
+
+    def _get_window_boundaries(self, window: PriceSeries) -> tuple[datetime, datetime] | None:
         if not window:
             return None
 
+        return self.calculator.get_window_boundaries(window)
+
+    def _get_extreme_price_period(self, is_max: bool) -> tuple[str, str] | None:
+        statistics = self.get_today_statistics()
+        if not statistics:
+            return None
+
+        first_record, last_record = statistics.max_records if is_max else statistics.min_records
         try:
-            first_dtime = datetime.strptime(window[0]["dtime"], "%Y-%m-%d %H:%M:%S")
-            window_start = first_dtime - timedelta(minutes=15)
+            return first_record["period"].split(" - ")[0], last_record["period"].split(" - ")[1]
+        except (KeyError, IndexError, AttributeError):
+            return None
 
-            last_dtime = datetime.strptime(window[-1]["dtime"], "%Y-%m-%d %H:%M:%S")
-            window_end = last_dtime
-        except (ValueError, KeyError, IndexError):
+    def _get_extreme_price_timestamp(self, is_max: bool, is_start: bool) -> datetime | None:
+        period = self._get_extreme_price_period(is_max)
+        if not period:
             return None
 
-        return window_start, window_end
+        try:
+            time_str = period[0] if is_start else period[1]
+            period_datetime = datetime.strptime(f"{BUSINESS_DATE_KEYS.today} {time_str}", "%Y-%m-%d %H:%M")
+            return dt_util.as_local(period_datetime)
+        except ValueError:
+            return None
 
 
 class RCETodayMaxPriceHourStartSensor(RCETodayHoursSensor):
@@ -62,12 +92,8 @@ class RCETodayMaxPriceHourStartSensor(RCETodayHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        today_data = self.get_today_data()
-        if not today_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(today_data, is_max=True)
-        return max_price_records[0]["period"].split(" - ")[0] if max_price_records else None
+        period = self._get_extreme_price_period(is_max=True)
+        return period[0] if period else None
 
 
 class RCETodayMaxPriceHourEndSensor(RCETodayHoursSensor):
@@ -77,12 +103,8 @@ class RCETodayMaxPriceHourEndSensor(RCETodayHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        today_data = self.get_today_data()
-        if not today_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(today_data, is_max=True)
-        return max_price_records[-1]["period"].split(" - ")[1] if max_price_records else None
+        period = self._get_extreme_price_period(is_max=True)
+        return period[1] if period else None
 
 
 class RCETodayMinPriceHourStartSensor(RCETodayHoursSensor):
@@ -92,12 +114,8 @@ class RCETodayMinPriceHourStartSensor(RCETodayHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        today_data = self.get_today_data()
-        if not today_data:
-            return None
-        
-        min_price_records = self.calculator.find_extreme_price_records(today_data, is_max=False)
-        return min_price_records[0]["period"].split(" - ")[0] if min_price_records else None
+        period = self._get_extreme_price_period(is_max=False)
+        return period[0] if period else None
 
 
 class RCETodayMinPriceHourEndSensor(RCETodayHoursSensor):
@@ -107,12 +125,8 @@ class RCETodayMinPriceHourEndSensor(RCETodayHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        today_data = self.get_today_data()
-        if not today_data:
-            return None
-        
-        min_price_records = self.calculator.find_extreme_price_records(today_data, is_max=False)
-        return min_price_records[-1]["period"].split(" - ")[1] if min_price_records else None
+        period = self._get_extreme_price_period(is_max=False)
+        return period[1] if period else None
 
 
 class RCETodayMaxPriceHourStartTimestampSensor(RCETodayHoursSensor):
@@ -124,22 +138,7 @@ class RCETodayMaxPriceHourStartTimestampSensor(RCETodayHoursSensor):
 
     @property
     def native_value(self) -> datetime | None:
-        today_data = self.get_today_data()
-        if not today_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(today_data, is_max=True)
-        if not max_price_records:
-            return None
-        
-        try:
-            start_time_str = max_price_records[0]["period"].split(" - ")[0]
-            today_str = dt_util.now().strftime("%Y-%m-%d")
-            datetime_str = f"{today_str} {start_time_str}:00"
-            start_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            return dt_util.as_local(start_datetime)
-        except (ValueError, KeyError, IndexError):
-            return None
+        return self._get_extreme_price_timestamp(is_max=True, is_start=True)
 
 
 class RCETodayMaxPriceHourEndTimestampSensor(RCETodayHoursSensor):
@@ -151,22 +150,7 @@ class RCETodayMaxPriceHourEndTimestampSensor(RCETodayHoursSensor):
 
     @property
     def native_value(self) -> datetime | None:
-        today_data = self.get_today_data()
-        if not today_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(today_data, is_max=True)
-        if not max_price_records:
-            return None
-        
-        try:
-            end_time_str = max_price_records[-1]["period"].split(" - ")[1]
-            today_str = dt_util.now().strftime("%Y-%m-%d")
-            datetime_str = f"{today_str} {end_time_str}:00"
-            end_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            return dt_util.as_local(end_datetime)
-        except (ValueError, KeyError, IndexError):
-            return None
+        return self._get_extreme_price_timestamp(is_max=True, is_start=False)
 
 
 class RCETodayMinPriceHourStartTimestampSensor(RCETodayHoursSensor):
@@ -178,22 +162,7 @@ class RCETodayMinPriceHourStartTimestampSensor(RCETodayHoursSensor):
 
     @property
     def native_value(self) -> datetime | None:
-        today_data = self.get_today_data()
-        if not today_data:
-            return None
-        
-        min_price_records = self.calculator.find_extreme_price_records(today_data, is_max=False)
-        if not min_price_records:
-            return None
-        
-        try:
-            start_time_str = min_price_records[0]["period"].split(" - ")[0]
-            today_str = dt_util.now().strftime("%Y-%m-%d")
-            datetime_str = f"{today_str} {start_time_str}:00"
-            start_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            return dt_util.as_local(start_datetime)
-        except (ValueError, KeyError, IndexError):
-            return None
+        return self._get_extreme_price_timestamp(is_max=False, is_start=True)
 
 
 class RCETodayMinPriceHourEndTimestampSensor(RCETodayHoursSensor):
@@ -205,22 +174,7 @@ class RCETodayMinPriceHourEndTimestampSensor(RCETodayHoursSensor):
 
     @property
     def native_value(self) -> datetime | None:
-        today_data = self.get_today_data()
-        if not today_data:
-            return None
-        
-        min_price_records = self.calculator.find_extreme_price_records(today_data, is_max=False)
-        if not min_price_records:
-            return None
-        
-        try:
-            end_time_str = min_price_records[-1]["period"].split(" - ")[1]
-            today_str = dt_util.now().strftime("%Y-%m-%d")
-            datetime_str = f"{today_str} {end_time_str}:00"
-            end_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            return dt_util.as_local(end_datetime)
-        except (ValueError, KeyError, IndexError):
-            return None
+        return self._get_extreme_price_timestamp(is_max=False, is_start=False)
 
 
 class RCETodayMaxPriceRangeSensor(RCETodayHoursSensor):
@@ -231,16 +185,11 @@ class RCETodayMaxPriceRangeSensor(RCETodayHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        today_data = self.get_today_data()
-        if not today_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(today_data, is_max=True)
-        if not max_price_records:
+        period = self._get_extreme_price_period(is_max=True)
+        if not period:
             return None
-            
-        start_time = max_price_records[0]["period"].split(" - ")[0]
-        end_time = max_price_records[-1]["period"].split(" - ")[1]
+
+        start_time, end_time = period
         return f"{start_time} - {end_time}" 
 
 
@@ -258,7 +207,7 @@ class RCETodayMinPriceWindowAvgPriceSensor(RCETodayHoursSensor):
             return None
 
         try:
-            window_prices = [float(record["rce_pln"]) for record in window]
+            window_prices = self.calculator.get_prices_from_data(window)
             return round(sum(window_prices) / len(window_prices), 2)
         except (ValueError, KeyError):
             return None
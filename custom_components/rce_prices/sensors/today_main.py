@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime
 from typing import Any, TYPE_CHECKING
 
 from .base import RCEBaseSensor
+from ..const import DATA_KEY_CURRENT_QUARTER, DATA_KEY_FRESHNESS, DATA_KEY_TODAY_PRICES, PRICE_ATTRIBUTE_KEYS
+from ..shared_base import BUSINESS_DATE_KEYS, next_boundary
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
@@ -11,18 +13,16 @@ if TYPE_CHECKING:
 
 class RCETodayMainSensor(RCEBaseSensor):
 
+    data_keys = frozenset({DATA_KEY_CURRENT_QUARTER, DATA_KEY_FRESHNESS, DATA_KEY_TODAY_PRICES})
+    _unrecorded_attributes = frozenset({"prices"})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator) -> None:
         super().__init__(coordinator, "today_price")
         self._attr_native_unit_of_measurement = "PLN/MWh"
         self._attr_icon = "mdi:cash"
 
-    @property
-    def should_poll(self) -> bool:
-        return True
-
-    @property
-    def scan_interval(self) -> timedelta:
-        return timedelta(minutes=1)
+    def _next_update_time(self, now: datetime) -> datetime:
+        return next_boundary(now, self.get_price_period())
 
     @property
     def native_value(self) -> float | None:
@@ -34,16 +34,18 @@ class RCETodayMainSensor(RCEBaseSensor):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         today_data = self.get_today_data()
-        excluded_keys = {"rce_pln_neg_to_zero", "publication_ts"}
-        sanitized_today_data = [
-            {k: v for k, v in record.items() if k not in excluded_keys}
-            for record in today_data
-        ]
+        today_prices = self.calculate(
+            BUSINESS_DATE_KEYS.today,
+            self.calculator.price_columns,
+            today_data,
+            PRICE_ATTRIBUTE_KEYS,
+        )
         
         attributes = {
             "last_update": self.coordinator.data.get("last_update") if self.coordinator.data else None,
             "data_points": len(today_data),
-            "prices": sanitized_today_data,
+            "prices": today_prices,
+            **self.get_day_freshness(BUSINESS_DATE_KEYS.today),
         }
         
         return attributes
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from .base import RCEBaseSensor
+from ..const import DATA_KEY_CURRENT_QUARTER, DATA_KEY_TODAY_STATS
+from ..shared_base import next_boundary
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
@@ -10,6 +13,8 @@ if TYPE_CHECKING:
 
 class RCETodayStatsSensor(RCEBaseSensor):
 
+    data_keys = frozenset({DATA_KEY_TODAY_STATS})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator, unique_id: str, unit: str = "PLN/MWh", icon: str = "mdi:cash") -> None:
         super().__init__(coordinator, unique_id)
         self._attr_native_unit_of_measurement = unit
@@ -23,12 +28,11 @@ class RCETodayAvgPriceSensor(RCETodayStatsSensor):
 
     @property
     def native_value(self) -> float | None:
-        today_data = self.get_today_data()
-        if not today_data:
+        statistics = self.get_today_statistics()
+        if not statistics:
             return None
         
-        prices = self.calculator.get_prices_from_data(today_data)
-        return round(self.calculator.calculate_average(prices), 2)
+        return round(statistics.mean, 2)
 
 
 class RCETodayMaxPriceSensor(RCETodayStatsSensor):
@@ -38,12 +42,11 @@ class RCETodayMaxPriceSensor(RCETodayStatsSensor):
 
     @property
     def native_value(self) -> float | None:
-        today_data = self.get_today_data()
-        if not today_data:
+        statistics = self.get_today_statistics()
+        if not statistics:
             return None
         
-        prices = self.calculator.get_prices_from_data(today_data)
-        return max(prices) if prices else None
+        return statistics.max
 
 
 class RCETodayMinPriceSensor(RCETodayStatsSensor):
@@ -53,12 +56,11 @@ class RCETodayMinPriceSensor(RCETodayStatsSensor):
 
     @property
     def native_value(self) -> float | None:
-        today_data = self.get_today_data()
-        if not today_data:
+        statistics = self.get_today_statistics()
+        if not statistics:
             return None
 
-        min_price_records = self.calculator.find_extreme_price_records(today_data, is_max=False)
-        return float(min_price_records[0]["rce_pln"]) if min_price_records else None
+        return statistics.min
 
 
 class RCETodayMedianPriceSensor(RCETodayStatsSensor):
@@ -68,30 +70,32 @@ class RCETodayMedianPriceSensor(RCETodayStatsSensor):
 
     @property
     def native_value(self) -> float | None:
-        today_data = self.get_today_data()
-        if not today_data:
+        statistics = self.get_today_statistics()
+        if not statistics:
             return None
         
-        prices = self.calculator.get_prices_from_data(today_data)
-        return round(self.calculator.calculate_median(prices), 2)
+        return round(statistics.median, 2)
 
 
 class RCETodayCurrentVsAverageSensor(RCETodayStatsSensor):
 
+    data_keys = frozenset({DATA_KEY_CURRENT_QUARTER, DATA_KEY_TODAY_STATS})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator) -> None:
         super().__init__(coordinator, "today_current_vs_average", "%", "mdi:percent")
 
+    def _next_update_time(self, now: datetime) -> datetime:
+        return next_boundary(now, self.get_price_period())
+
     @property
     def native_value(self) -> float | None:
         current_data = self.get_current_price_data()
-        today_data = self.get_today_data()
+        statistics = self.get_today_statistics()
         
-        if not current_data or not today_data:
+        if not current_data or not statistics:
             return None
         
         current_price = float(current_data["rce_pln"])
-        prices = self.calculator.get_prices_from_data(today_data)
-        avg_price = self.calculator.calculate_average(prices)
         
-        percentage = self.calculator.calculate_percentage_difference(current_price, avg_price)
+        percentage = self.calculator.calculate_percentage_difference(current_price, statistics.mean)
         return round(percentage, 1) 
\ No newline at end of file
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import SensorDeviceClass
@@ -9,11 +9,16 @@ from homeassistant.util import dt as dt_util
 from .base import RCEBaseSensor
 from ..const import (
     BEST_WINDOW_DURATION_HOURS,
+    BEST_WINDOW_RANKS,
+    DATA_KEY_TOMORROW_WINDOWS,
     EVENING_BEST_WINDOW_END_HOUR,
     EVENING_BEST_WINDOW_START_HOUR,
     MORNING_BEST_WINDOW_END_HOUR,
     MORNING_BEST_WINDOW_START_HOUR,
 )
+from ..price_calculator import WindowQuery
+from ..price_series import PriceSeries
+from ..shared_base import BUSINESS_DATE_KEYS
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
@@ -22,6 +27,8 @@ if TYPE_CHECKING:
 class RCETomorrowBestWindowSensor(RCEBaseSensor):
     """Base sensor for tomorrow best window calculations."""
 
+    data_keys = frozenset({DATA_KEY_TOMORROW_WINDOWS})
+
     def __init__(
         self,
         coordinator: RCEPSEDataUpdateCoordinator,
@@ -40,34 +47,49 @@ class RCETomorrowBestWindowSensor(RCEBaseSensor):
     def available(self) -> bool:
         return super().available and self.is_tomorrow_data_available()
 
-    def _get_window(self) -> list[dict] | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-
-        windows = self.calculator.find_top_windows(
-            tomorrow_data,
+    @property
+    def window_query(self) -> WindowQuery:
+        return WindowQuery(
             self._window_start_hour,
             self._window_end_hour,
-            BEST_WINDOW_DURATION_HOURS,
-            top_n=self._window_rank + 1,
+            BEST_WINDOW_DURATION_HOURS * 4,
             is_max=True,
+            top_n=max(BEST_WINDOW_RANKS, self._window_rank + 1),
+            full_hour_start=True,
             distinct_start_hour=True,
         )
 
+    def _get_window(self) -> PriceSeries | None:
+        tomorrow_data = self.get_tomorrow_data()
+        if not tomorrow_data:
+            return None
+
+        windows = self.get_shared_windows(BUSINESS_DATE_KEYS.tomorrow, self.window_query)
+        if windows is None:
+            windows = self.calculate(
+                BUSINESS_DATE_KEYS.tomorrow,
+                self.calculator.find_top_windows,
+                tomorrow_data,
+                self._window_start_hour,
+                self._window_end_hour,
+                BEST_WINDOW_DURATION_HOURS,
+                top_n=self._window_rank + 1,
+                is_max=True,
+                distinct_start_hour=True,
+            )
+
         if len(windows) <= self._window_rank:
             return None
 
         return windows[self._window_rank]
 
-    def _get_window_start(self, window: list[dict]) -> datetime | None:
-        try:
-            first_period_end = datetime.strptime(window[0]["dtime"], "%Y-%m-%d %H:%M:%S")
-            window_start = first_period_end - timedelta(minutes=15)
-            return dt_util.as_local(window_start)
-        except (ValueError, KeyError, IndexError):
+    def _get_window_start(self, window: PriceSeries) -> datetime | None:
+        boundaries = self.calculator.get_window_boundaries(window)
+        if not boundaries:
             return None
 
+        return dt_util.as_local(boundaries[0])
+
 
 class RCETomorrowBestWindowPriceSensor(RCETomorrowBestWindowSensor):
     """Base sensor for tomorrow best window price outputs."""
@@ -92,7 +114,7 @@ class RCETomorrowBestWindowPriceSensor(RCETomorrowBestWindowSensor):
             return None
 
         try:
-            prices = [float(record["rce_pln"]) for record in window]
+            prices = self.calculator.get_prices_from_data(window)
         except (ValueError, KeyError):
             return None
 
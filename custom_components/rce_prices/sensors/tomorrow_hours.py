@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.util import dt as dt_util
 
 from .base import RCEBaseSensor
-from ..const import CONF_MIN_PRICE_WINDOW_QUARTERS, DEFAULT_MIN_PRICE_WINDOW_QUARTERS
+from ..const import CONF_MIN_PRICE_WINDOW_QUARTERS, DATA_KEY_TOMORROW_STATS, DATA_KEY_TOMORROW_WINDOWS, DEFAULT_MIN_PRICE_WINDOW_QUARTERS
+from ..price_calculator import WindowQuery
+from ..price_series import PriceSeries
+from ..shared_base import BUSINESS_DATE_KEYS
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
@@ -15,6 +18,8 @@ if TYPE_CHECKING:
 
 class RCETomorrowHoursSensor(RCEBaseSensor):
 
+    data_keys = frozenset({DATA_KEY_TOMORROW_STATS, DATA_KEY_TOMORROW_WINDOWS})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator, unique_id: str) -> None:
         super().__init__(coordinator, unique_id)
         self._attr_icon = "mdi:clock"
@@ -35,28 +40,53 @@ class RCETomorrowHoursSensor(RCEBaseSensor):
 
         return parsed_duration if parsed_duration > 0 else DEFAULT_MIN_PRICE_WINDOW_QUARTERS
 
-    def _get_min_price_window(self) -> list[dict]:
+    @property
+    def window_query(self) -> WindowQuery:
+        return WindowQuery.min_price_window(self._get_min_price_window_duration_quarters())
+
+    def _get_min_price_window(self) -> PriceSeries:
         tomorrow_data = self.get_tomorrow_data()
         if not tomorrow_data:
-            return []
+            return PriceSeries.empty()
 
-        duration_quarters = self._get_min_price_window_duration_quarters()
-        return self.calculator.find_cheapest_window(tomorrow_data, duration_quarters)
+        query = self.window_query
+        windows = self.get_shared_windows(BUSINESS_DATE_KEYS.tomorrow, query)
+        if windows is not None:
+            return windows[0] if windows else PriceSeries.empty()
 
-    def _get_window_boundaries(self, window: list[dict]) -> tuple[datetime, datetime] | None:
+        duration_quarters = query.duration_quarters
+        return self.calculate(
+            BUSINESS_DATE_KEYS.tomorrow, self.calculator.find_cheapest_window, tomorrow_data, duration_quarters
+        )
+
+    def _get_window_boundaries(self, window: PriceSeries) -> tuple[datetime, datetime] | None:
         if not window:
             return None
 
+        return self.calculator.get_window_boundaries(window)
+
+    def _get_extreme_price_period(self, is_max: bool) -> tuple[str, str] | None:
+        statistics = self.get_tomorrow_statistics()
+        if not statistics:
+            return None
+
+        first_record, last_record = statistics.max_records if is_max else statistics.min_records
         try:
-            first_dtime = datetime.strptime(window[0]["dtime"], "%Y-%m-%d %H:%M:%S")
-            window_start = first_dtime - timedelta(minutes=15)
+            return first_record["period"].split(" - ")[0], last_record["period"].split(" - ")[1]
+        except (KeyError, IndexError, AttributeError):
+            return None
 
-            last_dtime = datetime.strptime(window[-1]["dtime"], "%Y-%m-%d %H:%M:%S")
-            window_end = last_dtime
-        except (ValueError, KeyError, IndexError):
+    def _get_extreme_price_timestamp(self, is_max: bool, is_start: bool) -> datetime | None:
+        period = self._get_extreme_price_period(is_max)
+        if not period:
             return None
 
-        return window_start, window_end
+        try:
+            time_str = period[0] if is_start else period[1]
+            period_datetime = datetime.strptime(f"{BUSINESS_DATE_KEYS.tomorrow} {time_str}", "%Y-%m-%d %H:%M")
+            return dt_util.as_local(period_datetime)
+        except ValueError:
+            return None
 
 
 class RCETomorrowMaxPriceHourStartSensor(RCETomorrowHoursSensor):
@@ -66,12 +96,8 @@ class RCETomorrowMaxPriceHourStartSensor(RCETomorrowHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=True)
-        return max_price_records[0]["period"].split(" - ")[0] if max_price_records else None
+        period = self._get_extreme_price_period(is_max=True)
+        return period[0] if period else None
 
 
 class RCETomorrowMaxPriceHourEndSensor(RCETomorrowHoursSensor):
@@ -81,12 +107,8 @@ class RCETomorrowMaxPriceHourEndSensor(RCETomorrowHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=True)
-        return max_price_records[-1]["period"].split(" - ")[1] if max_price_records else None
+        period = self._get_extreme_price_period(is_max=True)
+        return period[1] if period else None
 
 
 class RCETomorrowMinPriceHourStartSensor(RCETomorrowHoursSensor):
@@ -96,12 +118,8 @@ class RCETomorrowMinPriceHourStartSensor(RCETomorrowHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-        
-        min_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=False)
-        return min_price_records[0]["period"].split(" - ")[0] if min_price_records else None
+        period = self._get_extreme_price_period(is_max=False)
+        return period[0] if period else None
 
 
 class RCETomorrowMinPriceHourEndSensor(RCETomorrowHoursSensor):
@@ -111,12 +129,8 @@ class RCETomorrowMinPriceHourEndSensor(RCETomorrowHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-        
-        min_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=False)
-        return min_price_records[-1]["period"].split(" - ")[1] if min_price_records else None
+        period = self._get_extreme_price_period(is_max=False)
+        return period[1] if period else None
 
 
 class RCETomorrowMaxPriceHourStartTimestampSensor(RCETomorrowHoursSensor):
@@ -128,22 +142,7 @@ class RCETomorrowMaxPriceHourStartTimestampSensor(RCETomorrowHoursSensor):
 
     @property
     def native_value(self) -> datetime | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=True)
-        if not max_price_records:
-            return None
-        
-        try:
-            start_time_str = max_price_records[0]["period"].split(" - ")[0]
-            tomorrow_str = (dt_util.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-            datetime_str = f"{tomorrow_str} {start_time_str}:00"
-            start_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            return dt_util.as_local(start_datetime)
-        except (ValueError, KeyError, IndexError):
-            return None
+        return self._get_extreme_price_timestamp(is_max=True, is_start=True)
 
 
 class RCETomorrowMaxPriceHourEndTimestampSensor(RCETomorrowHoursSensor):
@@ -155,22 +154,7 @@ class RCETomorrowMaxPriceHourEndTimestampSensor(RCETomorrowHoursSensor):
 
     @property
     def native_value(self) -> datetime | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=True)
-        if not max_price_records:
-            return None
-        
-        try:
-            end_time_str = max_price_records[-1]["period"].split(" - ")[1]
-            tomorrow_str = (dt_util.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-            datetime_str = f"{tomorrow_str} {end_time_str}:00"
-            end_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            return dt_util.as_local(end_datetime)
-        except (ValueError, KeyError, IndexError):
-            return None
+        return self._get_extreme_price_timestamp(is_max=True, is_start=False)
 
 
 class RCETomorrowMinPriceHourStartTimestampSensor(RCETomorrowHoursSensor):
@@ -182,22 +166,7 @@ class RCETomorrowMinPriceHourStartTimestampSensor(RCETomorrowHoursSensor):
 
     @property
     def native_value(self) -> datetime | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-        
-        min_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=False)
-        if not min_price_records:
-            return None
-        
-        try:
-            start_time_str = min_price_records[0]["period"].split(" - ")[0]
-            tomorrow_str = (dt_util.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-            datetime_str = f"{tomorrow_str} {start_time_str}:00"
-            start_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            return dt_util.as_local(start_datetime)
-        except (ValueError, KeyError, IndexError):
-            return None
+        return self._get_extreme_price_timestamp(is_max=False, is_start=True)
 
 
 class RCETomorrowMinPriceHourEndTimestampSensor(RCETomorrowHoursSensor):
@@ -209,22 +178,7 @@ class RCETomorrowMinPriceHourEndTimestampSensor(RCETomorrowHoursSensor):
 
     @property
     def native_value(self) -> datetime | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-        
-        min_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=False)
-        if not min_price_records:
-            return None
-        
-        try:
-            end_time_str = min_price_records[-1]["period"].split(" - ")[1]
-            tomorrow_str = (dt_util.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-            datetime_str = f"{tomorrow_str} {end_time_str}:00"
-            end_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            return dt_util.as_local(end_datetime)
-        except (ValueError, KeyError, IndexError):
-            return None
+        return self._get_extreme_price_timestamp(is_max=False, is_start=False)
 
 
 class RCETomorrowMaxPriceRangeSensor(RCETomorrowHoursSensor):
@@ -235,16 +189,11 @@ class RCETomorrowMaxPriceRangeSensor(RCETomorrowHoursSensor):
 
     @property
     def native_value(self) -> str | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
-            return None
-        
-        max_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=True)
-        if not max_price_records:
+        period = self._get_extreme_price_period(is_max=True)
+        if not period:
             return None
-            
-        start_time = max_price_records[0]["period"].split(" - ")[0]
-        end_time = max_price_records[-1]["period"].split(" - ")[1]
+
+        start_time, end_time = period
         return f"{start_time} - {end_time}" 
 
 
@@ -262,7 +211,7 @@ class RCETomorrowMinPriceWindowAvgPriceSensor(RCETomorrowHoursSensor):
             return None
 
         try:
-            window_prices = [float(record["rce_pln"]) for record in window]
+            window_prices = self.calculator.get_prices_from_data(window)
             return round(sum(window_prices) / len(window_prices), 2)
         except (ValueError, KeyError):
             return None
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime
 from typing import Any, TYPE_CHECKING
 
 from homeassistant.util import dt as dt_util
 
 from .base import RCEBaseSensor
+from ..const import DATA_KEY_FRESHNESS, DATA_KEY_TOMORROW_PRICES, PRICE_ATTRIBUTE_KEYS
+from ..shared_base import BUSINESS_DATE_KEYS, next_boundary
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
@@ -13,6 +15,9 @@ if TYPE_CHECKING:
 
 class RCETomorrowMainSensor(RCEBaseSensor):
 
+    data_keys = frozenset({DATA_KEY_FRESHNESS, DATA_KEY_TOMORROW_PRICES})
+    _unrecorded_attributes = frozenset({"prices"})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator) -> None:
         super().__init__(coordinator, "tomorrow_price")
         self._attr_native_unit_of_measurement = "PLN/MWh"
@@ -22,13 +27,8 @@ class RCETomorrowMainSensor(RCEBaseSensor):
     def available(self) -> bool:
         return super().available and self.is_tomorrow_data_available()
 
-    @property
-    def should_poll(self) -> bool:
-        return True
-
-    @property
-    def scan_interval(self) -> timedelta:
-        return timedelta(minutes=1)
+    def _next_update_time(self, now: datetime) -> datetime:
+        return next_boundary(now, self.get_price_period())
 
     @property
     def native_value(self) -> float | None:
@@ -48,7 +48,7 @@ class RCETomorrowMainSensor(RCEBaseSensor):
                 "available_after": "14:00 CET",
                 "status": "Data not available yet",
                 "data_points": 0,
-                "prices": [],
+                "prices": self.calculator.price_columns((), PRICE_ATTRIBUTE_KEYS),
                 "current_hour": now.hour,
                 "current_minute": now.minute,
                 "current_time": now.isoformat(),
@@ -57,23 +57,25 @@ class RCETomorrowMainSensor(RCEBaseSensor):
         now = dt_util.now()
         current_hour = now.hour
         tomorrow_data = self.get_tomorrow_data()
-        excluded_keys = {"rce_pln_neg_to_zero", "publication_ts"}
-        sanitized_tomorrow_data = [
-            {k: v for k, v in record.items() if k not in excluded_keys}
-            for record in tomorrow_data
-        ]
+        tomorrow_prices = self.calculate(
+            BUSINESS_DATE_KEYS.tomorrow,
+            self.calculator.price_columns,
+            tomorrow_data,
+            PRICE_ATTRIBUTE_KEYS,
+        )
         tomorrow_price_record = self.get_tomorrow_price_at_time(now)
         
         attributes = {
             "last_update": self.coordinator.data.get("last_update") if self.coordinator.data else None,
             "data_points": len(tomorrow_data),
-            "prices": sanitized_tomorrow_data,
+            "prices": tomorrow_prices,
             "available_after": "14:00 CET",
             "status": "Available",
             "current_hour": current_hour,
             "current_minute": now.minute,
             "current_time": now.isoformat(),
             "tomorrow_price_for_hour": tomorrow_price_record,
+            **self.get_day_freshness(BUSINESS_DATE_KEYS.tomorrow),
         }
         
         return attributes 
\ No newline at end of file
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .base import RCEBaseSensor
+from ..const import DATA_KEY_TODAY_STATS, DATA_KEY_TOMORROW_STATS
 
 if TYPE_CHECKING:
     from ..coordinator import RCEPSEDataUpdateCoordinator
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
 
 class RCETomorrowStatsSensor(RCEBaseSensor):
 
+    data_keys = frozenset({DATA_KEY_TOMORROW_STATS})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator, unique_id: str, unit: str = "PLN/MWh", icon: str = "mdi:cash") -> None:
         super().__init__(coordinator, unique_id)
         self._attr_native_unit_of_measurement = unit
@@ -27,12 +30,11 @@ class RCETomorrowAvgPriceSensor(RCETomorrowStatsSensor):
 
     @property
     def native_value(self) -> float | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
+        statistics = self.get_tomorrow_statistics()
+        if not statistics:
             return None
         
-        prices = self.calculator.get_prices_from_data(tomorrow_data)
-        return round(self.calculator.calculate_average(prices), 2)
+        return round(statistics.mean, 2)
 
 
 class RCETomorrowMaxPriceSensor(RCETomorrowStatsSensor):
@@ -42,12 +44,11 @@ class RCETomorrowMaxPriceSensor(RCETomorrowStatsSensor):
 
     @property
     def native_value(self) -> float | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
+        statistics = self.get_tomorrow_statistics()
+        if not statistics:
             return None
         
-        prices = self.calculator.get_prices_from_data(tomorrow_data)
-        return max(prices) if prices else None
+        return statistics.max
 
 
 class RCETomorrowMinPriceSensor(RCETomorrowStatsSensor):
@@ -57,12 +58,11 @@ class RCETomorrowMinPriceSensor(RCETomorrowStatsSensor):
 
     @property
     def native_value(self) -> float | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
+        statistics = self.get_tomorrow_statistics()
+        if not statistics:
             return None
 
-        min_price_records = self.calculator.find_extreme_price_records(tomorrow_data, is_max=False)
-        return float(min_price_records[0]["rce_pln"]) if min_price_records else None
+        return statistics.min
 
 
 class RCETomorrowMedianPriceSensor(RCETomorrowStatsSensor):
@@ -72,32 +72,29 @@ class RCETomorrowMedianPriceSensor(RCETomorrowStatsSensor):
 
     @property
     def native_value(self) -> float | None:
-        tomorrow_data = self.get_tomorrow_data()
-        if not tomorrow_data:
+        statistics = self.get_tomorrow_statistics()
+        if not statistics:
             return None
         
-        prices = self.calculator.get_prices_from_data(tomorrow_data)
-        return round(self.calculator.calculate_median(prices), 2)
+        return round(statistics.median, 2)
 
 
 class RCETomorrowTodayAvgComparisonSensor(RCETomorrowStatsSensor):
 
+    data_keys = frozenset({DATA_KEY_TODAY_STATS, DATA_KEY_TOMORROW_STATS})
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator) -> None:
         super().__init__(coordinator, "tomorrow_vs_today_avg", "%", "mdi:percent")
 
     @property
     def native_value(self) -> float | None:
-        tomorrow_data = self.get_tomorrow_data()
-        today_data = self.get_today_data()
+        tomorrow_statistics = self.get_tomorrow_statistics()
+        today_statistics = self.get_today_statistics()
         
-        if not tomorrow_data or not today_data:
+        if not tomorrow_statistics or not today_statistics:
             return None
         
-        tomorrow_prices = self.calculator.get_prices_from_data(tomorrow_data)
-        today_prices = self.calculator.get_prices_from_data(today_data)
-        
-        tomorrow_avg = self.calculator.calculate_average(tomorrow_prices)
-        today_avg = self.calculator.calculate_average(today_prices)
-        
-        percentage = self.calculator.calculate_percentage_difference(tomorrow_avg, today_avg)
+        percentage = self.calculator.calculate_percentage_difference(
+            tomorrow_statistics.mean, today_statistics.mean
+        )
         return round(percentage, 1) 
\ No newline at end of file
@@ -1,24 +1,122 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, MANUFACTURER
-from .price_calculator import PriceCalculator
+from .const import ALL_DATA_KEYS, DOMAIN, MANUFACTURER
+from .day_statistics import DayStatistics
+from .price_calculator import PriceCalculator, WindowQuery
+from .price_series import PriceSeries
 
 if TYPE_CHECKING:
     from .coordinator import RCEPSEDataUpdateCoordinator
 
+_T = TypeVar("_T")
+
+
+class BusinessDateKeys:
+    """Today/tomorrow ``business_date`` keys, recomputed only when the local day changes."""
+
+    def __init__(self) -> None:
+        self._valid_from = 0.0
+        self._valid_until = 0.0
+        self._time_zone = None
+        self._today = ""
+        self._tomorrow = ""
+
+    def _refresh(self) -> None:
+        now = dt_util.now()
+        tomorrow_start = dt_util.start_of_local_day(now + timedelta(days=1))
+        self._today = now.strftime("%Y-%m-%d")
+        self._tomorrow = tomorrow_start.strftime("%Y-%m-%d")
+        self._valid_from = dt_util.start_of_local_day(now).timestamp()
+        self._valid_until = tomorrow_start.timestamp()
+        self._time_zone = dt_util.DEFAULT_TIME_ZONE
+
+    def _ensure_current(self) -> None:
+        # The clock may also move backwards, and the HA time zone can change at runtime.
+        timestamp = dt_util.utcnow().timestamp()
+        if not self._valid_from <= timestamp < self._valid_until or self._time_zone is not dt_util.DEFAULT_TIME_ZONE:
+            self._refresh()
+
+    @property
+    def today(self) -> str:
+        self._ensure_current()
+        return self._today
+
+    @property
+    def tomorrow(self) -> str:
+        self._ensure_current()
+        return self._tomorrow
+
+
+BUSINESS_DATE_KEYS = BusinessDateKeys()
+
+
+def next_boundary(now: datetime, step: timedelta) -> datetime:
+    """Return the first multiple of ``step`` (counted in UTC) strictly after ``now``.
+
+    Polish time is a whole-hour offset from UTC, so quarter and hour
+    boundaries line up with local ones across DST changes too.
+    """
+    step_seconds = step.total_seconds()
+    return dt_util.utc_from_timestamp((now.timestamp() // step_seconds + 1) * step_seconds)
+
+
 class RCEBaseCommonEntity(CoordinatorEntity):
+    # Derived data keys this entity reads; it is only woken by coordinator
+    # updates that change one of them.
+    data_keys: frozenset[str] = ALL_DATA_KEYS
+
     def __init__(self, coordinator: RCEPSEDataUpdateCoordinator, unique_id: str) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=self.data_keys)
         self._attr_unique_id = f"rce_prices_{unique_id}"
         self._attr_has_entity_name = True
         self._attr_translation_key = f"rce_prices_{unique_id}"
         self.calculator = PriceCalculator()
+        self._unsub_scheduled_update: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._schedule_next_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel_scheduled_update()
+        await super().async_will_remove_from_hass()
+
+    def _next_update_time(self, now: datetime) -> datetime | None:
+        """Return when the state changes next without new coordinator data.
+
+        Entities that only change on coordinator updates return None and are
+        never woken up in between.
+        """
+        return None
+
+    def _schedule_next_update(self) -> None:
+        self._cancel_scheduled_update()
+        next_update = self._next_update_time(dt_util.utcnow())
+        if next_update is None:
+            return
+        self._unsub_scheduled_update = async_track_point_in_utc_time(
+            self.hass, self._handle_scheduled_update, next_update
+        )
+
+    def _cancel_scheduled_update(self) -> None:
+        if self._unsub_scheduled_update is not None:
+            self._unsub_scheduled_update()
+            self._unsub_scheduled_update = None
+
+    @callback
+    def _handle_scheduled_update(self, now: datetime) -> None:
+        self._unsub_scheduled_update = None
+        self.async_write_ha_state()
+        self._schedule_next_update()
 
     @property
     def device_info(self):
@@ -30,25 +128,82 @@ class RCEBaseCommonEntity(CoordinatorEntity):
             "manufacturer": MANUFACTURER,
         }
 
-    def get_today_data(self) -> list[dict]:
-        if not self.coordinator.data or not self.coordinator.data.get("raw_data"):
-            return []
-        today = dt_util.now().strftime("%Y-%m-%d")
-        return [
-            record for record in self.coordinator.data["raw_data"]
-            if record.get("business_date") == today
-        ]
+    def get_series(self) -> PriceSeries | None:
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get("series")
+
+    def get_today_data(self) -> PriceSeries:
+        series = self.get_series()
+        if not series:
+            return PriceSeries.empty()
+        return series.for_date(BUSINESS_DATE_KEYS.today)
 
-    def get_tomorrow_data(self) -> list[dict]:
+    def get_tomorrow_data(self) -> PriceSeries:
         if not self.is_tomorrow_data_available():
-            return []
-        if not self.coordinator.data or not self.coordinator.data.get("raw_data"):
-            return []
-        tomorrow = (dt_util.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-        return [
-            record for record in self.coordinator.data["raw_data"]
-            if record.get("business_date") == tomorrow
-        ]
+            return PriceSeries.empty()
+        series = self.get_series()
+        if not series:
+            return PriceSeries.empty()
+        return series.for_date(BUSINESS_DATE_KEYS.tomorrow)
+
+    def _get_day_statistics(
+        self, business_date: str, day_data: PriceSeries
+    ) -> DayStatistics | None:
+        if not day_data:
+            return None
+        statistics = self.coordinator.data.get("statistics") if self.coordinator.data else None
+        if statistics and business_date in statistics:
+            return statistics[business_date]
+        return DayStatistics.from_data(day_data)
+
+    def get_today_statistics(self) -> DayStatistics | None:
+        return self._get_day_statistics(BUSINESS_DATE_KEYS.today, self.get_today_data())
+
+    def get_tomorrow_statistics(self) -> DayStatistics | None:
+        return self._get_day_statistics(BUSINESS_DATE_KEYS.tomorrow, self.get_tomorrow_data())
+
+    @property
+    def window_query(self) -> WindowQuery | None:
+        """Window query this entity reads, registered with the coordinator at setup."""
+        return None
+
+    def get_shared_windows(self, business_date: str, query: WindowQuery) -> list[PriceSeries] | None:
+        data = self.coordinator.data
+        windows = data.get("windows") if data else None
+        if windows is None:
+            return None
+        return windows.get(business_date, query)
+
+    def calculate(
+        self, business_date: str, function: Callable[..., _T], day_data: PriceSeries, *args: Any, **kwargs: Any
+    ) -> _T:
+        """Run ``function(day_data, ...)``, memoized per data version and business date."""
+        data = self.coordinator.data
+        cache = data.get("calculation_cache") if data else None
+        if cache is None:
+            return function(day_data, *args, **kwargs)
+
+        key = (
+            data.get("data_version"),
+            business_date,
+            function.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        return cache.get_or_compute(key, lambda: function(day_data, *args, **kwargs))
+
+    def get_day_freshness(self, business_date: str) -> dict[str, Any]:
+        """Freshness attributes for ``business_date``: fetch and publication times and staleness."""
+        data = self.coordinator.data or {}
+        day = data.get("freshness", {}).get(business_date)
+        stale_since = data.get("stale_since")
+        return {
+            "fetched_at": day.fetched_at if day else None,
+            "published_at": day.published_at if day else None,
+            "stale": stale_since is not None,
+            "stale_since": stale_since,
+        }
 
     def is_tomorrow_data_available(self) -> bool:
         now = dt_util.now()
@@ -56,8 +211,9 @@ class RCEBaseCommonEntity(CoordinatorEntity):
 
     @property
     def available(self) -> bool:
+        # Held prices keep being served while the API fails; staleness is
+        # reported through attributes, not by going unavailable.
         return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self.coordinator.data.get("raw_data") is not None
+            self.coordinator.data is not None
+            and self.coordinator.data.get("series") is not None
         ) 
\ No newline at end of file
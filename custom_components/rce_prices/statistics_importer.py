@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STATISTICS_IMPORT_BATCH_HOURS
+from .price_archive import PriceArchive
+from .price_series import QUARTER_SECONDS
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTIC_ID = f"{DOMAIN}:rce_price"
+QUARTERS_PER_HOUR = 4
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant < 2025.2
+    StatisticMeanType = None
+
+
+def _statistic_metadata() -> StatisticMetaData:
+    metadata = StatisticMetaData(
+        has_mean=True,
+        has_sum=False,
+        name="RCE Price",
+        source=DOMAIN,
+        statistic_id=STATISTIC_ID,
+        unit_of_measurement="PLN/MWh",
+    )
+    # Newer recorders describe the mean and unit class explicitly.
+    fields = StatisticMetaData.__annotations__
+    if StatisticMeanType is not None and "mean_type" in fields:
+        metadata["mean_type"] = StatisticMeanType.ARITHMETIC
+    if "unit_class" in fields:
+        metadata["unit_class"] = None
+    return metadata
+
+
+def hourly_rows(archive: PriceArchive, start: datetime, end: datetime) -> list[tuple[int, float, float, float]]:
+    """Aggregate archived quarters into ``(start, mean, min, max)`` hours.
+
+    ``start`` must be on a full UTC hour. Hours missing any of their
+    quarters are left out so a partly archived hour is never imported.
+    Blocks on the archive and must run in an executor.
+    """
+    rows = []
+    for chunk in archive.read(start, end):
+        quarters = chunk.quarters.tolist()
+        prices = chunk.prices.tolist()
+        for offset in range(0, len(quarters) - QUARTERS_PER_HOUR + 1, QUARTERS_PER_HOUR):
+            if 0 in quarters[offset:offset + QUARTERS_PER_HOUR]:
+                continue
+            hour = prices[offset:offset + QUARTERS_PER_HOUR]
+            rows.append(
+                (
+                    quarters[offset] * QUARTER_SECONDS,
+                    round(sum(hour) / QUARTERS_PER_HOUR / 100, 2),
+                    min(hour) / 100,
+                    max(hour) / 100,
+                )
+            )
+    return rows
+
+
+class PriceStatisticsImporter:
+    """Push hourly RCE price statistics from the archive into the recorder.
+
+    Imports are incremental: each run starts after the last hour already in
+    long-term statistics and hands the recorder ``STATISTICS_IMPORT_BATCH_HOURS``
+    hours per ``async_add_external_statistics`` call. ``since`` re-imports a
+    range explicitly, e.g. after a backfill filled in older dates.
+    """
+
+    def __init__(self, hass: HomeAssistant, archive: PriceArchive) -> None:
+        self.hass = hass
+        self.archive = archive
+
+    @property
+    def available(self) -> bool:
+        return "recorder" in self.hass.config.components
+
+    async def _async_first_hour(self) -> datetime | None:
+        last = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, STATISTIC_ID, False, {"max"}
+        )
+        if last and last.get(STATISTIC_ID):
+            return dt_util.utc_from_timestamp(last[STATISTIC_ID][0]["start"]) + timedelta(hours=1)
+
+        years = await self.hass.async_add_executor_job(self.archive.years)
+        if not years:
+            return None
+        return datetime(years[0], 1, 1, tzinfo=dt_util.UTC)
+
+    async def async_import(
+        self,
+        records: Iterable[dict[str, Any]] = (),
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> int:
+        """Archive ``records`` and import every complete past hour not yet in statistics.
+
+        ``since`` and ``until`` limit the import to a range of the archive
+        instead. The archive is written even without a recorder. Hours that
+        have not started yet are left out, so a later PSE revision of them
+        is still picked up by the next incremental run.
+        """
+        records = list(records)
+        if records:
+            try:
+                await self.hass.async_add_executor_job(self.archive.write_page, records)
+            except OSError as exception:
+                _LOGGER.warning("Failed to archive PSE prices: %s", exception)
+
+        if not self.available:
+            return 0
+
+        start = since if since is not None else await self._async_first_hour()
+        if start is None:
+            return 0
+
+        start = dt_util.as_utc(start).replace(minute=0, second=0, microsecond=0)
+        end = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        if until is not None:
+            end = min(end, dt_util.as_utc(until))
+        if start >= end:
+            return 0
+
+        rows = await self.hass.async_add_executor_job(hourly_rows, self.archive, start, end)
+        metadata = _statistic_metadata()
+        for offset in range(0, len(rows), STATISTICS_IMPORT_BATCH_HOURS):
+            async_add_external_statistics(
+                self.hass,
+                metadata,
+                [
+                    StatisticData(start=dt_util.utc_from_timestamp(hour_start), mean=mean, min=low, max=high)
+                    for hour_start, mean, low, high in rows[offset:offset + STATISTICS_IMPORT_BATCH_HOURS]
+                ],
+            )
+
+        _LOGGER.debug("Imported %d hours of RCE price statistics from %s", len(rows), start)
+        return len(rows)
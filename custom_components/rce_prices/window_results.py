@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from collections.abc import Set
+
+from .price_calculator import PriceCalculator, WindowQuery
+from .price_series import PriceSeries
+
+
+class WindowResults:
+    """Window query results shared by all entities for one data update.
+
+    Every registered query for a business date is answered by a single
+    :meth:`PriceCalculator.batch_windows` sweep the first time any entity asks
+    for that date. Queries that were not registered are computed on demand and
+    kept alongside the batch.
+    """
+
+    def __init__(self, series: PriceSeries, queries: Set[WindowQuery]) -> None:
+        self._series = series
+        self._queries = queries
+        self._results: dict[str, dict[WindowQuery, list[PriceSeries]]] = {}
+
+    def get(self, business_date: str, query: WindowQuery) -> list[PriceSeries]:
+        day_results = self._results.setdefault(business_date, {})
+        if query not in day_results:
+            pending = {query, *self._queries} - day_results.keys()
+            day_results.update(
+                PriceCalculator.batch_windows(self._series.for_date(business_date), pending)
+            )
+        return day_results[query]
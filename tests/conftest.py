@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, Mock, patch
+import os
+from unittest.mock import DEFAULT, AsyncMock, Mock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
@@ -9,13 +10,18 @@ from homeassistant.util import dt as dt_util
 import homeassistant.core as ha_core
 
 from custom_components.rce_prices.coordinator import RCEPSEDataUpdateCoordinator
+from custom_components.rce_prices.price_series import PriceSeries
 
 
 @pytest.fixture
-def mock_hass():
+def mock_hass(tmp_path):
     hass = Mock(spec=HomeAssistant)
     hass.config = Mock()
     hass.config.time_zone = "Europe/Warsaw"
+    hass.config.config_dir = str(tmp_path)
+    hass.config.path = lambda *parts: os.path.join(str(tmp_path), *parts)
+    hass.config.components = set()
+    hass.async_create_background_task = Mock(side_effect=lambda target, *args, **kwargs: target.close() or DEFAULT)
     hass.data = {}
     return hass
 
@@ -97,10 +103,28 @@ def sample_api_response():
     }
 
 
+@pytest.fixture
+def day_records():
+    """Build quarter records for ``business_date`` with the given prices, from midnight on."""
+
+    def build(business_date: str, prices: list[float]) -> list[dict]:
+        start = datetime.fromisoformat(business_date)
+        return [
+            {
+                "dtime": (start + timedelta(minutes=15 * (index + 1))).strftime("%Y-%m-%d %H:%M:%S"),
+                "rce_pln": f"{price:.2f}",
+                "business_date": business_date,
+            }
+            for index, price in enumerate(prices)
+        ]
+
+    return build
+
+
 @pytest.fixture
 def coordinator_data(sample_api_response):
     return {
-        "raw_data": sample_api_response["value"],
+        "series": PriceSeries.from_records(sample_api_response["value"]),
         "last_update": dt_util.now().isoformat(),
     }
 
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from datetime import date
+from typing import Any
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+from yarl import URL
+
+from custom_components.rce_prices import backfill as backfill_module
+from custom_components.rce_prices.backfill import HistoryBackfill
+
+
+def _day_records(business_date: str, count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "rce_pln": str(100 + index),
+            "business_date": business_date,
+            "dtime": f"{business_date} {index // 4:02d}:{index % 4 * 15:02d}:00",
+            "period": f"{index}",
+            "publication_ts": f"{business_date} 14:00:00",
+        }
+        for index in range(count)
+    ]
+
+
+class ListSink:
+
+    def __init__(self) -> None:
+        self.pages: list[list[dict[str, Any]]] = []
+
+    def write_page(self, records: list[dict[str, Any]]) -> int:
+        self.pages.append(records)
+        return len(records)
+
+
+class FailingSink:
+
+    def __init__(self, fail_dates: set[str]) -> None:
+        self.fail_dates = fail_dates
+
+    def write_page(self, records: list[dict[str, Any]]) -> int:
+        if records[0]["business_date"] in self.fail_dates:
+            raise OSError(28, "No space left on device")
+        return len(records)
+
+
+class StandInApi:
+    """Answers ``business_date eq`` queries the way the PSE API pages them."""
+
+    url = "https://pse.test/api/rce-pln"
+
+    def __init__(
+        self,
+        records_per_day: int,
+        *,
+        next_link: bool = False,
+        fail_dates: set[str] = frozenset(),
+        delay: float = 0.01,
+    ) -> None:
+        self.records_per_day = records_per_day
+        self.delay = delay
+        self.next_link = next_link
+        self.fail_dates = fail_dates
+        self.requests: list[dict[str, str]] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def respond(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        query = dict(url.query)
+        self.requests.append(query)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            business_date = query["$filter"].split("'")[1]
+            if business_date in self.fail_dates:
+                return AiohttpClientMockResponse(method, url, status=500)
+
+            first = int(query["$first"])
+            skip = int(query.get("$skip", 0))
+            records = _day_records(business_date, self.records_per_day)[skip:skip + first]
+            body: dict[str, Any] = {"value": records}
+            if self.next_link and skip + first < self.records_per_day:
+                body["nextLink"] = str(URL(self.url).with_query({**query, "$skip": str(skip + first)}))
+            return AiohttpClientMockResponse(method, url, json=body)
+        finally:
+            self.active -= 1
+
+    def session(self, aioclient_mock: AiohttpClientMocker) -> aiohttp.ClientSession:
+        aioclient_mock.get(re.compile(re.escape(self.url)), side_effect=self.respond)
+        return aioclient_mock.create_session(asyncio.get_running_loop())
+
+
+class TestHistoryBackfill:
+
+    def test_business_dates_walk_back_from_end(self):
+        assert HistoryBackfill.business_dates(date(2024, 3, 1), 3) == [
+            "2024-03-01",
+            "2024-02-29",
+            "2024-02-28",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pages_with_skip_until_short_page(self, aioclient_mock):
+        stand_in = StandInApi(records_per_day=10)
+        sink = ListSink()
+
+        async with stand_in.session(aioclient_mock) as session:
+            backfill = HistoryBackfill(session, sink, url=stand_in.url, page_size=4)
+            result = await backfill.async_run(["2024-06-01"])
+
+        assert [len(page) for page in sink.pages] == [4, 4, 2]
+        assert [query.get("$skip") for query in stand_in.requests] == [None, "4", "8"]
+        assert result.pages == 3
+        assert result.records == 10
+        assert backfill.completed == {"2024-06-01"}
+
+    @pytest.mark.asyncio
+    async def test_follows_next_link(self, aioclient_mock):
+        stand_in = StandInApi(records_per_day=8, next_link=True)
+        sink = ListSink()
+
+        async with stand_in.session(aioclient_mock) as session:
+            result = await HistoryBackfill(session, sink, url=stand_in.url, page_size=4).async_run(["2024-06-01"])
+
+        assert [len(page) for page in sink.pages] == [4, 4]
+        assert result.records == 8
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, aioclient_mock):
+        stand_in = StandInApi(records_per_day=2)
+        dates = HistoryBackfill.business_dates(date(2024, 6, 10), 8)
+
+        async with stand_in.session(aioclient_mock) as session:
+            result = await HistoryBackfill(session, ListSink(), url=stand_in.url, page_size=4, concurrency=2).async_run(dates)
+
+        assert result.dates == 8
+        assert (result.oldest, result.newest) == ("2024-06-03", "2024-06-10")
+        assert stand_in.max_active <= 2
+
+    @pytest.mark.asyncio
+    async def test_skips_completed_dates_and_reports_progress(self, aioclient_mock):
+        stand_in = StandInApi(records_per_day=2)
+        finished: list[str] = []
+
+        async def on_date_complete(business_date: str) -> None:
+            finished.append(business_date)
+
+        async with stand_in.session(aioclient_mock) as session:
+            backfill = HistoryBackfill(
+                session,
+                ListSink(),
+                url=stand_in.url,
+                completed=["2024-06-02"],
+                on_date_complete=on_date_complete,
+            )
+            result = await backfill.async_run(["2024-06-02", "2024-06-01"])
+
+        assert finished == ["2024-06-01"]
+        assert result.skipped == 1
+        assert len(stand_in.requests) == 1
+        assert backfill.completed == {"2024-06-01", "2024-06-02"}
+
+    @pytest.mark.asyncio
+    async def test_failed_date_is_not_marked_complete(self, aioclient_mock):
+        stand_in = StandInApi(records_per_day=2, fail_dates={"2024-06-01"})
+
+        async with stand_in.session(aioclient_mock) as session:
+            backfill = HistoryBackfill(session, ListSink(), url=stand_in.url)
+            result = await backfill.async_run(["2024-06-02", "2024-06-01"])
+
+        assert result.failed == 1
+        assert backfill.completed == {"2024-06-02"}
+
+    @pytest.mark.asyncio
+    async def test_sink_error_fails_only_that_date(self, aioclient_mock):
+        stand_in = StandInApi(records_per_day=2)
+        dates = HistoryBackfill.business_dates(date(2024, 6, 4), 4)
+
+        async with stand_in.session(aioclient_mock) as session:
+            backfill = HistoryBackfill(session, FailingSink({"2024-06-03"}), url=stand_in.url, concurrency=2)
+            result = await backfill.async_run(dates)
+
+        assert result.failed == 1
+        assert result.dates == 3
+        assert backfill.completed == {"2024-06-04", "2024-06-02", "2024-06-01"}
+
+    @pytest.mark.asyncio
+    async def test_slow_page_times_out(self, aioclient_mock):
+        stand_in = StandInApi(records_per_day=2, delay=1)
+
+        async with stand_in.session(aioclient_mock) as session:
+            backfill = HistoryBackfill(session, ListSink(), url=stand_in.url)
+            with patch.object(backfill_module, "API_TIMEOUT", 0.01):
+                result = await backfill.async_run(["2024-06-01"])
+
+        assert result.failed == 1
+        assert backfill.completed == set()
+
+    @pytest.mark.asyncio
+    async def test_sends_given_headers(self, aioclient_mock):
+        stand_in = StandInApi(records_per_day=2)
+        headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+
+        async with stand_in.session(aioclient_mock) as session:
+            await HistoryBackfill(session, ListSink(), url=stand_in.url, headers=headers).async_run(["2024-06-01"])
+
+        assert aioclient_mock.mock_calls[0][3] == headers
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+from datetime import datetime
 from unittest.mock import patch
 
+from homeassistant.util import dt as dt_util
+
+from custom_components.rce_prices.binary_sensors.base import RCEBaseBinarySensor
 from custom_components.rce_prices.binary_sensors.price_windows import (
     RCETodayMinPriceWindowBinarySensor,
     RCETodayMaxPriceWindowBinarySensor,
 )
+from custom_components.rce_prices.price_series import PriceSeries
+
+NOW_PATH = "custom_components.rce_prices.binary_sensors.base.dt_util.now"
+
+
+def _local(*args) -> datetime:
+    return datetime(*args, tzinfo=dt_util.DEFAULT_TIME_ZONE)
 
 
 class TestTodayPriceWindowBinarySensors:
@@ -34,9 +45,7 @@ class TestTodayPriceWindowBinarySensors:
                 }
             ]
             
-            with patch.object(sensor, "is_current_time_in_window") as mock_in_window:
-                mock_in_window.return_value = True
-                
+            with patch(NOW_PATH, return_value=_local(2024, 1, 15, 18, 5)):
                 state = sensor.is_on
                 assert state is True
 
@@ -52,9 +61,7 @@ class TestTodayPriceWindowBinarySensors:
                 }
             ]
             
-            with patch.object(sensor, "is_current_time_in_window") as mock_in_window:
-                mock_in_window.return_value = False
-                
+            with patch(NOW_PATH, return_value=_local(2024, 1, 15, 18, 20)):
                 state = sensor.is_on
                 assert state is False
 
@@ -79,9 +86,7 @@ class TestTodayPriceWindowBinarySensors:
                     },
                 ]
 
-                with patch.object(sensor, "is_current_time_in_window") as mock_in_window:
-                    mock_in_window.return_value = True
-
+                with patch(NOW_PATH, return_value=_local(2024, 1, 15, 10, 20)):
                     state = sensor.is_on
 
                 mock_find.assert_called_once_with(mock_today_data.return_value, 4)
@@ -103,9 +108,7 @@ class TestTodayPriceWindowBinarySensors:
                     }
                 ]
 
-                with patch.object(sensor, "is_current_time_in_window") as mock_in_window:
-                    mock_in_window.return_value = False
-
+                with patch(NOW_PATH, return_value=_local(2024, 1, 15, 10, 20)):
                     state = sensor.is_on
 
                 mock_find.assert_called_once_with(mock_today_data.return_value, 4)
@@ -127,16 +130,11 @@ class TestTodayPriceWindowBinarySensors:
     def test_price_window_binary_sensors_no_extreme_records(self, mock_coordinator):
         sensor = RCETodayMaxPriceWindowBinarySensor(mock_coordinator)
 
-        with patch.object(sensor, "get_today_data") as mock_today_data:
-            mock_today_data.return_value = [
-                {"period": "10:00 - 10:15", "rce_pln": "300.00"}
-            ]
-
-            with patch.object(sensor.calculator, "find_extreme_price_records") as mock_find:
-                mock_find.return_value = []
+        with patch.object(sensor, "get_today_statistics") as mock_statistics:
+            mock_statistics.return_value = None
 
-                state = sensor.is_on
-                assert state is False
+            state = sensor.is_on
+            assert state is False
 
     def test_today_min_price_window_inactive_when_no_window(self, mock_coordinator):
         sensor = RCETodayMinPriceWindowBinarySensor(mock_coordinator)
@@ -173,6 +171,34 @@ class TestTodayPriceWindowBinarySensors:
                 assert state is False
 
 
+    def test_price_window_binary_sensor_schedules_transitions(self, mock_coordinator):
+        sensor = RCETodayMaxPriceWindowBinarySensor(mock_coordinator)
+        bounds = (_local(2024, 1, 15, 18, 0), _local(2024, 1, 15, 18, 15))
+
+        with patch.object(sensor, "get_window_bounds", return_value=bounds):
+            assert sensor._next_update_time(_local(2024, 1, 15, 12, 0)) == bounds[0]
+            assert sensor._next_update_time(_local(2024, 1, 15, 18, 0)) == bounds[1]
+            assert sensor._next_update_time(_local(2024, 1, 15, 18, 15)) == _local(2024, 1, 16, 0, 0)
+
+    def test_price_window_binary_sensor_computes_bounds_once_per_data_version(self, mock_coordinator):
+        sensor = RCETodayMaxPriceWindowBinarySensor(mock_coordinator)
+        mock_coordinator.data = {"data_version": 1}
+
+        with patch.object(sensor, "_compute_window_bounds", return_value=None) as mock_compute:
+            sensor.is_on
+            sensor.is_on
+            mock_coordinator.data = {"data_version": 2}
+            sensor.is_on
+
+        assert mock_compute.call_count == 2
+
+    def test_base_binary_sensor_without_window_is_off(self, mock_coordinator):
+        sensor = RCEBaseBinarySensor(mock_coordinator, "test_window")
+
+        assert sensor.get_window_bounds() is None
+        assert sensor.is_on is False
+
+
 class TestBinarySensorDeviceInfo:
 
     def test_binary_sensor_device_info_consistency(self, mock_coordinator):
@@ -193,7 +219,7 @@ class TestBinarySensorAvailability:
 
     def test_binary_sensor_availability_with_data(self, mock_coordinator):
         mock_coordinator.last_update_success = True
-        mock_coordinator.data = {"raw_data": [{"test": "data"}]}
+        mock_coordinator.data = {"series": PriceSeries.empty()}
         
         sensors = [
             RCETodayMaxPriceWindowBinarySensor(mock_coordinator),
@@ -215,9 +241,9 @@ class TestBinarySensorAvailability:
         for sensor in sensors:
             assert sensor.available is False
 
-    def test_binary_sensor_availability_update_failed(self, mock_coordinator):
+    def test_binary_sensor_availability_update_failed_with_held_data(self, mock_coordinator):
         mock_coordinator.last_update_success = False
-        mock_coordinator.data = {"raw_data": [{"test": "data"}]}
+        mock_coordinator.data = {"series": PriceSeries.empty()}
         
         sensors = [
             RCETodayMaxPriceWindowBinarySensor(mock_coordinator),
@@ -225,4 +251,4 @@ class TestBinarySensorAvailability:
         ]
 
         for sensor in sensors:
-            assert sensor.available is False 
\ No newline at end of file
+            assert sensor.available is True 
\ No newline at end of file
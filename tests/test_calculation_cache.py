@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from custom_components.rce_prices.calculation_cache import CalculationCache
+
+
+class TestCalculationCache:
+
+    def test_counts_hits_and_misses(self):
+        cache = CalculationCache(4)
+        compute = Mock(return_value=42)
+
+        assert cache.get_or_compute((1, "2024-01-01", "f", ()), compute) == 42
+        assert cache.get_or_compute((1, "2024-01-01", "f", ()), compute) == 42
+
+        compute.assert_called_once()
+        assert cache.as_dict() == {
+            "size": 1,
+            "maxsize": 4,
+            "hits": 1,
+            "misses": 1,
+            "hit_ratio": 0.5,
+        }
+
+    def test_evicts_least_recently_used(self):
+        cache = CalculationCache(2)
+
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("c", lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.get_or_compute("b", lambda: 20) == 20
+        assert cache.get_or_compute("c", lambda: 30) == 3
+
+    def test_clear(self):
+        cache = CalculationCache(2)
+        cache.get_or_compute("a", lambda: 1)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get_or_compute("a", lambda: 2) == 2
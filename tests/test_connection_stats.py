@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.rce_prices.connection_stats import ConnectionStats
+
+
+class TestConnectionStats:
+
+    @pytest.mark.asyncio
+    async def test_counts_new_and_reused_connections(self):
+        stats = ConnectionStats()
+        trace_config = stats.trace_config()
+        session = Mock()
+
+        for signal in (
+            trace_config.on_request_start,
+            trace_config.on_connection_create_end,
+            trace_config.on_request_start,
+            trace_config.on_connection_reuseconn,
+            trace_config.on_request_start,
+            trace_config.on_connection_reuseconn,
+        ):
+            for handler in signal:
+                await handler(session, Mock(), Mock())
+
+        assert stats.as_dict() == {
+            "requests": 3,
+            "tls_handshakes": 1,
+            "reused_connections": 2,
+            "reuse_ratio": 0.667,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
@@ -1,15 +1,50 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+import json
+import re
+from datetime import date, timedelta
 from unittest.mock import patch, AsyncMock, Mock
 
+import aiohttp
 import pytest
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMockResponse
 
+from custom_components.rce_prices import coordinator as coordinator_module
+from custom_components.rce_prices.backfill import HistoryBackfill
 from custom_components.rce_prices.coordinator import RCEPSEDataUpdateCoordinator
-from custom_components.rce_prices.const import CONF_MIN_PRICE_WINDOW_QUARTERS, CONF_USE_HOURLY_PRICES
+from custom_components.rce_prices.const import (
+    ALL_DATA_KEYS,
+    BREAKER_FAILURE_THRESHOLD,
+    DATA_KEY_FRESHNESS,
+    CONF_MIN_PRICE_WINDOW_QUARTERS,
+    CONF_USE_HOURLY_PRICES,
+    DATA_KEY_CURRENT_QUARTER,
+    DATA_KEY_TODAY_PRICES,
+    DATA_KEY_TODAY_STATS,
+    DATA_KEY_TODAY_WINDOWS,
+    DATA_KEY_TOMORROW_PRICES,
+    DATA_KEY_TOMORROW_STATS,
+    DATA_KEY_TOMORROW_WINDOWS,
+    PSE_API_URL,
+    TOMORROW_DATA_KEYS,
+)
+from custom_components.rce_prices.day_statistics import DayStatistics
+from custom_components.rce_prices.price_series import PriceSeries
+
+
+@pytest.fixture(autouse=True)
+def mock_create_clientsession():
+    with patch("custom_components.rce_prices.coordinator.async_create_clientsession") as mock_create:
+        yield mock_create
+
+
+@pytest.fixture(autouse=True)
+def no_fetch_spacing():
+    with patch.object(coordinator_module, "FETCH_MIN_SPACING", timedelta(0)):
+        yield
 
 
 class TestRCEPSEDataUpdateCoordinator:
@@ -29,7 +64,7 @@ class TestRCEPSEDataUpdateCoordinator:
         
         with patch.object(coordinator, '_fetch_data') as mock_fetch:
             expected_data = {
-                "raw_data": sample_api_response["value"],
+                "series": PriceSeries.from_records(sample_api_response["value"]),
                 "last_update": "2025-05-29T12:00:00+00:00"
             }
             mock_fetch.return_value = expected_data
@@ -37,23 +72,188 @@ class TestRCEPSEDataUpdateCoordinator:
             result = await coordinator._async_update_data()
             
             assert result is not None
-            assert "raw_data" in result
+            assert "series" in result
             assert "last_update" in result
-            assert len(result["raw_data"]) == 7
-            assert result["raw_data"][0]["rce_pln"] == "350.00"
+            assert len(result["series"]) == 7
+            assert result["series"][0]["rce_pln"] == "350.00"
+
+    @pytest.mark.asyncio
+    async def test_data_version_increments_per_fetch(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.session = AsyncMock()
+
+        with patch.object(coordinator, '_fetch_data') as mock_fetch:
+            mock_fetch.side_effect = lambda: {
+                "series": PriceSeries.from_records(sample_api_response["value"]),
+                "last_update": "2025-05-29T12:00:00+00:00"
+            }
+
+            first = await coordinator._async_update_data()
+            coordinator._last_api_fetch = None
+            second = await coordinator._async_update_data()
+
+        assert coordinator.data_version == 2
+        assert first["data_version"] == 1
+        assert second["data_version"] == 2
+        assert second["calculation_cache"] is coordinator.calculation_cache
+
+    @pytest.mark.asyncio
+    async def test_unchanged_fetch_keeps_published_data(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.price_cache = AsyncMock()
+
+        with patch.object(coordinator, '_fetch_data') as mock_fetch:
+            mock_fetch.side_effect = lambda: {
+                "series": PriceSeries.from_records(sample_api_response["value"]),
+                "last_update": dt_util.now().isoformat(),
+            }
+
+            coordinator.data = await coordinator._async_update_data()
+            coordinator._last_api_fetch = None
+            second = await coordinator._async_update_data()
+
+        assert second is coordinator.data
+        assert coordinator.data_version == 1
+        assert coordinator.fetch_scheduler.unchanged_fetches == 1
+        assert coordinator.last_api_fetch is not None
+        assert coordinator.always_update is False
+
+    @pytest.mark.asyncio
+    async def test_changed_price_is_published(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.price_cache = AsyncMock()
+        revised = [dict(record) for record in sample_api_response["value"]]
+        revised[0]["rce_pln"] = "999.99"
+
+        with patch.object(coordinator, '_fetch_data') as mock_fetch:
+            mock_fetch.side_effect = [
+                {"series": PriceSeries.from_records(sample_api_response["value"]), "last_update": "a"},
+                {"series": PriceSeries.from_records(revised), "last_update": "b"},
+            ]
+
+            coordinator.data = await coordinator._async_update_data()
+            coordinator._last_api_fetch = None
+            second = await coordinator._async_update_data()
+
+        assert second is not coordinator.data
+        assert second["data_version"] == 2
+        assert coordinator.fetch_scheduler.unchanged_fetches == 0
+
+    @pytest.mark.asyncio
+    async def test_fetched_records_are_saved_to_price_cache(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.session = AsyncMock()
+        coordinator.price_cache = AsyncMock()
+
+        with patch.object(coordinator, '_fetch_data') as mock_fetch:
+            mock_fetch.return_value = {
+                "series": PriceSeries.from_records(sample_api_response["value"]),
+                "last_update": "2025-05-29T12:00:00+00:00",
+                "api_records": sample_api_response["value"],
+            }
+
+            result = await coordinator._async_update_data()
+
+        assert "api_records" not in result
+        coordinator.price_cache.async_save.assert_called_once()
+        assert coordinator.price_cache.async_save.call_args[0][0] == sample_api_response["value"]
+
+    @pytest.mark.asyncio
+    async def test_price_cache_write_error_still_publishes(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.session = AsyncMock()
+
+        with patch.object(coordinator, '_fetch_data') as mock_fetch, \
+             patch.object(coordinator.price_cache._store, 'async_save', side_effect=OSError("disk full")):
+            mock_fetch.return_value = {
+                "series": PriceSeries.from_records(sample_api_response["value"]),
+                "last_update": "2025-05-29T12:00:00+00:00",
+                "api_records": sample_api_response["value"],
+            }
+
+            result = await coordinator._async_update_data()
+
+        assert len(result["series"]) == len(sample_api_response["value"])
+
+    @pytest.mark.asyncio
+    async def test_load_cached_data(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.price_cache = AsyncMock()
+        coordinator.price_cache.async_load.return_value = (sample_api_response["value"], dt_util.now())
+
+        assert await coordinator.async_load_cached_data() is True
+
+        assert coordinator.data_version == 1
+        assert len(coordinator.data["series"]) == 7
+        assert coordinator.data["series"][0]["rce_pln_neg_to_zero"] == "350.00"
+
+    @pytest.mark.asyncio
+    async def test_load_cached_data_without_today(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.price_cache = AsyncMock()
+        yesterday = (dt_util.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        records = [{**record, "business_date": yesterday} for record in sample_api_response["value"]]
+        coordinator.price_cache.async_load.return_value = (records, dt_util.now())
+
+        assert await coordinator.async_load_cached_data() is False
+        assert coordinator.data is None
+
+    @pytest.mark.asyncio
+    async def test_older_api_response_keeps_cached_data(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.session = AsyncMock()
+        coordinator.price_cache = AsyncMock()
+        cached_data = {
+            "series": PriceSeries.from_records(sample_api_response["value"]),
+            "last_update": "2025-05-29T12:00:00+00:00",
+        }
+        coordinator.data = cached_data
+        today = dt_util.now().strftime("%Y-%m-%d")
+
+        with patch.object(coordinator, '_fetch_data') as mock_fetch:
+            mock_fetch.return_value = {
+                "series": PriceSeries.from_records(
+                    record for record in sample_api_response["value"] if record["business_date"] == today
+                ),
+                "last_update": "2025-05-29T12:30:00+00:00",
+                "api_records": [],
+            }
+
+            result = await coordinator._async_update_data()
+
+        assert result is cached_data
+        coordinator.price_cache.async_save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_interval_follows_fetch_scheduler(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.session = AsyncMock()
+        coordinator.fetch_scheduler.next_interval = Mock(return_value=timedelta(minutes=2))
+
+        with patch.object(coordinator, '_fetch_data') as mock_fetch:
+            mock_fetch.return_value = {
+                "series": PriceSeries.from_records(sample_api_response["value"]),
+                "last_update": "2025-05-29T12:00:00+00:00",
+            }
+
+            await coordinator._async_update_data()
+
+        assert coordinator.update_interval == timedelta(minutes=2)
+        assert coordinator.fetch_scheduler.requests == 1
+        assert coordinator.fetch_scheduler.next_interval.call_args[0][1] == mock_fetch.return_value["series"].business_dates
 
     @pytest.mark.asyncio
     async def test_data_fetch_creates_session_if_none(self, mock_hass, sample_api_response):
         coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
         assert coordinator.session is None
         
-        with patch("custom_components.rce_prices.coordinator.aiohttp.ClientSession") as mock_session_class:
+        with patch("custom_components.rce_prices.coordinator.async_create_clientsession") as mock_session_class:
             mock_session = AsyncMock()
             mock_session_class.return_value = mock_session
             
             with patch.object(coordinator, '_fetch_data') as mock_fetch:
                 expected_data = {
-                    "raw_data": sample_api_response["value"],
+                    "series": PriceSeries.from_records(sample_api_response["value"]),
                     "last_update": "2025-05-29T12:00:00+00:00"
                 }
                 mock_fetch.return_value = expected_data
@@ -61,8 +261,10 @@ class TestRCEPSEDataUpdateCoordinator:
                 result = await coordinator._async_update_data()
                 
                 mock_session_class.assert_called_once()
+                assert mock_session_class.call_args[0] == (mock_hass,)
+                assert len(mock_session_class.call_args[1]["trace_configs"]) == 1
                 assert coordinator.session == mock_session
-                assert result["raw_data"] == sample_api_response["value"]
+                assert result["series"] == sample_api_response["value"]
 
     @pytest.mark.asyncio
     async def test_api_request_behavior(self, mock_hass, sample_api_response):
@@ -71,7 +273,7 @@ class TestRCEPSEDataUpdateCoordinator:
         with patch.object(coordinator, 'session') as mock_session:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.json = AsyncMock(return_value=sample_api_response)
+            mock_response.read = AsyncMock(return_value=json.dumps(sample_api_response).encode())
             
             mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
             mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -84,6 +286,7 @@ class TestRCEPSEDataUpdateCoordinator:
             assert "https://api.raporty.pse.pl/api/rce-pln" in call_args[0]
             assert "params" in call_args[1]
             assert "headers" in call_args[1]
+            assert call_args[1]["headers"]["Accept-Encoding"].startswith("gzip")
             
             params = call_args[1]["params"]
             assert "$select" in params
@@ -91,6 +294,92 @@ class TestRCEPSEDataUpdateCoordinator:
             assert "$first" in params
             assert params["$first"] == 200
 
+    @pytest.mark.asyncio
+    async def test_fetch_data_requests_only_missing_dates(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        now = dt_util.now()
+        today = now.strftime("%Y-%m-%d")
+        tomorrow = (now + timedelta(days=1)).strftime("%Y-%m-%d")
+        held_today = [
+            {
+                "dtime": (dt_util.start_of_local_day(now) + timedelta(minutes=15 * (index + 1))).strftime("%Y-%m-%d %H:%M:%S"),
+                "period": f"quarter {index}",
+                "rce_pln": "100.00",
+                "business_date": today,
+                "publication_ts": f"{today}T12:00:00Z",
+            }
+            for index in range(coordinator_module._expected_quarters(today))
+        ]
+        coordinator._api_records = {coordinator_module._record_key(record): record for record in held_today}
+        fetched_tomorrow = [record for record in sample_api_response["value"] if record["business_date"] == tomorrow]
+
+        with patch.object(coordinator, 'session') as mock_session:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.content_length = 700
+            mock_response.read = AsyncMock(return_value=json.dumps({"value": fetched_tomorrow}).encode())
+
+            mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = await coordinator._fetch_data()
+
+        probe_params, params = (call[1]["params"] for call in mock_session.get.call_args_list)
+        assert probe_params["$select"] == "business_date,publication_ts"
+        assert params["$filter"] == f"business_date ge '{tomorrow}'"
+        assert result["series"].business_dates == (today, tomorrow)
+        assert len(result["series"]) == len(held_today) + len(fetched_tomorrow)
+        assert len(result["api_records"]) == len(held_today) + len(fetched_tomorrow)
+
+    @pytest.mark.asyncio
+    async def test_empty_probe_skips_full_download(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.price_cache = AsyncMock()
+        today = dt_util.now().strftime("%Y-%m-%d")
+        held_data = {
+            "series": PriceSeries.from_records(sample_api_response["value"]),
+            "last_update": "2025-05-29T12:00:00+00:00",
+        }
+        coordinator.data = held_data
+        coordinator._api_records = {
+            coordinator_module._record_key(record): record
+            for record in sample_api_response["value"]
+            if record["business_date"] == today
+        }
+
+        with patch.object(coordinator, '_first_date_to_fetch', return_value="2099-01-01"), \
+                patch.object(coordinator, 'session') as mock_session:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.read = AsyncMock(return_value=json.dumps({"value": []}).encode())
+
+            mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = await coordinator._async_update_data()
+
+        mock_session.get.assert_called_once()
+        assert mock_session.get.call_args[1]["params"]["$first"] == 4
+        assert result is held_data
+        assert coordinator.fetch_scheduler.skipped_downloads == 1
+        coordinator.price_cache.async_save.assert_not_called()
+
+    def test_merge_records_replaces_by_dtime_and_drops_past_dates(self, mock_hass):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        held = [
+            {"dtime": "2024-06-09 00:15:00", "period": "00:00 - 00:15", "rce_pln": "90.00", "business_date": "2024-06-09"},
+            {"dtime": "2024-06-10 00:15:00", "period": "00:00 - 00:15", "rce_pln": "100.00", "business_date": "2024-06-10"},
+            {"dtime": "2024-06-10 00:30:00", "period": "00:15 - 00:30", "rce_pln": "110.00", "business_date": "2024-06-10"},
+        ]
+        coordinator._api_records = {coordinator_module._record_key(record): record for record in held}
+
+        merged = coordinator._merge_records(
+            [{"dtime": "2024-06-10 00:30:00", "period": "00:15 - 00:30", "rce_pln": "120.00", "business_date": "2024-06-10"}],
+            "2024-06-10",
+        )
+
+        assert [record["rce_pln"] for record in merged] == ["100.00", "120.00"]
+
     @pytest.mark.asyncio
     async def test_fetch_data_method(self, mock_hass, sample_api_response):
         coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
@@ -98,7 +387,7 @@ class TestRCEPSEDataUpdateCoordinator:
         with patch.object(coordinator, 'session') as mock_session:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.json = AsyncMock(return_value=sample_api_response)
+            mock_response.read = AsyncMock(return_value=json.dumps(sample_api_response).encode())
             
             mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
             mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -106,9 +395,9 @@ class TestRCEPSEDataUpdateCoordinator:
             result = await coordinator._fetch_data()
             
             assert "last_update" in result
-            assert len(result["raw_data"]) == 7
+            assert len(result["series"]) == 7
             
-            for i, record in enumerate(result["raw_data"]):
+            for i, record in enumerate(result["series"]):
                 original_record = sample_api_response["value"][i]
                 assert record["rce_pln"] == original_record["rce_pln"]
                 assert record["rce_pln_neg_to_zero"] == original_record["rce_pln"]
@@ -122,11 +411,13 @@ class TestRCEPSEDataUpdateCoordinator:
         
         await coordinator.async_close()
         
-        mock_session = AsyncMock()
+        mock_session = Mock()
         coordinator.session = mock_session
         
         await coordinator.async_close()
-        mock_session.close.assert_called_once()
+        mock_session.detach.assert_called_once()
+        mock_session.close.assert_not_called()
+        assert coordinator.session is None
 
     @pytest.mark.asyncio 
     async def test_data_processing_with_valid_response(self, mock_hass, sample_api_response):
@@ -134,7 +425,7 @@ class TestRCEPSEDataUpdateCoordinator:
         
         with patch.object(coordinator, '_fetch_data') as mock_fetch:
             expected_data = {
-                "raw_data": sample_api_response["value"],
+                "series": PriceSeries.from_records(sample_api_response["value"]),
                 "last_update": "2025-05-29T12:00:00+00:00"
             }
             mock_fetch.return_value = expected_data
@@ -142,10 +433,10 @@ class TestRCEPSEDataUpdateCoordinator:
             result = await coordinator._async_update_data()
             
             assert isinstance(result, dict)
-            assert isinstance(result["raw_data"], list)
-            assert len(result["raw_data"]) > 0
+            assert isinstance(result["series"], PriceSeries)
+            assert len(result["series"]) > 0
             
-            first_record = result["raw_data"][0]
+            first_record = result["series"][0]
             assert "dtime" in first_record
             assert "period" in first_record
             assert "rce_pln" in first_record
@@ -156,7 +447,7 @@ class TestRCEPSEDataUpdateCoordinator:
         coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
         
         cached_data = {
-            "raw_data": sample_api_response["value"],
+            "series": PriceSeries.from_records(sample_api_response["value"]),
             "last_update": "2025-05-29T12:00:00+00:00"
         }
         coordinator.data = cached_data
@@ -172,13 +463,13 @@ class TestRCEPSEDataUpdateCoordinator:
     async def test_refresh_stale_data(self, mock_hass, sample_api_response):
         coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
         
-        old_data = {"raw_data": [], "last_update": "2025-05-29T10:00:00+00:00"}
+        old_data = {"series": PriceSeries.empty(), "last_update": "2025-05-29T10:00:00+00:00"}
         coordinator.data = old_data
         coordinator._last_api_fetch = dt_util.now() - timedelta(hours=2)
         
         with patch.object(coordinator, '_fetch_data') as mock_fetch:
             fresh_data = {
-                "raw_data": sample_api_response["value"],
+                "series": PriceSeries.from_records(sample_api_response["value"]),
                 "last_update": "2025-05-29T12:00:00+00:00"
             }
             mock_fetch.return_value = fresh_data
@@ -193,7 +484,7 @@ class TestRCEPSEDataUpdateCoordinator:
         coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
         
         existing_data = {
-            "raw_data": sample_api_response["value"],
+            "series": PriceSeries.from_records(sample_api_response["value"]),
             "last_update": "2025-05-29T10:00:00+00:00"
         }
         coordinator.data = existing_data
@@ -204,7 +495,8 @@ class TestRCEPSEDataUpdateCoordinator:
             
             result = await coordinator._async_update_data()
             
-            assert result == existing_data
+            assert result["series"] is existing_data["series"]
+            assert result["stale_since"] is not None
             assert coordinator._last_api_fetch is not None
 
     @pytest.mark.asyncio
@@ -223,7 +515,7 @@ class TestRCEPSEDataUpdateCoordinator:
         coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
         
         existing_data = {
-            "raw_data": sample_api_response["value"],
+            "series": PriceSeries.from_records(sample_api_response["value"]),
             "last_update": "2025-05-29T10:00:00+00:00"
         }
         coordinator.data = existing_data
@@ -234,7 +526,8 @@ class TestRCEPSEDataUpdateCoordinator:
             
             result = await coordinator._async_update_data()
             
-            assert result == existing_data
+            assert result["series"] is existing_data["series"]
+            assert result["stale_since"] is not None
             assert coordinator._last_api_fetch is not None
 
     @pytest.mark.asyncio
@@ -255,7 +548,7 @@ class TestRCEPSEDataUpdateCoordinator:
         
         with patch.object(coordinator, '_fetch_data') as mock_fetch:
             fresh_data = {
-                "raw_data": sample_api_response["value"],
+                "series": PriceSeries.from_records(sample_api_response["value"]),
                 "last_update": "2025-05-29T12:00:00+00:00"
             }
             mock_fetch.return_value = fresh_data
@@ -270,7 +563,7 @@ class TestRCEPSEDataUpdateCoordinator:
         coordinator._last_api_fetch = None
         
         existing_data = {
-            "raw_data": sample_api_response["value"],
+            "series": PriceSeries.from_records(sample_api_response["value"]),
             "last_update": "2025-05-29T10:00:00+00:00"
         }
         coordinator.data = existing_data
@@ -303,7 +596,7 @@ class TestRCEPSEDataUpdateCoordinator:
         with patch.object(coordinator, 'session') as mock_session:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.json = AsyncMock(return_value={"invalid": "format"})
+            mock_response.read = AsyncMock(return_value=json.dumps({"invalid": "format"}).encode())
             
             mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
             mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -318,183 +611,16 @@ class TestRCEPSEDataUpdateCoordinator:
         with patch.object(coordinator, 'session') as mock_session:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.json = AsyncMock(return_value={"value": []})
+            mock_response.read = AsyncMock(return_value=json.dumps({"value": []}).encode())
             
             mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
             mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
             
             result = await coordinator._fetch_data()
             
-            assert result["raw_data"] == []
+            assert result["series"] == []
             assert "last_update" in result
 
-    def test_calculate_hourly_averages_empty_data(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        result = coordinator._calculate_hourly_averages([])
-        assert result == []
-
-    def test_calculate_hourly_averages_single_record(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [{
-            "dtime": "2024-01-01 00:15:00",
-            "period": "00:00 - 00:15",
-            "rce_pln": "350.00",
-            "business_date": "2024-01-01"
-        }]
-        
-        result = coordinator._calculate_hourly_averages(data)
-        assert len(result) == 1
-        assert result[0]["rce_pln"] == "350.00"
-
-    def test_calculate_hourly_averages_multiple_quarters_same_hour(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "300.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "320.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:45:00",
-                "period": "00:30 - 00:45",
-                "rce_pln": "340.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 01:00:00",
-                "period": "00:45 - 01:00",
-                "rce_pln": "360.00",
-                "business_date": "2024-01-01"
-            }
-        ]
-        
-        result = coordinator._calculate_hourly_averages(data)
-        assert len(result) == 4
-        
-        expected_average = (300.00 + 320.00 + 340.00 + 360.00) / 4
-        for record in result:
-            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"] or "00:45" in record["period"]:
-                assert record["rce_pln"] == "330.00"
-
-    def test_calculate_hourly_averages_different_hours(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "300.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "320.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 01:15:00",
-                "period": "01:00 - 01:15",
-                "rce_pln": "400.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 01:30:00",
-                "period": "01:15 - 01:30",
-                "rce_pln": "420.00",
-                "business_date": "2024-01-01"
-            }
-        ]
-        
-        result = coordinator._calculate_hourly_averages(data)
-        assert len(result) == 4
-        
-        hour_0_records = [r for r in result if "00:" in r["period"]]
-        for record in hour_0_records:
-            assert record["rce_pln"] == "310.00"
-        hour_1_records = [r for r in result if "01:" in r["period"]]
-        for record in hour_1_records:
-            assert record["rce_pln"] == "410.00"
-
-    def test_calculate_hourly_averages_different_dates(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "300.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "320.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-02 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "400.00",
-                "business_date": "2024-01-02"
-            },
-            {
-                "dtime": "2024-01-02 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "420.00",
-                "business_date": "2024-01-02"
-            }
-        ]
-        
-        result = coordinator._calculate_hourly_averages(data)
-        assert len(result) == 4
-        
-        jan_1_records = [r for r in result if "2024-01-01" in r["dtime"]]
-        for record in jan_1_records:
-            assert record["rce_pln"] == "310.00"
-        jan_2_records = [r for r in result if "2024-01-02" in r["dtime"]]
-        for record in jan_2_records:
-            assert record["rce_pln"] == "410.00"
-
-    def test_calculate_hourly_averages_invalid_data_handling(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "300.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "invalid_date",
-                "period": "00:15 - 00:30",
-                "rce_pln": "320.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:30 - 00:45",
-                "rce_pln": "invalid_price",
-                "business_date": "2024-01-01"
-            }
-        ]
-        
-        result = coordinator._calculate_hourly_averages(data)
-        assert len(result) == 2
-        for record in result:
-            assert record["rce_pln"] == "300.00"
-
     def test_get_config_value_with_options(self, mock_hass):
         mock_config_entry = Mock()
         mock_config_entry.options = {CONF_USE_HOURLY_PRICES: True}
@@ -569,15 +695,15 @@ class TestRCEPSEDataUpdateCoordinator:
         with patch.object(coordinator, 'session') as mock_session:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.json = AsyncMock(return_value=sample_data)
+            mock_response.read = AsyncMock(return_value=json.dumps(sample_data).encode())
             
             mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
             mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
             
             result = await coordinator._fetch_data()
             
-            assert len(result["raw_data"]) == 2
-            for record in result["raw_data"]:
+            assert len(result["series"]) == 2
+            for record in result["series"]:
                 assert record["rce_pln"] == "310.00"
 
     @pytest.mark.asyncio
@@ -608,291 +734,16 @@ class TestRCEPSEDataUpdateCoordinator:
         with patch.object(coordinator, 'session') as mock_session:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.json = AsyncMock(return_value=sample_data)
+            mock_response.read = AsyncMock(return_value=json.dumps(sample_data).encode())
             
             mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
             mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
             
             result = await coordinator._fetch_data()
             
-            assert len(result["raw_data"]) == 2
-            assert result["raw_data"][0]["rce_pln"] == "300.00"
-            assert result["raw_data"][1]["rce_pln"] == "320.00"
-
-    def test_calculate_hourly_averages_with_negative_values(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "300.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "-50.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:45:00",
-                "period": "00:30 - 00:45",
-                "rce_pln": "200.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 01:00:00",
-                "period": "00:45 - 01:00",
-                "rce_pln": "100.00",
-                "business_date": "2024-01-01"
-            }
-        ]
-        
-        result = coordinator._calculate_hourly_averages(data)
-        assert len(result) == 4
-        
-        expected_normal_average = (300.00 + (-50.00) + 200.00 + 100.00) / 4
-        expected_neg_to_zero_average = (300.00 + 0.00 + 200.00 + 100.00) / 4
-        
-        for record in result:
-            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"] or "00:45" in record["period"]:
-                assert record["rce_pln"] == f"{expected_normal_average:.2f}"
-                assert record["rce_pln_neg_to_zero"] == f"{expected_neg_to_zero_average:.2f}"
-
-    def test_calculate_hourly_averages_all_negative_values(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "-100.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "-200.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:45:00",
-                "period": "00:30 - 00:45",
-                "rce_pln": "-50.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 01:00:00",
-                "period": "00:45 - 01:00",
-                "rce_pln": "-150.00",
-                "business_date": "2024-01-01"
-            }
-        ]
-        
-        result = coordinator._calculate_hourly_averages(data)
-        assert len(result) == 4
-        
-        expected_normal_average = (-100.00 + (-200.00) + (-50.00) + (-150.00)) / 4
-        expected_neg_to_zero_average = (0.00 + 0.00 + 0.00 + 0.00) / 4
-        
-        for record in result:
-            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"] or "00:45" in record["period"]:
-                assert record["rce_pln"] == f"{expected_normal_average:.2f}"
-                assert record["rce_pln_neg_to_zero"] == f"{expected_neg_to_zero_average:.2f}"
-
-    def test_calculate_hourly_averages_mixed_positive_negative_values(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "500.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "-100.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:45:00",
-                "period": "00:30 - 00:45",
-                "rce_pln": "300.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 01:00:00",
-                "period": "00:45 - 01:00",
-                "rce_pln": "-50.00",
-                "business_date": "2024-01-01"
-            }
-        ]
-        
-        result = coordinator._calculate_hourly_averages(data)
-        assert len(result) == 4
-        
-        expected_normal_average = (500.00 + (-100.00) + 300.00 + (-50.00)) / 4
-        expected_neg_to_zero_average = (500.00 + 0.00 + 300.00 + 0.00) / 4
-        
-        for record in result:
-            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"] or "00:45" in record["period"]:
-                assert record["rce_pln"] == f"{expected_normal_average:.2f}"
-                assert record["rce_pln_neg_to_zero"] == f"{expected_neg_to_zero_average:.2f}"
-
-    def test_calculate_hourly_averages_zero_values(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "0.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "-50.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:45:00",
-                "period": "00:30 - 00:45",
-                "rce_pln": "100.00",
-                "business_date": "2024-01-01"
-            }
-        ]
-        
-        result = coordinator._calculate_hourly_averages(data)
-        assert len(result) == 3
-        
-        expected_normal_average = (0.00 + (-50.00) + 100.00) / 3
-        expected_neg_to_zero_average = (0.00 + 0.00 + 100.00) / 3
-        
-        for record in result:
-            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"]:
-                assert record["rce_pln"] == f"{expected_normal_average:.2f}"
-                assert record["rce_pln_neg_to_zero"] == f"{expected_neg_to_zero_average:.2f}"
-
-    def test_add_neg_to_zero_key_empty_data(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        result = coordinator._add_neg_to_zero_key([])
-        assert result == []
-
-    def test_add_neg_to_zero_key_single_record_positive(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [{
-            "dtime": "2024-01-01 00:15:00",
-            "period": "00:00 - 00:15",
-            "rce_pln": "350.00",
-            "business_date": "2024-01-01"
-        }]
-        
-        result = coordinator._add_neg_to_zero_key(data)
-        assert len(result) == 1
-        assert result[0]["rce_pln"] == "350.00"
-        assert result[0]["rce_pln_neg_to_zero"] == "350.00"
-
-    def test_add_neg_to_zero_key_single_record_negative(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [{
-            "dtime": "2024-01-01 00:15:00",
-            "period": "00:00 - 00:15",
-            "rce_pln": "-50.00",
-            "business_date": "2024-01-01"
-        }]
-        
-        result = coordinator._add_neg_to_zero_key(data)
-        assert len(result) == 1
-        assert result[0]["rce_pln"] == "-50.00"
-        assert result[0]["rce_pln_neg_to_zero"] == "0.00"
-
-    def test_add_neg_to_zero_key_mixed_values(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "300.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "-100.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:45:00",
-                "period": "00:30 - 00:45",
-                "rce_pln": "0.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 01:00:00",
-                "period": "00:45 - 01:00",
-                "rce_pln": "-50.00",
-                "business_date": "2024-01-01"
-            }
-        ]
-        
-        result = coordinator._add_neg_to_zero_key(data)
-        assert len(result) == 4
-        
-        assert result[0]["rce_pln"] == "300.00"
-        assert result[0]["rce_pln_neg_to_zero"] == "300.00"
-        
-        assert result[1]["rce_pln"] == "-100.00"
-        assert result[1]["rce_pln_neg_to_zero"] == "0.00"
-        
-        assert result[2]["rce_pln"] == "0.00"
-        assert result[2]["rce_pln_neg_to_zero"] == "0.00"
-        
-        assert result[3]["rce_pln"] == "-50.00"
-        assert result[3]["rce_pln_neg_to_zero"] == "0.00"
-
-    def test_add_neg_to_zero_key_invalid_data_handling(self, mock_hass):
-        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
-        
-        data = [
-            {
-                "dtime": "2024-01-01 00:15:00",
-                "period": "00:00 - 00:15",
-                "rce_pln": "300.00",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:30:00",
-                "period": "00:15 - 00:30",
-                "rce_pln": "invalid_price",
-                "business_date": "2024-01-01"
-            },
-            {
-                "dtime": "2024-01-01 00:45:00",
-                "period": "00:30 - 00:45",
-                "rce_pln": "-50.00",
-                "business_date": "2024-01-01"
-            }
-        ]
-        
-        result = coordinator._add_neg_to_zero_key(data)
-        assert len(result) == 3
-        
-        assert result[0]["rce_pln"] == "300.00"
-        assert result[0]["rce_pln_neg_to_zero"] == "300.00"
-        
-        assert result[1]["rce_pln"] == "invalid_price"
-        assert "rce_pln_neg_to_zero" not in result[1]
-        
-        assert result[2]["rce_pln"] == "-50.00"
-        assert result[2]["rce_pln_neg_to_zero"] == "0.00"
+            assert len(result["series"]) == 2
+            assert result["series"][0]["rce_pln"] == "300.00"
+            assert result["series"][1]["rce_pln"] == "320.00"
 
     @pytest.mark.asyncio
     async def test_fetch_data_with_hourly_prices_disabled_adds_neg_to_zero(self, mock_hass):
@@ -922,15 +773,329 @@ class TestRCEPSEDataUpdateCoordinator:
         with patch.object(coordinator, 'session') as mock_session:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.json = AsyncMock(return_value=sample_data)
+            mock_response.read = AsyncMock(return_value=json.dumps(sample_data).encode())
             
             mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
             mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
             
             result = await coordinator._fetch_data()
             
-            assert len(result["raw_data"]) == 2
-            assert result["raw_data"][0]["rce_pln"] == "300.00"
-            assert result["raw_data"][0]["rce_pln_neg_to_zero"] == "300.00"
-            assert result["raw_data"][1]["rce_pln"] == "-50.00"
-            assert result["raw_data"][1]["rce_pln_neg_to_zero"] == "0.00" 
\ No newline at end of file
+            assert len(result["series"]) == 2
+            assert result["series"][0]["rce_pln"] == "300.00"
+            assert result["series"][0]["rce_pln_neg_to_zero"] == "300.00"
+            assert result["series"][1]["rce_pln"] == "-50.00"
+            assert result["series"][1]["rce_pln_neg_to_zero"] == "0.00" 
+
+
+def _published(records: list[dict]) -> dict:
+    series = PriceSeries.from_records(records)
+    return {"series": series, "statistics": DayStatistics.for_series(series)}
+
+
+class TestSelectiveUpdates:
+
+    def test_first_publish_changes_everything(self, sample_api_response):
+        assert coordinator_module._changed_data_keys(None, _published(sample_api_response["value"])) is None
+
+    def test_today_revision_leaves_tomorrow_keys(self, sample_api_response):
+        revised = [dict(record) for record in sample_api_response["value"]]
+        revised[0]["rce_pln"] = "351.00"
+
+        changed = coordinator_module._changed_data_keys(
+            _published(sample_api_response["value"]), _published(revised)
+        )
+
+        assert changed == {
+            DATA_KEY_TODAY_PRICES,
+            DATA_KEY_TODAY_STATS,
+            DATA_KEY_TODAY_WINDOWS,
+            DATA_KEY_CURRENT_QUARTER,
+        }
+
+    def test_new_tomorrow_leaves_today_keys(self, sample_api_response):
+        today = dt_util.now().strftime("%Y-%m-%d")
+        today_only = [record for record in sample_api_response["value"] if record["business_date"] == today]
+
+        changed = coordinator_module._changed_data_keys(
+            _published(today_only), _published(sample_api_response["value"])
+        )
+
+        assert changed == {DATA_KEY_TOMORROW_PRICES, DATA_KEY_TOMORROW_STATS, DATA_KEY_TOMORROW_WINDOWS}
+
+    def test_revision_keeping_statistics_skips_stats_key(self, sample_api_response):
+        revised = [dict(record) for record in sample_api_response["value"]]
+        revised[4]["publication_ts"] = "2099-01-01T00:00:00Z"
+
+        changed = coordinator_module._changed_data_keys(
+            _published(sample_api_response["value"]), _published(revised)
+        )
+
+        assert changed == {DATA_KEY_TOMORROW_PRICES, DATA_KEY_TOMORROW_WINDOWS}
+
+    def test_listeners_notified_by_data_keys(self, mock_hass):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        today_listener, tomorrow_listener, plain_listener = Mock(), Mock(), Mock()
+        with patch.object(coordinator, "_schedule_refresh"):
+            coordinator.async_add_listener(today_listener, frozenset({DATA_KEY_TODAY_STATS}))
+            coordinator.async_add_listener(tomorrow_listener, frozenset({DATA_KEY_TOMORROW_STATS}))
+            coordinator.async_add_listener(plain_listener)
+
+        coordinator._changed_keys = frozenset({DATA_KEY_TODAY_STATS})
+        coordinator.async_update_listeners()
+
+        today_listener.assert_called_once()
+        tomorrow_listener.assert_not_called()
+        plain_listener.assert_called_once()
+
+        coordinator.async_update_listeners()
+
+        assert tomorrow_listener.call_count == 1
+        assert today_listener.call_count == 2
+
+    @pytest.mark.parametrize(("hour", "expected"), [(0, ALL_DATA_KEYS), (14, TOMORROW_DATA_KEYS)])
+    def test_day_boundary_wakes_clock_driven_keys(self, mock_hass, coordinator_data, hour, expected):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.data = coordinator_data
+        notified = []
+
+        with patch.object(
+            coordinator, "async_update_listeners", side_effect=lambda: notified.append(coordinator._changed_keys)
+        ):
+            coordinator.async_handle_day_boundary(dt_util.now().replace(hour=hour, minute=0, second=0))
+
+        assert notified == [expected]
+
+
+class TestSingleFlightFetch:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_request(self, mock_hass, sample_api_response, aioclient_mock):
+        requests = []
+
+        async def respond(method, url, data):
+            requests.append(dict(url.query))
+            await asyncio.sleep(0.05)
+            return AiohttpClientMockResponse(method, url, json=sample_api_response)
+
+        aioclient_mock.get(re.compile(re.escape(PSE_API_URL)), side_effect=respond)
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.price_cache = AsyncMock()
+
+        async with aioclient_mock.create_session(asyncio.get_running_loop()) as session:
+            coordinator.session = session
+            results = await asyncio.gather(*(coordinator._async_update_data() for _ in range(5)))
+
+        assert len(requests) == 1
+        assert all(result is results[0] for result in results)
+        assert coordinator.fetch_scheduler.requests == 1
+        assert coordinator.fetch_scheduler.coalesced_fetches == 4
+
+    @pytest.mark.asyncio
+    async def test_joined_callers_share_the_failure(self, mock_hass):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        started = asyncio.Event()
+
+        async def failing_fetch():
+            started.set()
+            await asyncio.sleep(0.01)
+            raise aiohttp.ClientError("boom")
+
+        with patch.object(coordinator, "_fetch_data", side_effect=failing_fetch):
+            leader = asyncio.ensure_future(coordinator._async_update_data())
+            await started.wait()
+            follower = asyncio.ensure_future(coordinator._async_update_data())
+            results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+        assert all(isinstance(result, UpdateFailed) for result in results)
+        assert coordinator._fetch_in_flight is None
+
+    @pytest.mark.asyncio
+    async def test_min_spacing_keeps_held_data(self, mock_hass, coordinator_data):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.data = coordinator_data
+        coordinator._last_request_started = coordinator_module.time.monotonic()
+
+        with patch.object(coordinator_module, "FETCH_MIN_SPACING", timedelta(seconds=30)), \
+             patch.object(coordinator, "_fetch_data") as mock_fetch:
+            result = await coordinator._async_fetch_prices(dt_util.now())
+
+        assert result is coordinator_data
+        mock_fetch.assert_not_called()
+
+
+class TestRetryBackoff:
+
+    @pytest.mark.asyncio
+    async def test_failure_schedules_backoff_retry(self, mock_hass, coordinator_data):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.data = coordinator_data
+
+        with patch.object(coordinator, "_fetch_data", side_effect=aiohttp.ClientError("boom")):
+            result = await coordinator._async_update_data()
+
+        assert result["series"] is coordinator_data["series"]
+        assert coordinator.retry_policy.consecutive_failures == 1
+        assert timedelta(seconds=14) <= coordinator.update_interval <= timedelta(seconds=30)
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_api_call(self, mock_hass, coordinator_data):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.data = coordinator_data
+        now = dt_util.now()
+        for _ in range(BREAKER_FAILURE_THRESHOLD):
+            coordinator.retry_policy.record_failure(now)
+
+        with patch.object(coordinator, "_fetch_data") as mock_fetch:
+            result = await coordinator._async_fetch_prices(now)
+
+        assert result["series"] is coordinator_data["series"]
+        assert result["stale_since"] == now.isoformat()
+        mock_fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_without_data_fails(self, mock_hass):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        now = dt_util.now()
+        for _ in range(BREAKER_FAILURE_THRESHOLD):
+            coordinator.retry_policy.record_failure(now)
+
+        with pytest.raises(UpdateFailed, match="circuit breaker"):
+            await coordinator._async_fetch_prices(now)
+
+    @pytest.mark.asyncio
+    async def test_success_resets_backoff(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.price_cache = AsyncMock()
+        coordinator.retry_policy.record_failure(dt_util.now())
+
+        with patch.object(coordinator, "_fetch_data") as mock_fetch:
+            mock_fetch.return_value = {
+                "series": PriceSeries.from_records(sample_api_response["value"]),
+                "last_update": "2025-05-29T12:00:00+00:00",
+            }
+            await coordinator._async_update_data()
+
+        assert coordinator.retry_policy.state == "closed"
+        assert coordinator.retry_policy.next_retry is None
+        assert coordinator.update_interval > timedelta(seconds=30)
+
+
+class TestStaleWhileRevalidate:
+
+    def test_build_data_records_day_freshness(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        fetched_at = dt_util.now()
+
+        data = coordinator._build_data(sample_api_response["value"], fetched_at)
+
+        assert set(data["freshness"]) == set(data["series"].business_dates)
+        for business_date, freshness in data["freshness"].items():
+            assert freshness.fetched_at == fetched_at.isoformat()
+            assert freshness.published_at == max(
+                record["publication_ts"]
+                for record in sample_api_response["value"]
+                if record["business_date"] == business_date
+            )
+        assert data["stale_since"] is None
+
+    def test_unrepublished_day_keeps_fetch_time(self, mock_hass, sample_api_response):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        first = dt_util.now() - timedelta(hours=3)
+        coordinator.data = coordinator._build_data(sample_api_response["value"], first)
+        today = dt_util.now().strftime("%Y-%m-%d")
+        revised = [dict(record) for record in sample_api_response["value"]]
+        for record in revised:
+            if record["business_date"] != today:
+                record["publication_ts"] = "2099-01-01T00:00:00Z"
+
+        data = coordinator._build_data(revised, dt_util.now())
+
+        for business_date, freshness in data["freshness"].items():
+            if business_date == today:
+                assert freshness.fetched_at == first.isoformat()
+            else:
+                assert freshness.fetched_at != first.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_failure_wakes_only_freshness_listeners(self, mock_hass, coordinator_data):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.data = coordinator_data
+        coordinator_data["calculation_cache"] = coordinator.calculation_cache
+        coordinator.data_version = coordinator_data["data_version"] = 3
+        freshness_listener, stats_listener = Mock(), Mock()
+        with patch.object(coordinator, "_schedule_refresh"):
+            coordinator.async_add_listener(freshness_listener, frozenset({DATA_KEY_FRESHNESS}))
+            coordinator.async_add_listener(stats_listener, frozenset({DATA_KEY_TODAY_STATS}))
+
+        with patch.object(coordinator, "_fetch_data", side_effect=aiohttp.ClientError("boom")), \
+             patch.object(coordinator, "_schedule_refresh"):
+            await coordinator.async_refresh()
+
+        assert coordinator.last_update_success is True
+        assert coordinator.data["stale_since"] is not None
+        assert coordinator.data["data_version"] == 3
+        freshness_listener.assert_called_once()
+        stats_listener.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_revalidation_clears_stale_flag(self, mock_hass, coordinator_data):
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.data = {**coordinator_data, "stale_since": dt_util.now().isoformat()}
+
+        with patch.object(coordinator, "_fetch_data", return_value=None):
+            result = await coordinator._async_fetch_prices(dt_util.now())
+
+        assert result["stale_since"] is None
+        assert result["series"] is coordinator_data["series"]
+        assert coordinator._changed_keys == {DATA_KEY_FRESHNESS}
+
+
+class TestBackfillHistory:
+
+    @pytest.mark.asyncio
+    async def test_resumed_run_imports_only_backfilled_dates(self, mock_hass, aioclient_mock, day_records):
+        yesterday = dt_util.now().date() - timedelta(days=1)
+        dates = HistoryBackfill.business_dates(yesterday, 5)
+        missing = dates[2]
+        requested = []
+
+        async def respond(method, url, data):
+            business_date = url.query["$filter"].split("'")[1]
+            requested.append(business_date)
+            return AiohttpClientMockResponse(method, url, json={"value": day_records(business_date, [100.0] * 4)})
+
+        aioclient_mock.get(re.compile(re.escape(PSE_API_URL)), side_effect=respond)
+        store = Mock()
+        store.async_load = AsyncMock(return_value={"completed": [d for d in dates if d != missing]})
+        store.async_save = AsyncMock()
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.statistics_importer.async_import = AsyncMock(return_value=24)
+
+        async with aioclient_mock.create_session(asyncio.get_running_loop()) as session:
+            coordinator.session = session
+            with patch.object(coordinator_module, "Store", return_value=store):
+                result = await coordinator.async_backfill_history(5)
+
+        assert requested == [missing]
+        assert (result.dates, result.skipped, result.failed) == (1, 4, 0)
+        store.async_save.assert_awaited_once_with({"completed": sorted(dates)})
+        coordinator.statistics_importer.async_import.assert_awaited_once_with(
+            since=dt_util.start_of_local_day(date.fromisoformat(missing)),
+            until=dt_util.start_of_local_day(date.fromisoformat(missing) + timedelta(days=1)),
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_without_new_dates_skips_the_import(self, mock_hass):
+        store = Mock()
+        store.async_load = AsyncMock(return_value=None)
+        store.async_save = AsyncMock()
+        coordinator = RCEPSEDataUpdateCoordinator(mock_hass)
+        coordinator.session = Mock()
+        coordinator.statistics_importer.async_import = AsyncMock()
+
+        with patch.object(coordinator_module, "Store", return_value=store):
+            result = await coordinator.async_backfill_history(0)
+
+        assert result.dates == 0
+        store.async_save.assert_awaited_once_with({"completed": []})
+        coordinator.statistics_importer.async_import.assert_not_awaited()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.rce_prices.day_statistics import DayStatistics
+from custom_components.rce_prices.price_series import PriceSeries
+
+
+def _records() -> list[dict]:
+    return [
+        {"dtime": "2024-01-01 00:15:00", "period": "00:00 - 00:15", "rce_pln": "300.00", "business_date": "2024-01-01"},
+        {"dtime": "2024-01-01 00:30:00", "period": "00:15 - 00:30", "rce_pln": "100.00", "business_date": "2024-01-01"},
+        {"dtime": "2024-01-01 00:45:00", "period": "00:30 - 00:45", "rce_pln": "500.00", "business_date": "2024-01-01"},
+        {"dtime": "2024-01-01 01:00:00", "period": "00:45 - 01:00", "rce_pln": "100.00", "business_date": "2024-01-01"},
+        {"dtime": "2024-01-02 00:15:00", "period": "00:00 - 00:15", "rce_pln": "200.00", "business_date": "2024-01-02"},
+    ]
+
+
+class TestDayStatistics:
+
+    def test_from_data(self):
+        series = PriceSeries.from_records(_records()).for_date("2024-01-01")
+
+        statistics = DayStatistics.from_data(series)
+
+        assert statistics.count == 4
+        assert statistics.mean == 250.0
+        assert statistics.median == 200.0
+        assert statistics.min == 100.0
+        assert statistics.max == 500.0
+        assert statistics.range == 400.0
+        assert statistics.stddev == pytest.approx(165.83, abs=0.01)
+        assert statistics.percentiles[50] == 200.0
+
+    def test_extreme_records_span_first_and_last_occurrence(self):
+        series = PriceSeries.from_records(_records()).for_date("2024-01-01")
+
+        statistics = DayStatistics.from_data(series)
+
+        first, last = statistics.min_records
+        assert first["period"] == "00:15 - 00:30"
+        assert last["period"] == "00:45 - 01:00"
+        first, last = statistics.max_records
+        assert first is last
+
+    def test_from_record_list(self):
+        statistics = DayStatistics.from_data([{"rce_pln": "310.00"}, {"rce_pln": "210.00"}])
+
+        assert statistics.min == 210.0
+        assert statistics.mean == 260.0
+
+    def test_from_empty_data(self):
+        assert DayStatistics.from_data([]) is None
+        assert DayStatistics.from_data(PriceSeries.empty()) is None
+
+    def test_for_series_keys_by_business_date(self):
+        statistics = DayStatistics.for_series(PriceSeries.from_records(_records()))
+
+        assert set(statistics) == {"2024-01-01", "2024-01-02"}
+        assert statistics["2024-01-02"].count == 1
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.rce_prices.fetch_scheduler import FetchScheduler
+
+TODAY = "2024-06-10"
+TOMORROW = "2024-06-11"
+
+
+def _local(*args) -> datetime:
+    return datetime(*args, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+class TestFetchScheduler:
+
+    def test_missing_today_polls_often(self):
+        scheduler = FetchScheduler()
+
+        assert scheduler.next_interval(_local(2024, 6, 10, 3, 0), ()) == timedelta(minutes=5)
+
+    def test_idles_until_publication_ladder(self):
+        scheduler = FetchScheduler()
+
+        interval = scheduler.next_interval(_local(2024, 6, 10, 1, 0), (TODAY,))
+
+        assert interval == timedelta(hours=12, minutes=30)
+
+    def test_tightens_around_expected_publication(self):
+        scheduler = FetchScheduler()
+        dates = (TODAY,)
+
+        assert scheduler.next_interval(_local(2024, 6, 10, 13, 40), dates) == timedelta(minutes=10)
+        assert scheduler.next_interval(_local(2024, 6, 10, 14, 5), dates) == timedelta(minutes=2)
+        assert scheduler.next_interval(_local(2024, 6, 10, 14, 45), dates) == timedelta(minutes=5)
+        assert scheduler.next_interval(_local(2024, 6, 10, 16, 30), dates) == timedelta(minutes=15)
+        assert scheduler.next_interval(_local(2024, 6, 10, 20, 0), dates) == timedelta(minutes=30)
+
+    def test_idles_once_tomorrow_is_held(self):
+        scheduler = FetchScheduler()
+
+        interval = scheduler.next_interval(_local(2024, 6, 10, 14, 10), (TODAY, TOMORROW))
+
+        assert interval == timedelta(hours=23, minutes=20)
+
+    def test_records_time_to_fresh_data_once_per_date(self):
+        scheduler = FetchScheduler()
+        published_at = dt_util.parse_datetime("2024-06-10T12:00:00Z")
+
+        scheduler.record_request()
+        scheduler.record_fresh_data(dt_util.parse_datetime("2024-06-10T12:04:00Z"), TOMORROW, published_at)
+        scheduler.record_fresh_data(dt_util.parse_datetime("2024-06-10T12:30:00Z"), TOMORROW, published_at)
+
+        assert scheduler.as_dict() == {
+            "requests": 1,
+            "probes": 0,
+            "skipped_downloads": 0,
+            "unchanged_fetches": 0,
+            "coalesced_fetches": 0,
+            "last_fresh_date": TOMORROW,
+            "last_time_to_fresh_data": 240.0,
+        }
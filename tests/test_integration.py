@@ -11,10 +11,16 @@ from custom_components.rce_prices.config_flow import RCEConfigFlow, RCEOptionsFl
 from custom_components.rce_prices.const import DOMAIN
 
 
+@pytest.fixture(autouse=True)
+def mock_track_time_change():
+    with patch("custom_components.rce_prices.async_track_time_change") as track_time_change:
+        yield track_time_change
+
+
 class TestRCEPSEIntegration:
 
     @pytest.mark.asyncio
-    async def test_async_setup_entry_success(self, mock_hass):
+    async def test_async_setup_entry_success(self, mock_hass, mock_track_time_change):
         mock_entry = Mock(spec=ConfigEntry)
         mock_entry.runtime_data = None
         mock_entry.entry_id = "test_entry_id"
@@ -23,6 +29,7 @@ class TestRCEPSEIntegration:
             mock_coordinator = Mock()
             mock_coordinator_class.return_value = mock_coordinator
             mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+            mock_coordinator.async_load_cached_data = AsyncMock(return_value=False)
             
             mock_hass.config_entries = Mock()
             mock_hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
@@ -33,6 +40,33 @@ class TestRCEPSEIntegration:
             mock_coordinator_class.assert_called_once_with(mock_hass, mock_entry)
             mock_coordinator.async_config_entry_first_refresh.assert_called_once()
             assert mock_hass.data[DOMAIN][mock_entry.entry_id] == mock_coordinator
+            mock_track_time_change.assert_called_once_with(
+                mock_hass, mock_coordinator.async_handle_day_boundary, hour=[0, 14], minute=0, second=0
+            )
+
+    @pytest.mark.asyncio
+    async def test_async_setup_entry_serves_cached_data(self, mock_hass):
+        mock_entry = Mock(spec=ConfigEntry)
+        mock_entry.runtime_data = None
+        mock_entry.entry_id = "test_entry_id"
+
+        with patch("custom_components.rce_prices.RCEPSEDataUpdateCoordinator") as mock_coordinator_class:
+            mock_coordinator = Mock()
+            mock_coordinator_class.return_value = mock_coordinator
+            mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+            mock_coordinator.async_load_cached_data = AsyncMock(return_value=True)
+            mock_coordinator.async_refresh = Mock(return_value="refresh")
+
+            mock_hass.config_entries = Mock()
+            mock_hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
+
+            result = await async_setup_entry(mock_hass, mock_entry)
+
+            assert result is True
+            mock_coordinator.async_config_entry_first_refresh.assert_not_called()
+            mock_entry.async_create_background_task.assert_called_once()
+            assert mock_entry.async_create_background_task.call_args[0][:2] == (mock_hass, "refresh")
+            mock_hass.config_entries.async_forward_entry_setups.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_async_unload_entry_success(self, mock_hass):
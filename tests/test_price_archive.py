@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import pickle
+import threading
+
+from custom_components.rce_prices.price_archive import (
+    HEADER_SIZE,
+    RECORD_SIZE,
+    PriceArchive,
+    quarter_index,
+)
+
+
+class TestPriceArchive:
+
+    def test_year_file_is_fixed_width(self, tmp_path, day_records):
+        archive = PriceArchive(str(tmp_path))
+
+        assert archive.write_page(day_records("2024-06-01", [410.5, -12.25])) == 2
+
+        size = (tmp_path / "2024.rcea").stat().st_size
+        assert size == HEADER_SIZE + 366 * 96 * RECORD_SIZE
+
+    def test_read_returns_prices_in_grosze(self, tmp_path, day_records):
+        archive = PriceArchive(str(tmp_path))
+        archive.write_page(day_records("2024-06-01", [410.5, -12.25, 0.0, 99.99]))
+
+        # 2024-06-01 00:00 in Warsaw is 2024-05-31 22:00 UTC.
+        start = datetime(2024, 5, 31, 22, 0, tzinfo=timezone.utc)
+        chunks = archive.read(start, start + timedelta(hours=1))
+
+        assert len(chunks) == 1
+        assert chunks[0].prices.tolist() == [41050, -1225, 0, 9999]
+        assert chunks[0].quarters.tolist() == [quarter_index(start) + offset for offset in range(4)]
+        archive.close()
+
+    def test_unwritten_slots_have_zero_quarter(self, tmp_path, day_records):
+        archive = PriceArchive(str(tmp_path))
+        archive.write_page(day_records("2024-06-01", [100.0]))
+
+        start = datetime(2024, 5, 31, 22, 0, tzinfo=timezone.utc)
+        chunk = archive.read(start, start + timedelta(minutes=30))[0]
+
+        assert chunk.quarters.tolist() == [quarter_index(start), 0]
+        archive.close()
+
+    def test_rewriting_a_day_overwrites_its_slots(self, tmp_path, day_records):
+        archive = PriceArchive(str(tmp_path))
+        archive.write_page(day_records("2024-06-01", [100.0, 200.0]))
+        archive.write_page(day_records("2024-06-01", [150.0]))
+
+        start = datetime(2024, 5, 31, 22, 0, tzinfo=timezone.utc)
+        chunk = archive.read(start, start + timedelta(minutes=30))[0]
+
+        assert chunk.prices.tolist() == [15000, 20000]
+        archive.close()
+
+    def test_read_spans_year_files(self, tmp_path, day_records):
+        archive = PriceArchive(str(tmp_path))
+        archive.write_page(day_records("2024-12-31", [1.0] * 96))
+        archive.write_page(day_records("2025-01-01", [2.0] * 96))
+
+        start = datetime(2024, 12, 31, 12, 0, tzinfo=timezone.utc)
+        chunks = archive.read(start, start + timedelta(days=1))
+
+        assert [len(chunk.prices) for chunk in chunks] == [48, 48]
+        assert set(chunks[1].prices.tolist()) == {200}
+        archive.close()
+
+    def test_autumn_dst_repeated_hour_gets_distinct_quarters(self, tmp_path):
+        archive = PriceArchive(str(tmp_path))
+        records = [
+            {"dtime": "2024-10-27 02:15:00", "rce_pln": "1.00"},
+            {"dtime": "2024-10-27 02:15:00", "rce_pln": "2.00"},
+        ]
+
+        assert archive.write_page(records) == 2
+
+        # The first 02:00-02:15 is 00:00 UTC, the repeated one 01:00 UTC.
+        start = datetime(2024, 10, 27, 0, 0, tzinfo=timezone.utc)
+        chunk = archive.read(start, start + timedelta(hours=1, minutes=15))[0]
+
+        assert chunk.prices.tolist()[0] == 100
+        assert chunk.prices.tolist()[-1] == 200
+        archive.close()
+
+    def test_read_missing_year_returns_nothing(self, tmp_path):
+        archive = PriceArchive(str(tmp_path))
+        start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        assert archive.read(start, start + timedelta(days=30)) == []
+
+    def test_concurrent_first_writes_create_the_year_once(self, tmp_path, day_records):
+        days = ["2024-06-01", "2024-06-02", "2024-06-03"]
+
+        for trial in range(20):
+            archive = PriceArchive(str(tmp_path / str(trial)))
+            barrier = threading.Barrier(len(days))
+
+            def write(business_date: str) -> int:
+                barrier.wait()
+                return archive.write_page(day_records(business_date, [1.0] * 96))
+
+            with ThreadPoolExecutor(len(days)) as executor:
+                assert list(executor.map(write, days)) == [96] * len(days)
+
+            chunk, = archive.read(
+                datetime(2024, 5, 31, 22, tzinfo=timezone.utc), datetime(2024, 6, 3, 22, tzinfo=timezone.utc)
+            )
+            assert list(chunk.prices) == [100] * 3 * 96
+            archive.close()
+
+    def test_close_with_live_chunks(self, tmp_path, day_records):
+        archive = PriceArchive(str(tmp_path))
+        archive.write_page(day_records("2024-06-01", [100.0]))
+        start = datetime(2024, 5, 31, 22, 0, tzinfo=timezone.utc)
+        chunk = archive.read(start, start + timedelta(minutes=15))[0]
+
+        archive.close()
+
+        assert chunk.prices.tolist() == [10000]
+
+    def test_close_with_exported_year_view(self, tmp_path, day_records):
+        archive = PriceArchive(str(tmp_path))
+        archive.write_page(day_records("2024-06-01", [100.0]))
+        start = datetime(2024, 5, 31, 22, 0, tzinfo=timezone.utc)
+        chunk = archive.read(start, start + timedelta(minutes=15))[0]
+        exported = pickle.PickleBuffer(archive._year_view(2024))
+
+        archive.close()
+
+        assert chunk.prices.tolist() == [10000]
+        assert archive.read(start, start + timedelta(minutes=15))[0].prices.tolist() == [10000]
+        exported.release()
+        archive.close()
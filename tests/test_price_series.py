@@ -0,0 +1,549 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from custom_components.rce_prices.price_series import (
+    PriceSeries,
+    datetime_to_wall_clock,
+    parse_wall_clock,
+    wall_clock_to_datetime,
+)
+
+
+def _records() -> list[dict]:
+    return [
+        {"dtime": "2024-01-02 00:15:00", "rce_pln": "330.00", "business_date": "2024-01-02"},
+        {"dtime": "2024-01-01 00:30:00", "rce_pln": "-20.00", "business_date": "2024-01-01"},
+        {"dtime": "2024-01-01 00:15:00", "rce_pln": "300.00", "business_date": "2024-01-01"},
+        {"dtime": "invalid", "rce_pln": "100.00", "business_date": "2024-01-01"},
+        {"dtime": "2024-01-02 00:30:00", "rce_pln": "invalid", "business_date": "2024-01-02"},
+    ]
+
+
+class TestWallClock:
+
+    def test_round_trip(self):
+        value = parse_wall_clock("2024-01-01 10:15:00")
+
+        assert wall_clock_to_datetime(value) == datetime(2024, 1, 1, 10, 15)
+        assert datetime_to_wall_clock(datetime(2024, 1, 1, 10, 15)) == value
+
+
+class TestPriceSeries:
+
+    def test_from_records_builds_sorted_columns(self):
+        series = PriceSeries.from_records(_records())
+
+        assert len(series) == 3
+        assert series.business_dates == ("2024-01-01", "2024-01-02")
+        assert list(series.date_offsets) == [0, 2, 3]
+        assert series.prices.tolist() == [300.0, -20.0, 330.0]
+        assert series.prices_neg_to_zero.tolist() == [300.0, 0.0, 330.0]
+        assert series.end_ts[0] - series.start_ts[0] == 900
+        assert series[0]["dtime"] == "2024-01-01 00:15:00"
+
+    def test_for_date_returns_partition(self):
+        series = PriceSeries.from_records(_records())
+
+        today = series.for_date("2024-01-01")
+
+        assert len(today) == 2
+        assert all(record["business_date"] == "2024-01-01" for record in today)
+        assert today.business_dates == ("2024-01-01",)
+        assert series.for_date("2024-01-03") == []
+
+    def test_for_date_is_cached_zero_copy_view(self):
+        series = PriceSeries.from_records(_records())
+
+        today = series.for_date("2024-01-01")
+
+        assert series.for_date("2024-01-01") is today
+        assert today.prices.obj is series.prices.obj
+        assert today[-1]["dtime"] == "2024-01-01 00:30:00"
+        assert list(today) == list(series.records[:2])
+
+    def test_uses_existing_neg_to_zero_key(self):
+        series = PriceSeries.from_records([
+            {"dtime": "2024-01-01 00:15:00", "rce_pln": "-10.00", "rce_pln_neg_to_zero": "5.00"},
+        ])
+
+        assert series.prices_neg_to_zero.tolist() == [5.0]
+
+    def test_slice_keeps_date_offsets(self):
+        series = PriceSeries.from_records(_records())
+
+        window = series[1:3]
+
+        assert len(window) == 2
+        assert window.business_dates == ("2024-01-01", "2024-01-02")
+        assert list(window.date_offsets) == [0, 1, 2]
+
+    def test_coerce(self):
+        series = PriceSeries.from_records(_records())
+
+        assert PriceSeries.coerce(series) is series
+        assert PriceSeries.coerce([]) == []
+        assert PriceSeries.coerce(None) == []
+        assert len(PriceSeries.coerce(_records())) == 3
+
+    def test_index_at_uses_half_open_quarters(self):
+        series = PriceSeries.from_records(_records())
+        boundary = parse_wall_clock("2024-01-01 00:15:00")
+
+        assert series.index_at(boundary - 1) == 0
+        assert series.index_at(boundary) == 1
+        assert series.index_at(parse_wall_clock("2024-01-01 00:30:00")) is None
+        assert series.index_at(parse_wall_clock("2023-12-31 23:59:59")) is None
+
+    def test_index_at_or_before_falls_back_to_last_ended_quarter(self):
+        series = PriceSeries.from_records(_records())
+
+        assert series.index_at_or_before(parse_wall_clock("2024-01-01 00:20:00")) == 1
+        assert series.index_at_or_before(parse_wall_clock("2024-01-01 12:00:00")) == 1
+        assert series.index_at_or_before(parse_wall_clock("2024-01-02 00:10:00")) == 2
+        assert series.index_at_or_before(parse_wall_clock("2023-12-31 23:00:00")) is None
+
+    def test_index_lookups_on_day_view(self):
+        today = PriceSeries.from_records(_records()).for_date("2024-01-02")
+
+        assert today.index_at(parse_wall_clock("2024-01-02 00:05:00")) == 0
+        assert today.index_at_or_before(parse_wall_clock("2024-01-01 00:20:00")) is None
+
+
+class TestFromApiValues:
+
+    def test_hourly_prices_empty_data(self):
+        result = PriceSeries.from_api_values([], hourly_prices=True)
+        assert result == []
+
+    def test_hourly_prices_single_record(self):
+        data = [{
+            "dtime": "2024-01-01 00:15:00",
+            "period": "00:00 - 00:15",
+            "rce_pln": "350.00",
+            "business_date": "2024-01-01"
+        }]
+        
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+        assert len(result) == 1
+        assert result[0]["rce_pln"] == "350.00"
+
+    def test_hourly_prices_multiple_quarters_same_hour(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "300.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "320.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:45:00",
+                "period": "00:30 - 00:45",
+                "rce_pln": "340.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 01:00:00",
+                "period": "00:45 - 01:00",
+                "rce_pln": "360.00",
+                "business_date": "2024-01-01"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+        assert len(result) == 4
+        
+        expected_average = (300.00 + 320.00 + 340.00 + 360.00) / 4
+        for record in result:
+            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"] or "00:45" in record["period"]:
+                assert record["rce_pln"] == "330.00"
+
+    def test_hourly_prices_different_hours(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "300.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "320.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 01:15:00",
+                "period": "01:00 - 01:15",
+                "rce_pln": "400.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 01:30:00",
+                "period": "01:15 - 01:30",
+                "rce_pln": "420.00",
+                "business_date": "2024-01-01"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+        assert len(result) == 4
+        
+        hour_0_records = [r for r in result if "00:" in r["period"]]
+        for record in hour_0_records:
+            assert record["rce_pln"] == "310.00"
+        hour_1_records = [r for r in result if "01:" in r["period"]]
+        for record in hour_1_records:
+            assert record["rce_pln"] == "410.00"
+
+    def test_hourly_prices_different_dates(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "300.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "320.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-02 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "400.00",
+                "business_date": "2024-01-02"
+            },
+            {
+                "dtime": "2024-01-02 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "420.00",
+                "business_date": "2024-01-02"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+        assert len(result) == 4
+        
+        jan_1_records = [r for r in result if "2024-01-01" in r["dtime"]]
+        for record in jan_1_records:
+            assert record["rce_pln"] == "310.00"
+        jan_2_records = [r for r in result if "2024-01-02" in r["dtime"]]
+        for record in jan_2_records:
+            assert record["rce_pln"] == "410.00"
+
+    def test_hourly_prices_invalid_data_handling(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "300.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "invalid_date",
+                "period": "00:15 - 00:30",
+                "rce_pln": "320.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:30 - 00:45",
+                "rce_pln": "invalid_price",
+                "business_date": "2024-01-01"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+        assert len(result) == 2
+        for record in result:
+            assert record["rce_pln"] == "300.00"
+
+    def test_hourly_prices_with_negative_values(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "300.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "-50.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:45:00",
+                "period": "00:30 - 00:45",
+                "rce_pln": "200.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 01:00:00",
+                "period": "00:45 - 01:00",
+                "rce_pln": "100.00",
+                "business_date": "2024-01-01"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+        assert len(result) == 4
+        
+        expected_normal_average = (300.00 + (-50.00) + 200.00 + 100.00) / 4
+        expected_neg_to_zero_average = (300.00 + 0.00 + 200.00 + 100.00) / 4
+        
+        for record in result:
+            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"] or "00:45" in record["period"]:
+                assert record["rce_pln"] == f"{expected_normal_average:.2f}"
+                assert record["rce_pln_neg_to_zero"] == f"{expected_neg_to_zero_average:.2f}"
+
+    def test_hourly_prices_all_negative_values(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "-100.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "-200.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:45:00",
+                "period": "00:30 - 00:45",
+                "rce_pln": "-50.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 01:00:00",
+                "period": "00:45 - 01:00",
+                "rce_pln": "-150.00",
+                "business_date": "2024-01-01"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+        assert len(result) == 4
+        
+        expected_normal_average = (-100.00 + (-200.00) + (-50.00) + (-150.00)) / 4
+        expected_neg_to_zero_average = (0.00 + 0.00 + 0.00 + 0.00) / 4
+        
+        for record in result:
+            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"] or "00:45" in record["period"]:
+                assert record["rce_pln"] == f"{expected_normal_average:.2f}"
+                assert record["rce_pln_neg_to_zero"] == f"{expected_neg_to_zero_average:.2f}"
+
+    def test_hourly_prices_mixed_positive_negative_values(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "500.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "-100.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:45:00",
+                "period": "00:30 - 00:45",
+                "rce_pln": "300.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 01:00:00",
+                "period": "00:45 - 01:00",
+                "rce_pln": "-50.00",
+                "business_date": "2024-01-01"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+        assert len(result) == 4
+        
+        expected_normal_average = (500.00 + (-100.00) + 300.00 + (-50.00)) / 4
+        expected_neg_to_zero_average = (500.00 + 0.00 + 300.00 + 0.00) / 4
+        
+        for record in result:
+            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"] or "00:45" in record["period"]:
+                assert record["rce_pln"] == f"{expected_normal_average:.2f}"
+                assert record["rce_pln_neg_to_zero"] == f"{expected_neg_to_zero_average:.2f}"
+
+    def test_hourly_prices_zero_values(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "0.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "-50.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:45:00",
+                "period": "00:30 - 00:45",
+                "rce_pln": "100.00",
+                "business_date": "2024-01-01"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+        assert len(result) == 3
+        
+        expected_normal_average = (0.00 + (-50.00) + 100.00) / 3
+        expected_neg_to_zero_average = (0.00 + 0.00 + 100.00) / 3
+        
+        for record in result:
+            if "00:00" in record["period"] or "00:15" in record["period"] or "00:30" in record["period"]:
+                assert record["rce_pln"] == f"{expected_normal_average:.2f}"
+                assert record["rce_pln_neg_to_zero"] == f"{expected_neg_to_zero_average:.2f}"
+
+    def test_neg_to_zero_empty_data(self):
+        result = PriceSeries.from_api_values([])
+        assert result == []
+
+    def test_neg_to_zero_single_record_positive(self):
+        data = [{
+            "dtime": "2024-01-01 00:15:00",
+            "period": "00:00 - 00:15",
+            "rce_pln": "350.00",
+            "business_date": "2024-01-01"
+        }]
+        
+        result = PriceSeries.from_api_values(data)
+        assert len(result) == 1
+        assert result[0]["rce_pln"] == "350.00"
+        assert result[0]["rce_pln_neg_to_zero"] == "350.00"
+
+    def test_neg_to_zero_single_record_negative(self):
+        data = [{
+            "dtime": "2024-01-01 00:15:00",
+            "period": "00:00 - 00:15",
+            "rce_pln": "-50.00",
+            "business_date": "2024-01-01"
+        }]
+        
+        result = PriceSeries.from_api_values(data)
+        assert len(result) == 1
+        assert result[0]["rce_pln"] == "-50.00"
+        assert result[0]["rce_pln_neg_to_zero"] == "0.00"
+
+    def test_neg_to_zero_mixed_values(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "300.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "-100.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:45:00",
+                "period": "00:30 - 00:45",
+                "rce_pln": "0.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 01:00:00",
+                "period": "00:45 - 01:00",
+                "rce_pln": "-50.00",
+                "business_date": "2024-01-01"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data)
+        assert len(result) == 4
+        
+        assert result[0]["rce_pln"] == "300.00"
+        assert result[0]["rce_pln_neg_to_zero"] == "300.00"
+        
+        assert result[1]["rce_pln"] == "-100.00"
+        assert result[1]["rce_pln_neg_to_zero"] == "0.00"
+        
+        assert result[2]["rce_pln"] == "0.00"
+        assert result[2]["rce_pln_neg_to_zero"] == "0.00"
+        
+        assert result[3]["rce_pln"] == "-50.00"
+        assert result[3]["rce_pln_neg_to_zero"] == "0.00"
+
+    def test_neg_to_zero_invalid_data_handling(self):
+        data = [
+            {
+                "dtime": "2024-01-01 00:15:00",
+                "period": "00:00 - 00:15",
+                "rce_pln": "300.00",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:30:00",
+                "period": "00:15 - 00:30",
+                "rce_pln": "invalid_price",
+                "business_date": "2024-01-01"
+            },
+            {
+                "dtime": "2024-01-01 00:45:00",
+                "period": "00:30 - 00:45",
+                "rce_pln": "-50.00",
+                "business_date": "2024-01-01"
+            }
+        ]
+        
+        result = PriceSeries.from_api_values(data)
+        assert len(result) == 2
+        
+        assert result[0]["rce_pln"] == "300.00"
+        assert result[0]["rce_pln_neg_to_zero"] == "300.00"
+        
+        assert "rce_pln_neg_to_zero" not in data[1]
+        
+        assert result[1]["rce_pln"] == "-50.00"
+        assert result[1]["rce_pln_neg_to_zero"] == "0.00"
+
+    def test_neg_to_zero_adds_key_without_copying(self):
+        data = [{
+            "dtime": "2024-01-01 00:15:00",
+            "period": "00:00 - 00:15",
+            "rce_pln": -12.5,
+            "business_date": "2024-01-01"
+        }]
+
+        result = PriceSeries.from_api_values(data)
+
+        assert result[0] is data[0]
+        assert data[0]["rce_pln_neg_to_zero"] == "0.00"
+
+    def test_hourly_prices_leave_api_rows_unchanged(self):
+        data = [
+            {"dtime": "2024-01-01 00:15:00", "period": "00:00 - 00:15", "rce_pln": 100.0, "business_date": "2024-01-01"},
+            {"dtime": "2024-01-01 00:30:00", "period": "00:15 - 00:30", "rce_pln": 200.0, "business_date": "2024-01-01"},
+        ]
+
+        result = PriceSeries.from_api_values(data, hourly_prices=True)
+
+        assert [record["rce_pln"] for record in result] == ["150.00", "150.00"]
+        assert [record["rce_pln"] for record in data] == [100.0, 200.0]
+        assert result.prices.tolist() == [150.0, 150.0]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import random
+
+from custom_components.rce_prices.const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_OPEN_DURATION,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+from custom_components.rce_prices.retry_policy import RetryPolicy
+
+NOW = datetime(2024, 6, 10, 14, 0, tzinfo=timezone.utc)
+
+
+class TestRetryPolicy:
+
+    def test_delays_grow_exponentially_with_jitter(self):
+        policy = RetryPolicy(random.Random(1))
+
+        delays = [policy.record_failure(NOW) for _ in range(BREAKER_FAILURE_THRESHOLD - 1)]
+
+        for attempt, delay in enumerate(delays):
+            ceiling = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
+            assert ceiling / 2 <= delay <= ceiling
+        assert policy.state == "closed"
+        assert policy.next_retry == NOW + delays[-1]
+
+    def test_breaker_opens_after_threshold(self):
+        policy = RetryPolicy()
+        for _ in range(BREAKER_FAILURE_THRESHOLD):
+            policy.record_failure(NOW)
+
+        assert policy.state == "open"
+        assert policy.next_retry == NOW + BREAKER_OPEN_DURATION
+        assert policy.allow_request(NOW + timedelta(minutes=1)) is False
+
+    def test_half_open_trial_failure_reopens(self):
+        policy = RetryPolicy()
+        for _ in range(BREAKER_FAILURE_THRESHOLD):
+            policy.record_failure(NOW)
+        later = NOW + BREAKER_OPEN_DURATION
+
+        assert policy.allow_request(later) is True
+        assert policy.state == "half_open"
+
+        policy.record_failure(later)
+        assert policy.state == "open"
+        assert policy.next_retry == later + BREAKER_OPEN_DURATION
+
+    def test_success_closes_breaker(self):
+        policy = RetryPolicy()
+        for _ in range(BREAKER_FAILURE_THRESHOLD):
+            policy.record_failure(NOW)
+        policy.allow_request(NOW + BREAKER_OPEN_DURATION)
+
+        policy.record_success()
+
+        assert policy.as_dict() == {
+            "state": "closed",
+            "consecutive_failures": 0,
+            "total_failures": BREAKER_FAILURE_THRESHOLD,
+            "next_retry": None,
+            "opened_at": None,
+        }
+        assert policy.retry_interval(NOW) is None
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
@@ -37,7 +37,18 @@ from custom_components.rce_prices.sensors.today_hours import (
 from custom_components.rce_prices.sensors.tomorrow_hours import (
     RCETomorrowMinPriceWindowAvgPriceSensor,
 )
+from custom_components.rce_prices.calculation_cache import CalculationCache
+from custom_components.rce_prices.const import (
+    DATA_KEY_CURRENT_QUARTER,
+    DATA_KEY_FRESHNESS,
+    DATA_KEY_TODAY_PRICES,
+    DATA_KEY_TODAY_STATS,
+    DATA_KEY_TOMORROW_PRICES,
+    PRICE_ATTRIBUTE_KEYS,
+)
+from custom_components.rce_prices.coordinator import DayFreshness
 from custom_components.rce_prices.price_calculator import PriceCalculator
+from custom_components.rce_prices.shared_base import BUSINESS_DATE_KEYS
 
 
 class TestTodayMainSensors:
@@ -58,6 +69,25 @@ class TestTodayMainSensors:
             state = sensor.native_value
             assert state == 350.5
 
+    def test_today_main_price_sensor_schedules_next_quarter(self, mock_coordinator):
+        sensor = RCETodayMainSensor(mock_coordinator)
+        sensor.hass = mock_coordinator.hass
+        mock_coordinator._get_config_value.return_value = False
+        now = datetime(2024, 1, 1, 10, 59, 59, tzinfo=dt_util.UTC)
+
+        with patch("custom_components.rce_prices.shared_base.dt_util.utcnow", return_value=now), \
+             patch("custom_components.rce_prices.shared_base.async_track_point_in_utc_time") as mock_track, \
+             patch.object(sensor, "async_write_ha_state") as mock_write:
+            sensor._schedule_next_update()
+            mock_track.assert_called_once_with(
+                sensor.hass, sensor._handle_scheduled_update, datetime(2024, 1, 1, 11, 0, tzinfo=dt_util.UTC)
+            )
+
+            sensor._handle_scheduled_update(now)
+
+            mock_write.assert_called_once()
+            assert mock_track.call_count == 2
+
     def test_today_main_price_sensor_state_no_data(self, mock_coordinator):
         sensor = RCETodayMainSensor(mock_coordinator)
         
@@ -123,12 +153,8 @@ class TestTodayStatsSensors:
                 {"rce_pln": "350.00"},
             ]
 
-            with patch.object(sensor.calculator, "find_extreme_price_records") as mock_find:
-                mock_find.return_value = [{"rce_pln": "250.00"}]
-
-                state = sensor.native_value
-                assert state == 250.0
-                mock_find.assert_called_once_with(mock_today_data.return_value, is_max=False)
+            state = sensor.native_value
+            assert state == 250.0
 
     def test_today_median_price_sensor(self, mock_coordinator):
         sensor = RCETodayMedianPriceSensor(mock_coordinator)
@@ -169,6 +195,29 @@ class TestTodayStatsSensors:
                 state = sensor.native_value
                 assert state == pytest.approx(20.0)
 
+    def test_today_current_vs_average_advances_between_fetches(self, mock_coordinator):
+        sensor = RCETodayCurrentVsAverageSensor(mock_coordinator)
+        sensor.hass = mock_coordinator.hass
+        mock_coordinator._get_config_value.return_value = False
+        now = datetime(2024, 1, 1, 10, 14, tzinfo=dt_util.UTC)
+        states = []
+
+        with patch.object(sensor, "get_today_data", return_value=[{"rce_pln": "300.00"}, {"rce_pln": "400.00"}]), \
+             patch.object(sensor, "get_current_price_data", side_effect=[{"rce_pln": "420.00"}, {"rce_pln": "280.00"}]), \
+             patch("custom_components.rce_prices.shared_base.dt_util.utcnow", return_value=now), \
+             patch("custom_components.rce_prices.shared_base.async_track_point_in_utc_time") as mock_track, \
+             patch.object(sensor, "async_write_ha_state", side_effect=lambda: states.append(sensor.native_value)):
+            states.append(sensor.native_value)
+            sensor._schedule_next_update()
+            mock_track.assert_called_once_with(
+                sensor.hass, sensor._handle_scheduled_update, datetime(2024, 1, 1, 10, 15, tzinfo=dt_util.UTC)
+            )
+
+            sensor._handle_scheduled_update(datetime(2024, 1, 1, 10, 15, tzinfo=dt_util.UTC))
+
+        assert states == [pytest.approx(20.0), pytest.approx(-20.0)]
+        assert mock_coordinator.async_refresh.call_count == 0
+
     def test_stats_sensors_no_data(self, mock_coordinator):
         sensors = [
             RCETodayAvgPriceSensor(mock_coordinator),
@@ -390,9 +439,52 @@ class TestSensorAttributes:
             assert "last_update" in attrs
             assert "prices" in attrs
             assert attrs["data_points"] == 3
-            for rec in attrs["prices"]:
-                assert "rce_pln_neg_to_zero" not in rec
-                assert "publication_ts" not in rec
+            assert set(attrs["prices"]) == set(PRICE_ATTRIBUTE_KEYS)
+            assert attrs["prices"]["rce_pln"] == ["300.00", "350.00", "400.00"]
+
+    def test_main_sensor_reports_day_freshness(self, mock_coordinator):
+        today = BUSINESS_DATE_KEYS.today
+        mock_coordinator.data = {
+            **mock_coordinator.data,
+            "freshness": {today: DayFreshness("2024-01-01T10:05:00+01:00", "2024-01-01T10:00:00Z")},
+            "stale_since": "2024-01-01T12:00:00+01:00",
+        }
+        sensor = RCETodayMainSensor(mock_coordinator)
+
+        attrs = sensor.extra_state_attributes
+
+        assert attrs["fetched_at"] == "2024-01-01T10:05:00+01:00"
+        assert attrs["published_at"] == "2024-01-01T10:00:00Z"
+        assert attrs["stale"] is True
+        assert attrs["stale_since"] == "2024-01-01T12:00:00+01:00"
+        assert sensor.available is True
+
+    def test_today_price_attribute_is_cached_and_unrecorded(self, mock_coordinator):
+        mock_coordinator.data = {
+            **mock_coordinator.data,
+            "data_version": 1,
+            "calculation_cache": CalculationCache(16),
+        }
+        sensor = RCETodayMainSensor(mock_coordinator)
+
+        first = sensor.extra_state_attributes["prices"]
+        second = sensor.extra_state_attributes["prices"]
+
+        assert first is second
+        assert "prices" in sensor._unrecorded_attributes
+        assert "prices" in RCETomorrowMainSensor._unrecorded_attributes
+
+    def test_sensors_subscribe_to_their_data_keys(self, mock_coordinator):
+        assert RCETodayMainSensor(mock_coordinator).coordinator_context == {
+            DATA_KEY_CURRENT_QUARTER,
+            DATA_KEY_FRESHNESS,
+            DATA_KEY_TODAY_PRICES,
+        }
+        assert RCETomorrowMainSensor(mock_coordinator).coordinator_context == {
+            DATA_KEY_FRESHNESS,
+            DATA_KEY_TOMORROW_PRICES,
+        }
+        assert RCETodayAvgPriceSensor(mock_coordinator).coordinator_context == {DATA_KEY_TODAY_STATS}
 
     def test_sensor_device_info_consistency(self, mock_coordinator):
         sensors = [
@@ -563,9 +655,8 @@ class TestTomorrowMainSensor:
                         assert attrs["available_after"] == "14:00 CET"
                         assert "tomorrow_price_for_hour" in attrs
                         assert attrs["tomorrow_price_for_hour"]["rce_pln"] == "350.00"
-                        for rec in attrs["prices"]:
-                            assert "rce_pln_neg_to_zero" not in rec
-                            assert "publication_ts" not in rec
+                        assert set(attrs["prices"]) == set(PRICE_ATTRIBUTE_KEYS)
+                        assert all(len(column) == 2 for column in attrs["prices"].values())
 
     def test_tomorrow_price_extra_state_attributes_data_not_available(self, mock_coordinator):
         sensor = RCETomorrowMainSensor(mock_coordinator)
@@ -584,7 +675,7 @@ class TestTomorrowMainSensor:
                 assert attrs["current_minute"] == 30
                 assert attrs["current_time"] == "2024-01-01T10:30:00+00:00"
                 assert attrs["data_points"] == 0
-                assert attrs["prices"] == []
+                assert attrs["prices"] == {key: [] for key in PRICE_ATTRIBUTE_KEYS}
                 assert attrs["available_after"] == "14:00 CET"
 
     def test_tomorrow_price_with_rounding(self, mock_coordinator):
@@ -601,11 +692,20 @@ class TestTomorrowMainSensor:
                     price = sensor.native_value
                     assert price == 350.46 
 
-    def test_tomorrow_price_sensor_scan_interval(self, mock_coordinator):
+    def test_tomorrow_price_sensor_scheduled_on_quarter_boundaries(self, mock_coordinator):
         sensor = RCETomorrowMainSensor(mock_coordinator)
-        
-        assert sensor.scan_interval == timedelta(minutes=1)
-        assert sensor.should_poll is True
+        mock_coordinator._get_config_value.return_value = False
+        now = datetime(2024, 1, 1, 10, 7, 30, tzinfo=dt_util.UTC)
+
+        assert sensor.should_poll is False
+        assert sensor._next_update_time(now) == datetime(2024, 1, 1, 10, 15, tzinfo=dt_util.UTC)
+
+    def test_tomorrow_price_sensor_scheduled_on_hour_boundaries_in_hourly_mode(self, mock_coordinator):
+        sensor = RCETomorrowMainSensor(mock_coordinator)
+        mock_coordinator._get_config_value.return_value = True
+        now = datetime(2024, 1, 1, 10, 15, tzinfo=dt_util.UTC)
+
+        assert sensor._next_update_time(now) == datetime(2024, 1, 1, 11, 0, tzinfo=dt_util.UTC)
 
     def test_tomorrow_price_updates_every_15_minutes(self, mock_coordinator):
         sensor = RCETomorrowMainSensor(mock_coordinator)
@@ -667,12 +767,8 @@ class TestTomorrowStatsSensors:
                 {"rce_pln": "410.00"},
             ]
 
-            with patch.object(sensor.calculator, "find_extreme_price_records") as mock_find:
-                mock_find.return_value = [{"rce_pln": "210.00"}]
-
-                state = sensor.native_value
-                assert state == 210.0
-                mock_find.assert_called_once_with(mock_tomorrow_data.return_value, is_max=False)
+            state = sensor.native_value
+            assert state == 210.0
 
 
 class TestMinPriceWindowSensors:
@@ -805,4 +901,18 @@ class TestPriceCalculatorCheapestWindow:
 
         assert len(result) == 2
         assert result[0]["dtime"] == "2024-01-01 06:15:00"
-        assert result[1]["dtime"] == "2024-01-01 06:30:00"
\ No newline at end of file
+        assert result[1]["dtime"] == "2024-01-01 06:30:00"
+
+    def test_find_cheapest_window_prefers_earliest_on_tie(self):
+        data = [
+            {"dtime": "2024-01-01 10:15:00", "rce_pln": "0.10"},
+            {"dtime": "2024-01-01 10:30:00", "rce_pln": "0.20"},
+            {"dtime": "2024-01-01 10:45:00", "rce_pln": "0.10"},
+            {"dtime": "2024-01-01 11:00:00", "rce_pln": "0.20"},
+            {"dtime": "2024-01-01 11:15:00", "rce_pln": "0.10"},
+        ]
+
+        result = PriceCalculator.find_cheapest_window(data, 2)
+
+        assert len(result) == 2
+        assert result[0]["dtime"] == "2024-01-01 10:15:00"
@@ -8,6 +8,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from custom_components.rce_prices.calculation_cache import CalculationCache
+from custom_components.rce_prices.price_calculator import WindowQuery
 from custom_components.rce_prices.sensors.base import PriceCalculator, RCEBaseSensor
 
 
@@ -249,6 +251,71 @@ class TestPriceCalculator:
 
         assert window_starts[0].hour != window_starts[1].hour
 
+    def test_find_top_windows_keeps_best_window_per_start_hour(self):
+        data = [
+            {"rce_pln": "100.00", "dtime": "2024-01-01 07:15:00"},
+            {"rce_pln": "100.00", "dtime": "2024-01-01 07:30:00"},
+            {"rce_pln": "100.00", "dtime": "2024-01-01 07:45:00"},
+            {"rce_pln": "100.00", "dtime": "2024-01-01 08:00:00"},
+            {"rce_pln": "300.00", "dtime": "2024-01-02 07:15:00"},
+            {"rce_pln": "300.00", "dtime": "2024-01-02 07:30:00"},
+            {"rce_pln": "300.00", "dtime": "2024-01-02 07:45:00"},
+            {"rce_pln": "300.00", "dtime": "2024-01-02 08:00:00"},
+        ]
+
+        distinct = PriceCalculator.find_top_windows(data, 7, 9, 1, top_n=2, is_max=True)
+        all_windows = PriceCalculator.find_top_windows(
+            data, 7, 9, 1, top_n=2, is_max=True, distinct_start_hour=False
+        )
+
+        assert len(distinct) == 1
+        assert distinct[0][0]["dtime"] == "2024-01-02 07:15:00"
+        assert [window[0]["dtime"] for window in all_windows] == [
+            "2024-01-02 07:15:00",
+            "2024-01-01 07:15:00",
+        ]
+
+    def test_find_top_windows_prefers_earliest_on_tie(self):
+        data = [
+            {"rce_pln": "0.10", "dtime": "2024-01-01 07:15:00"},
+            {"rce_pln": "0.20", "dtime": "2024-01-01 07:30:00"},
+            {"rce_pln": "0.30", "dtime": "2024-01-01 07:45:00"},
+            {"rce_pln": "0.40", "dtime": "2024-01-01 08:00:00"},
+            {"rce_pln": "0.40", "dtime": "2024-01-01 08:15:00"},
+            {"rce_pln": "0.30", "dtime": "2024-01-01 08:30:00"},
+            {"rce_pln": "0.20", "dtime": "2024-01-01 08:45:00"},
+            {"rce_pln": "0.10", "dtime": "2024-01-01 09:00:00"},
+        ]
+
+        windows = PriceCalculator.find_top_windows(data, 7, 9, 1, top_n=2, is_max=False)
+
+        assert [window[0]["dtime"] for window in windows] == [
+            "2024-01-01 07:15:00",
+            "2024-01-01 08:15:00",
+        ]
+
+    def test_batch_windows_matches_single_queries(self):
+        data = [
+            {"rce_pln": str(100 + (index * 37) % 90), "dtime": f"2024-01-01 {(index + 1) // 4:02d}:{(index + 1) % 4 * 15:02d}:00"}
+            for index in range(95)
+        ]
+        data.append({"rce_pln": "150", "dtime": "2024-01-02 00:00:00"})
+        cheapest = WindowQuery.min_price_window(4)
+        morning = WindowQuery(5, 10, 4, is_max=True, top_n=2, full_hour_start=True, distinct_start_hour=True)
+        service = WindowQuery(8, 16, 8)
+
+        results = PriceCalculator.batch_windows(data, [cheapest, morning, service, morning])
+
+        assert set(results) == {cheapest, morning, service}
+        assert results[cheapest] == [PriceCalculator.find_cheapest_window(data, 4)]
+        assert results[morning] == PriceCalculator.find_top_windows(data, 5, 10, 1, top_n=2, is_max=True)
+        assert results[service] == [PriceCalculator.find_optimal_window(data, 8, 16, 2)]
+
+    def test_batch_windows_empty_data(self):
+        query = WindowQuery.min_price_window(4)
+
+        assert PriceCalculator.batch_windows([], [query]) == {query: []}
+
 
 class TestRCEBaseSensor:
 
@@ -260,6 +327,28 @@ class TestRCEBaseSensor:
         assert sensor._attr_translation_key == "rce_prices_test_sensor"
         assert sensor.calculator is not None
 
+    def test_calculate_memoizes_per_data_version(self, mock_coordinator):
+        sensor = RCEBaseSensor(mock_coordinator, "test_sensor")
+        cache = CalculationCache(8)
+        mock_coordinator.data = {"data_version": 1, "calculation_cache": cache}
+        function = Mock(return_value=[1.0], __name__="get_prices_from_data")
+
+        assert sensor.calculate("2024-01-01", function, [{"rce_pln": "1.00"}]) == [1.0]
+        assert sensor.calculate("2024-01-01", function, [{"rce_pln": "1.00"}]) == [1.0]
+        mock_coordinator.data = {"data_version": 2, "calculation_cache": cache}
+        sensor.calculate("2024-01-01", function, [{"rce_pln": "1.00"}])
+
+        assert function.call_count == 2
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+    def test_calculate_without_cache(self, mock_coordinator):
+        sensor = RCEBaseSensor(mock_coordinator, "test_sensor")
+        function = Mock(return_value=3)
+
+        assert sensor.calculate("2024-01-01", function, [], 4, top_n=2) == 3
+        function.assert_called_once_with([], 4, top_n=2)
+
     def test_device_info(self, mock_coordinator):
         sensor = RCEBaseSensor(mock_coordinator, "test_sensor")
         device_info = sensor.device_info
@@ -300,6 +389,62 @@ class TestRCEBaseSensor:
             
             assert len(tomorrow_data) == 0
 
+    def test_business_date_keys_cached_until_midnight(self):
+        from homeassistant.util import dt as dt_util
+        from unittest.mock import patch
+        from custom_components.rce_prices.shared_base import BusinessDateKeys
+
+        keys = BusinessDateKeys()
+        today = dt_util.now().strftime("%Y-%m-%d")
+        tomorrow = (dt_util.start_of_local_day() + timedelta(days=1)).strftime("%Y-%m-%d")
+
+        assert keys.today == today
+        with patch("homeassistant.util.dt.now") as mock_now:
+            assert keys.today == today
+            assert keys.tomorrow == tomorrow
+            mock_now.assert_not_called()
+
+    def test_business_date_keys_follow_home_assistant_clock(self):
+        from homeassistant.util import dt as dt_util
+        from unittest.mock import patch
+        from custom_components.rce_prices.shared_base import BusinessDateKeys
+
+        keys = BusinessDateKeys()
+        assert keys.today == dt_util.now().strftime("%Y-%m-%d")
+
+        later = dt_util.now() + timedelta(days=2)
+        with patch("homeassistant.util.dt.now", return_value=later), \
+             patch("homeassistant.util.dt.utcnow", return_value=dt_util.as_utc(later)):
+            assert keys.today == later.strftime("%Y-%m-%d")
+
+    def test_business_date_keys_follow_clock_backwards(self):
+        from homeassistant.util import dt as dt_util
+        from unittest.mock import patch
+        from custom_components.rce_prices.shared_base import BusinessDateKeys
+
+        keys = BusinessDateKeys()
+        assert keys.today == dt_util.now().strftime("%Y-%m-%d")
+
+        earlier = dt_util.now() - timedelta(days=2)
+        with patch("homeassistant.util.dt.now", return_value=earlier), \
+             patch("homeassistant.util.dt.utcnow", return_value=dt_util.as_utc(earlier)):
+            assert keys.today == earlier.strftime("%Y-%m-%d")
+            assert keys.tomorrow == (earlier + timedelta(days=1)).strftime("%Y-%m-%d")
+
+    def test_business_date_keys_follow_time_zone_change(self):
+        from homeassistant.util import dt as dt_util
+        from custom_components.rce_prices.shared_base import BusinessDateKeys
+
+        keys = BusinessDateKeys()
+        original = dt_util.DEFAULT_TIME_ZONE
+        try:
+            dt_util.set_default_time_zone(dt_util.get_time_zone("Pacific/Kiritimati"))
+            assert keys.today == dt_util.now().strftime("%Y-%m-%d")
+            dt_util.set_default_time_zone(dt_util.get_time_zone("Pacific/Pago_Pago"))
+            assert keys.today == dt_util.now().strftime("%Y-%m-%d")
+        finally:
+            dt_util.set_default_time_zone(original)
+
     def test_get_data_summary(self, mock_coordinator):
         sensor = RCEBaseSensor(mock_coordinator, "test_sensor")
         
@@ -336,10 +481,17 @@ class TestRCEBaseSensor:
     def test_available_property_no_data(self, mock_coordinator):
         sensor = RCEBaseSensor(mock_coordinator, "test_sensor")
         
-        mock_coordinator.last_update_success = False
+        mock_coordinator.data = None
         
         assert sensor.available is False
 
+    def test_available_while_serving_stale_data(self, mock_coordinator):
+        sensor = RCEBaseSensor(mock_coordinator, "test_sensor")
+        
+        mock_coordinator.last_update_success = False
+        
+        assert sensor.available is True
+
     def test_get_tomorrow_price_at_time_exact_match(self, mock_coordinator):
         from unittest.mock import patch
         from datetime import datetime
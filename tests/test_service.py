@@ -10,19 +10,25 @@ from homeassistant.exceptions import ServiceValidationError
 from homeassistant.util import dt as dt_util
 
 from custom_components.rce_prices import (
+    SERVICE_BACKFILL_HISTORY_SCHEMA,
     SERVICE_FIND_CHEAPEST_WINDOW_SCHEMA,
+    _async_handle_backfill_history,
     _async_handle_find_cheapest_window,
     async_setup,
 )
 from custom_components.rce_prices.const import (
+    ATTR_DAYS,
     ATTR_DURATION_HOURS,
     ATTR_END_HOUR,
     ATTR_START_HOUR,
+    DEFAULT_BACKFILL_DAYS,
     DEFAULT_SERVICE_END_HOUR,
     DEFAULT_SERVICE_START_HOUR,
     DOMAIN,
+    SERVICE_BACKFILL_HISTORY,
     SERVICE_FIND_CHEAPEST_WINDOW,
 )
+from custom_components.rce_prices.price_series import PriceSeries
 
 
 def _build_quarter_record(today: str, hour: int, minute: int, price: float) -> dict:
@@ -71,8 +77,8 @@ class TestFindCheapestWindowService:
         result = await async_setup(mock_hass, {})
 
         assert result is True
-        mock_hass.services.async_register.assert_called_once()
-        args, kwargs = mock_hass.services.async_register.call_args
+        assert mock_hass.services.async_register.call_count == 2
+        args, kwargs = mock_hass.services.async_register.call_args_list[0]
         assert args[0] == DOMAIN
         assert args[1] == SERVICE_FIND_CHEAPEST_WINDOW
         assert kwargs["supports_response"] == SupportsResponse.ONLY
@@ -91,7 +97,7 @@ class TestFindCheapestWindowService:
     @pytest.mark.asyncio
     async def test_handler_returns_hourly_averages(self, mock_hass):
         coordinator = Mock()
-        coordinator.data = {"raw_data": _build_today_quarter_data()}
+        coordinator.data = {"series": PriceSeries.from_records(_build_today_quarter_data())}
         mock_hass.data[DOMAIN] = {"entry_1": coordinator}
 
         call = Mock()
@@ -127,7 +133,7 @@ class TestFindCheapestWindowService:
     @pytest.mark.asyncio
     async def test_handler_raises_when_duration_does_not_fit(self, mock_hass):
         coordinator = Mock()
-        coordinator.data = {"raw_data": _build_today_quarter_data()}
+        coordinator.data = {"series": PriceSeries.from_records(_build_today_quarter_data())}
         mock_hass.data[DOMAIN] = {"entry_1": coordinator}
 
         call = Mock()
@@ -138,4 +144,61 @@ class TestFindCheapestWindowService:
         }
 
         with pytest.raises(ServiceValidationError):
-            await _async_handle_find_cheapest_window(mock_hass, call)
\ No newline at end of file
+            await _async_handle_find_cheapest_window(mock_hass, call)
+
+
+class TestBackfillHistoryService:
+
+    @pytest.mark.asyncio
+    async def test_async_setup_registers_service(self, mock_hass):
+        mock_hass.services = Mock()
+        mock_hass.services.has_service = Mock(return_value=False)
+        mock_hass.services.async_register = Mock()
+
+        await async_setup(mock_hass, {})
+
+        args, kwargs = mock_hass.services.async_register.call_args_list[1]
+        assert args[:2] == (DOMAIN, SERVICE_BACKFILL_HISTORY)
+        assert kwargs["schema"] is SERVICE_BACKFILL_HISTORY_SCHEMA
+
+    def test_service_schema(self):
+        assert SERVICE_BACKFILL_HISTORY_SCHEMA({})[ATTR_DAYS] == DEFAULT_BACKFILL_DAYS
+        assert SERVICE_BACKFILL_HISTORY_SCHEMA({ATTR_DAYS: "365"})[ATTR_DAYS] == 365
+
+        with pytest.raises(vol.Invalid):
+            SERVICE_BACKFILL_HISTORY_SCHEMA({ATTR_DAYS: 0})
+
+    @pytest.mark.asyncio
+    async def test_handler_starts_backfill(self, mock_hass):
+        coordinator = Mock()
+        coordinator.async_start_backfill = Mock(return_value=True)
+        mock_hass.data[DOMAIN] = {"entry_1": coordinator}
+
+        call = Mock()
+        call.data = {ATTR_DAYS: 90}
+
+        await _async_handle_backfill_history(mock_hass, call)
+
+        coordinator.async_start_backfill.assert_called_once_with(90)
+
+    @pytest.mark.asyncio
+    async def test_handler_raises_when_already_running(self, mock_hass):
+        coordinator = Mock()
+        coordinator.async_start_backfill = Mock(return_value=False)
+        mock_hass.data[DOMAIN] = {"entry_1": coordinator}
+
+        call = Mock()
+        call.data = {ATTR_DAYS: 30}
+
+        with pytest.raises(ServiceValidationError):
+            await _async_handle_backfill_history(mock_hass, call)
+
+    @pytest.mark.asyncio
+    async def test_handler_raises_when_no_coordinator(self, mock_hass):
+        mock_hass.data[DOMAIN] = {}
+
+        call = Mock()
+        call.data = {ATTR_DAYS: 30}
+
+        with pytest.raises(ServiceValidationError):
+            await _async_handle_backfill_history(mock_hass, call)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from custom_components.rce_prices import statistics_importer
+from custom_components.rce_prices.price_archive import PriceArchive
+from custom_components.rce_prices.statistics_importer import (
+    STATISTIC_ID,
+    PriceStatisticsImporter,
+    hourly_rows,
+)
+
+NOW = datetime(2024, 6, 2, 10, 0, tzinfo=timezone.utc)
+
+
+async def _run_in_place(func, *args):
+    return func(*args)
+
+
+@pytest.fixture
+def recorder_hass(mock_hass):
+    mock_hass.config.components = {"recorder"}
+    mock_hass.async_add_executor_job = _run_in_place
+    return mock_hass
+
+
+@pytest.fixture
+def recorder(recorder_hass):
+    instance = Mock()
+    instance.async_add_executor_job = _run_in_place
+    with patch.object(statistics_importer, "get_instance", return_value=instance), \
+         patch.object(statistics_importer, "get_last_statistics", return_value={}) as last_statistics, \
+         patch.object(statistics_importer, "async_add_external_statistics") as add_statistics, \
+         patch.object(statistics_importer.dt_util, "utcnow", return_value=NOW):
+        yield last_statistics, add_statistics
+
+
+class TestHourlyRows:
+
+    def test_aggregates_complete_hours(self, tmp_path, day_records):
+        archive = PriceArchive(str(tmp_path))
+        archive.write_page(day_records("2024-06-01", [100.0, 200.0, -40.0, 60.0, 10.0]))
+        start = datetime(2024, 5, 31, 22, 0, tzinfo=timezone.utc)
+
+        rows = hourly_rows(archive, start, start + timedelta(hours=2))
+
+        # The second hour only has one quarter archived and is left out.
+        assert rows == [(int(start.timestamp()), 80.0, -40.0, 200.0)]
+        archive.close()
+
+
+class TestPriceStatisticsImporter:
+
+    @pytest.mark.asyncio
+    async def test_archives_without_recorder(self, mock_hass, tmp_path, day_records):
+        mock_hass.async_add_executor_job = _run_in_place
+        importer = PriceStatisticsImporter(mock_hass, PriceArchive(str(tmp_path)))
+
+        assert importer.available is False
+        assert await importer.async_import(day_records("2024-06-01", [1.0] * 96)) == 0
+        assert (tmp_path / "2024.rcea").exists()
+
+    @pytest.mark.asyncio
+    async def test_future_hours_are_not_imported(self, recorder_hass, recorder, tmp_path, day_records):
+        _last_statistics, add_statistics = recorder
+        importer = PriceStatisticsImporter(recorder_hass, PriceArchive(str(tmp_path)))
+
+        imported = await importer.async_import(day_records("2024-06-02", [100.0] * 96))
+
+        # 2024-06-02 starts at 22:00 UTC the day before; NOW is 10:00 UTC.
+        assert imported == 12
+        assert add_statistics.call_args[0][2][-1]["start"] == NOW - timedelta(hours=1)
+
+    @pytest.mark.asyncio
+    async def test_import_range_is_bounded(self, recorder_hass, recorder, tmp_path, day_records):
+        _last_statistics, add_statistics = recorder
+        archive = PriceArchive(str(tmp_path))
+        archive.write_page(day_records("2024-05-31", [50.0] * 96))
+        archive.write_page(day_records("2024-06-01", [100.0] * 96))
+        importer = PriceStatisticsImporter(recorder_hass, archive)
+        since = datetime(2024, 5, 30, 22, 0, tzinfo=timezone.utc)
+
+        imported = await importer.async_import(since=since, until=since + timedelta(days=1))
+
+        assert imported == 24
+        rows = add_statistics.call_args[0][2]
+        assert (rows[0]["start"], rows[-1]["start"]) == (since, since + timedelta(hours=23))
+        assert {row["mean"] for row in rows} == {50.0}
+
+    @pytest.mark.asyncio
+    async def test_first_import_covers_archive(self, recorder_hass, recorder, tmp_path, day_records):
+        _last_statistics, add_statistics = recorder
+        importer = PriceStatisticsImporter(recorder_hass, PriceArchive(str(tmp_path)))
+
+        imported = await importer.async_import(day_records("2024-06-01", [100.0] * 96))
+
+        assert imported == 24
+        metadata, statistics = add_statistics.call_args[0][1:]
+        assert metadata["statistic_id"] == STATISTIC_ID
+        assert metadata["source"] == "rce_prices"
+        assert statistics[0]["start"] == datetime(2024, 5, 31, 22, 0, tzinfo=timezone.utc)
+        assert statistics[0]["mean"] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_import_is_incremental(self, recorder_hass, recorder, tmp_path, day_records):
+        last_statistics, add_statistics = recorder
+        last_start = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+        last_statistics.return_value = {STATISTIC_ID: [{"start": last_start.timestamp()}]}
+        importer = PriceStatisticsImporter(recorder_hass, PriceArchive(str(tmp_path)))
+
+        imported = await importer.async_import(day_records("2024-06-01", [100.0] * 96))
+
+        assert imported == 9
+        statistics = add_statistics.call_args[0][2]
+        assert statistics[0]["start"] == last_start + timedelta(hours=1)
+
+    @pytest.mark.asyncio
+    async def test_import_is_batched(self, recorder_hass, recorder, tmp_path, day_records):
+        _last_statistics, add_statistics = recorder
+        archive = PriceArchive(str(tmp_path))
+        for offset in range(3):
+            business_date = (datetime(2024, 5, 30) + timedelta(days=offset)).strftime("%Y-%m-%d")
+            archive.write_page(day_records(business_date, [50.0] * 96))
+        importer = PriceStatisticsImporter(recorder_hass, archive)
+
+        with patch.object(statistics_importer, "STATISTICS_IMPORT_BATCH_HOURS", 30):
+            imported = await importer.async_import(since=datetime(2024, 5, 29, 22, 0, tzinfo=timezone.utc))
+
+        assert imported == 72
+        assert [len(call.args[2]) for call in add_statistics.call_args_list] == [30, 30, 12]
@@ -7,6 +7,7 @@ import pytest
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.util import dt as dt_util
 
+from custom_components.rce_prices.price_series import PriceSeries
 from custom_components.rce_prices.sensors.today_hours import (
     RCETodayMaxPriceHourStartTimestampSensor,
     RCETodayMaxPriceHourEndTimestampSensor,
@@ -82,7 +83,7 @@ def extended_api_data():
             })
     
     return {
-        "raw_data": today_data + tomorrow_data,
+        "series": PriceSeries.from_records(today_data + tomorrow_data),
         "last_update": dt_util.now().isoformat(),
     }
 
@@ -161,11 +162,8 @@ class TestTodayMaxPriceTimestampSensors:
                 {"dtime": "invalid-datetime", "rce_pln": "500.00"}
             ]
             
-            with patch.object(sensor.calculator, "find_extreme_price_records") as mock_find:
-                mock_find.return_value = [{"dtime": "invalid-datetime", "rce_pln": "500.00"}]
-                
-                timestamp = sensor.native_value
-                assert timestamp is None
+            timestamp = sensor.native_value
+            assert timestamp is None
 
 
 class TestTodayMinPriceTimestampSensors:
@@ -414,11 +412,8 @@ class TestTimestampSensorErrorHandling:
         with patch.object(sensor, "get_today_data") as mock_today_data:
             mock_today_data.return_value = [{"rce_pln": "500.00"}]
             
-            with patch.object(sensor.calculator, "find_extreme_price_records") as mock_find:
-                mock_find.return_value = [{"rce_pln": "500.00"}]
-                
-                timestamp = sensor.native_value
-                assert timestamp is None
+            timestamp = sensor.native_value
+            assert timestamp is None
 
     def test_timestamp_sensors_empty_records_list(self, mock_coordinator):
         sensor = RCETodayMaxPriceHourStartTimestampSensor(mock_coordinator)
@@ -426,8 +421,5 @@ class TestTimestampSensorErrorHandling:
         with patch.object(sensor, "get_today_data") as mock_today_data:
             mock_today_data.return_value = [{"dtime": "2024-01-01 12:00:00", "rce_pln": "300.00"}]
             
-            with patch.object(sensor.calculator, "find_extreme_price_records") as mock_find:
-                mock_find.return_value = []
-                
-                timestamp = sensor.native_value
-                assert timestamp is None 
\ No newline at end of file
+            timestamp = sensor.native_value
+            assert timestamp is None 
\ No newline at end of file
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from custom_components.rce_prices.price_calculator import PriceCalculator, WindowQuery
+from custom_components.rce_prices.price_series import PriceSeries
+from custom_components.rce_prices.window_results import WindowResults
+
+
+def _series() -> PriceSeries:
+    start = datetime(2024, 1, 1, 6)
+    return PriceSeries.from_records([
+        {
+            "dtime": (start + timedelta(minutes=15 * (quarter + 1))).strftime("%Y-%m-%d %H:%M:%S"),
+            "rce_pln": str(100 + quarter),
+            "business_date": "2024-01-01",
+        }
+        for quarter in range(24)
+    ])
+
+
+class TestWindowResults:
+
+    def test_registered_queries_share_one_batch(self):
+        cheapest = WindowQuery.min_price_window(2)
+        best = WindowQuery(6, 12, 4, is_max=True)
+        results = WindowResults(_series(), {cheapest, best})
+
+        with patch.object(
+            PriceCalculator, "batch_windows", wraps=PriceCalculator.batch_windows
+        ) as mock_batch:
+            cheapest_windows = results.get("2024-01-01", cheapest)
+            best_windows = results.get("2024-01-01", best)
+
+        mock_batch.assert_called_once()
+        assert cheapest_windows[0][0]["dtime"] == "2024-01-01 06:15:00"
+        assert best_windows[0][-1]["dtime"] == "2024-01-01 12:00:00"
+
+    def test_unregistered_query_is_computed_on_demand(self):
+        results = WindowResults(_series(), set())
+        query = WindowQuery(6, 12, 2)
+
+        assert len(results.get("2024-01-01", query)) == 1
+        assert results.get("2024-01-02", query) == []